@@ -36,26 +36,58 @@ if sys.version_info.major == 3 and sys.version_info.minor == 8:
         exit(1)
 
 
-from . import component, data, device, ic, kuscia, ml, preprocessing, security, utils
-from .device import (
-    HEU,
-    PYU,
-    SPU,
-    TEEU,
-    Device,
-    DeviceObject,
-    HEUObject,
-    PYUObject,
-    SPUObject,
-    init,
-    proxy,
-    reveal,
-    shutdown,
-    to,
-    wait,
-)
+import importlib
+
 from .version import __version__  # type: ignore
 
+# Subpackages and device apis are imported on first attribute access, so that
+# `import secretflow` (or running a single component) does not load torch,
+# tensorflow and jax backed modules it never uses.
+_SUBPACKAGES = {
+    'component',
+    'data',
+    'device',
+    'ic',
+    'kuscia',
+    'ml',
+    'preprocessing',
+    'security',
+    'utils',
+}
+
+_DEVICE_ATTRS = {
+    'HEU',
+    'PYU',
+    'SPU',
+    'TEEU',
+    'Device',
+    'DeviceObject',
+    'HEUObject',
+    'PYUObject',
+    'SPUObject',
+    'init',
+    'proxy',
+    'reveal',
+    'shutdown',
+    'to',
+    'wait',
+}
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name in _DEVICE_ATTRS:
+        value = getattr(importlib.import_module(f'{__name__}.device'), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBPACKAGES | _DEVICE_ATTRS)
+
+
 __all__ = [
     'kuscia',
     'data',
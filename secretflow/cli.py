@@ -23,7 +23,6 @@ from contextlib import redirect_stderr, redirect_stdout
 import click
 from google.protobuf.json_format import MessageToJson
 
-from secretflow.component.entry import COMP_LIST, COMP_MAP, comp_eval
 from secretflow.spec.extend.cluster_pb2 import SFClusterConfig
 from secretflow.spec.v1.data_pb2 import StorageConfig
 from secretflow.spec.v1.evaluation_pb2 import NodeEvalParam
@@ -61,9 +60,13 @@ def component():
 @component.command()
 def ls():
     """List all components."""
+    # names are in the registry, listing them does not import any component.
+    from secretflow.component.entry import COMP_MAP
+
     click.echo("{:<40} {:<40} {:<20}".format("DOMAIN", "NAME", "VERSION"))
     click.echo("-" * 105)
-    for comp in COMP_LIST.comps:
+    comps = sorted(COMP_MAP.values(), key=lambda c: (c.domain, c.name, c.version))
+    for comp in comps:
         click.echo("{:<40} {:<40} {:<20}".format(comp.domain, comp.name, comp.version))
 
 
@@ -77,8 +80,11 @@ def ls():
 @click.argument("comp_id", required=False)
 def inspect(comp_id, all, file):
     """Display definition of components. The format of comp_id is {domain}/{name}:{version}"""
+    from secretflow.component.entry import COMP_MAP
 
     if all:
+        from secretflow.component.entry import COMP_LIST
+
         click.echo(f"You are inspecting the compelete comp list.")
         click.echo("-" * 105)
         if file:
@@ -204,6 +210,8 @@ def run(
             f.write(json.dumps(ret))
         sys.exit(-1)
 
+    from secretflow.component.entry import comp_eval
+
     try:
         if log_file:
             with open(log_file, "w") as f:
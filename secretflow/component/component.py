@@ -17,9 +17,8 @@ import json
 import logging
 import math
 import os
-import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, unique
 from typing import Dict, List, Type, Union
 
@@ -35,6 +34,7 @@ from secretflow.spec.extend.cluster_pb2 import SFClusterConfig
 from secretflow.spec.v1.component_pb2 import AttributeDef, AttrType, ComponentDef, IoDef
 from secretflow.spec.v1.data_pb2 import StorageConfig
 from secretflow.spec.v1.evaluation_pb2 import NodeEvalParam, NodeEvalResult
+from secretflow.utils.tracing import SpanTracer
 
 
 def clean_text(x: str, no_line_breaks: bool = True) -> str:
@@ -47,9 +47,16 @@ class CompDeclError(Exception): ...
 class CompEvalError(Exception): ...
 
 
-class CompTracer:
+class CompTracer(SpanTracer):
+    """Tracer of one component evaluation.
+
+    Besides io and running time of the component, it records nested spans of
+    device calls (spu compile and run, heu encrypt and decrypt, pyu tasks,
+    reveal and wait) and link bytes of spu devices.
+    """
+
     def __init__(self) -> None:
-        self.lock = threading.Lock()
+        super().__init__()
         self.io_time = 0
         self.run_time = 0
 
@@ -57,11 +64,14 @@ class CompTracer:
         class _CompTracer:
             def __init__(self, tracer: CompTracer) -> None:
                 self.tracer = tracer
+                self.span = tracer.span("io", "io")
 
             def __enter__(self):
                 self.start_time = time.time()
+                self.span.__enter__()
 
-            def __exit__(self, *_):
+            def __exit__(self, *exc):
+                self.span.__exit__(*exc)
                 io_time = time.time() - self.start_time
                 with self.tracer.lock:
                     self.tracer.io_time += io_time
@@ -72,19 +82,27 @@ class CompTracer:
         class _CompTracer:
             def __init__(self, tracer: CompTracer) -> None:
                 self.tracer = tracer
+                self.span = tracer.span("run", "run")
 
             def __enter__(self):
                 self.start_time = time.time()
+                self.span.__enter__()
 
-            def __exit__(self, *_):
+            def __exit__(self, *exc):
+                self.span.__exit__(*exc)
                 running_time = time.time() - self.start_time
                 with self.tracer.lock:
                     self.tracer.run_time += running_time
 
         return _CompTracer(self)
 
-    def report(self) -> Dict[str, float]:
-        return {"io_time": self.io_time, "run_time": self.run_time}
+    def report(self) -> Dict:
+        return {
+            "io_time": self.io_time,
+            "run_time": self.run_time,
+            **self.summary(),
+            "chrome_trace": self.chrome_trace(),
+        }
 
 
 @unique
@@ -108,7 +126,7 @@ class CompEvalContext:
     spu_configs: Dict = None
     initiator_party: str = None
     cluster_config: SFClusterConfig = None
-    tracer = CompTracer()
+    tracer: CompTracer = field(default_factory=CompTracer)
 
 
 class Component:
@@ -1083,8 +1101,16 @@ class Component:
 
         if cluster_config is not None:
             self._setup_sf_cluster(cluster_config)
+        # pulling device stats costs actor calls, only do it for a report.
+        ctx.tracer.device_stats = tracer_report
         try:
-            ret = self.__eval_callback(**kwargs)
+            with ctx.tracer.activate():
+                ret = self.__eval_callback(**kwargs)
+                if tracer_report:
+                    try:
+                        ctx.tracer.collect_device_stats()
+                    except Exception as e:
+                        logging.warning(f"failed to collect device stats: {e}")
         except Exception as e:
             logging.error(f"eval on {param} failed, error <{e}>")
             # TODO: use error_code in report
@@ -12,103 +12,243 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from secretflow.component.io.identity import identity
-from secretflow.component.io.io import io_read_data, io_write_data
-from secretflow.component.ml.boost.sgb.sgb import sgb_predict_comp, sgb_train_comp
-from secretflow.component.ml.boost.ss_xgb.ss_xgb import (
-    ss_xgb_predict_comp,
-    ss_xgb_train_comp,
-)
-from secretflow.component.ml.eval.biclassification_eval import (
-    biclassification_eval_comp,
-)
-from secretflow.component.ml.eval.prediction_bias_eval import prediction_bias_comp
-from secretflow.component.ml.eval.regression_eval import regression_eval_comp
-from secretflow.component.ml.eval.ss_pvalue import ss_pvalue_comp
-from secretflow.component.ml.linear.ss_glm import ss_glm_predict_comp, ss_glm_train_comp
-from secretflow.component.ml.linear.ss_sgd import ss_sgd_predict_comp, ss_sgd_train_comp
-from secretflow.component.ml.nn.sl.sl_predict import slnn_predict_comp
-from secretflow.component.ml.nn.sl.sl_train import slnn_train_comp
-from secretflow.component.model_export import model_export_comp
-from secretflow.component.preprocessing.binning.vert_binning import (
-    vert_bin_substitution_comp,
-    vert_binning_comp,
-)
-from secretflow.component.preprocessing.binning.vert_woe_binning import (
-    vert_woe_binning_comp,
-)
-from secretflow.component.preprocessing.data_prep.psi import psi_comp
-from secretflow.component.preprocessing.data_prep.train_test_split import (
-    train_test_split_comp,
-)
-from secretflow.component.preprocessing.filter.condition_filter import (
-    condition_filter_comp,
-)
-from secretflow.component.preprocessing.filter.feature_filter import feature_filter_comp
-from secretflow.component.preprocessing.unified_single_party_ops.binary_op import (
-    binary_op_comp,
-)
-from secretflow.component.preprocessing.unified_single_party_ops.case_when import (
-    case_when,
-)
-from secretflow.component.preprocessing.unified_single_party_ops.feature_calculate import (
-    feature_calculate,
-)
-from secretflow.component.preprocessing.unified_single_party_ops.fillna import fillna
-from secretflow.component.preprocessing.unified_single_party_ops.onehot_encode import (
-    onehot_encode,
-)
-from secretflow.component.preprocessing.unified_single_party_ops.substitution import (
-    substitution,
-)
-from secretflow.component.stats.groupby_statistics import groupby_statistics_comp
-from secretflow.component.stats.ss_pearsonr import ss_pearsonr_comp
-from secretflow.component.stats.ss_vif import ss_vif_comp
-from secretflow.component.stats.table_statistics import table_statistics_comp
+import importlib
+from typing import Dict
+
 from secretflow.spec.extend.cluster_pb2 import SFClusterConfig
 from secretflow.spec.v1.component_pb2 import CompListDef, ComponentDef
 from secretflow.spec.v1.data_pb2 import StorageConfig
 from secretflow.spec.v1.evaluation_pb2 import NodeEvalParam, NodeEvalResult
 from secretflow.version import build_message
 
-ALL_COMPONENTS = [
-    train_test_split_comp,
-    psi_comp,
-    ss_sgd_train_comp,
-    ss_sgd_predict_comp,
-    feature_filter_comp,
-    binary_op_comp,
-    vert_binning_comp,
-    vert_woe_binning_comp,
-    vert_bin_substitution_comp,
-    condition_filter_comp,
-    ss_vif_comp,
-    ss_pearsonr_comp,
-    ss_pvalue_comp,
-    table_statistics_comp,
-    groupby_statistics_comp,
-    biclassification_eval_comp,
-    regression_eval_comp,
-    prediction_bias_comp,
-    sgb_predict_comp,
-    sgb_train_comp,
-    ss_xgb_predict_comp,
-    ss_xgb_train_comp,
-    ss_glm_predict_comp,
-    ss_glm_train_comp,
-    slnn_train_comp,
-    slnn_predict_comp,
-    onehot_encode,
-    substitution,
-    case_when,
-    fillna,
-    io_read_data,
-    io_write_data,
-    feature_calculate,
-    identity,
-    model_export_comp,
+# (domain, name, version, module, attribute) of every first-party component.
+# Implementing modules pull in heavy ml dependencies, so they are only imported
+# when a component is evaluated or its definition is requested.
+COMPONENT_INDEX = [
+    (
+        "data_prep",
+        "train_test_split",
+        "0.0.1",
+        "secretflow.component.preprocessing.data_prep.train_test_split",
+        "train_test_split_comp",
+    ),
+    (
+        "data_prep",
+        "psi",
+        "0.0.2",
+        "secretflow.component.preprocessing.data_prep.psi",
+        "psi_comp",
+    ),
+    (
+        "ml.train",
+        "ss_sgd_train",
+        "0.0.1",
+        "secretflow.component.ml.linear.ss_sgd",
+        "ss_sgd_train_comp",
+    ),
+    (
+        "ml.predict",
+        "ss_sgd_predict",
+        "0.0.1",
+        "secretflow.component.ml.linear.ss_sgd",
+        "ss_sgd_predict_comp",
+    ),
+    (
+        "data_filter",
+        "feature_filter",
+        "0.0.1",
+        "secretflow.component.preprocessing.filter.feature_filter",
+        "feature_filter_comp",
+    ),
+    (
+        "preprocessing",
+        "binary_op",
+        "0.0.2",
+        "secretflow.component.preprocessing.unified_single_party_ops.binary_op",
+        "binary_op_comp",
+    ),
+    (
+        "feature",
+        "vert_binning",
+        "0.0.2",
+        "secretflow.component.preprocessing.binning.vert_binning",
+        "vert_binning_comp",
+    ),
+    (
+        "feature",
+        "vert_woe_binning",
+        "0.0.2",
+        "secretflow.component.preprocessing.binning.vert_woe_binning",
+        "vert_woe_binning_comp",
+    ),
+    (
+        "preprocessing",
+        "vert_bin_substitution",
+        "0.0.1",
+        "secretflow.component.preprocessing.binning.vert_binning",
+        "vert_bin_substitution_comp",
+    ),
+    (
+        "data_filter",
+        "condition_filter",
+        "0.0.1",
+        "secretflow.component.preprocessing.filter.condition_filter",
+        "condition_filter_comp",
+    ),
+    ("stats", "ss_vif", "0.0.1", "secretflow.component.stats.ss_vif", "ss_vif_comp"),
+    (
+        "stats",
+        "ss_pearsonr",
+        "0.0.1",
+        "secretflow.component.stats.ss_pearsonr",
+        "ss_pearsonr_comp",
+    ),
+    (
+        "ml.eval",
+        "ss_pvalue",
+        "0.0.1",
+        "secretflow.component.ml.eval.ss_pvalue",
+        "ss_pvalue_comp",
+    ),
+    (
+        "stats",
+        "table_statistics",
+        "0.0.2",
+        "secretflow.component.stats.table_statistics",
+        "table_statistics_comp",
+    ),
+    (
+        "stats",
+        "groupby_statistics",
+        "0.0.3",
+        "secretflow.component.stats.groupby_statistics",
+        "groupby_statistics_comp",
+    ),
+    (
+        "ml.eval",
+        "biclassification_eval",
+        "0.0.1",
+        "secretflow.component.ml.eval.biclassification_eval",
+        "biclassification_eval_comp",
+    ),
+    (
+        "ml.eval",
+        "regression_eval",
+        "0.0.1",
+        "secretflow.component.ml.eval.regression_eval",
+        "regression_eval_comp",
+    ),
+    (
+        "ml.eval",
+        "prediction_bias_eval",
+        "0.0.1",
+        "secretflow.component.ml.eval.prediction_bias_eval",
+        "prediction_bias_comp",
+    ),
+    (
+        "ml.predict",
+        "sgb_predict",
+        "0.0.2",
+        "secretflow.component.ml.boost.sgb.sgb",
+        "sgb_predict_comp",
+    ),
+    (
+        "ml.train",
+        "sgb_train",
+        "0.0.2",
+        "secretflow.component.ml.boost.sgb.sgb",
+        "sgb_train_comp",
+    ),
+    (
+        "ml.predict",
+        "ss_xgb_predict",
+        "0.0.1",
+        "secretflow.component.ml.boost.ss_xgb.ss_xgb",
+        "ss_xgb_predict_comp",
+    ),
+    (
+        "ml.train",
+        "ss_xgb_train",
+        "0.0.1",
+        "secretflow.component.ml.boost.ss_xgb.ss_xgb",
+        "ss_xgb_train_comp",
+    ),
+    (
+        "ml.predict",
+        "ss_glm_predict",
+        "0.0.1",
+        "secretflow.component.ml.linear.ss_glm",
+        "ss_glm_predict_comp",
+    ),
+    (
+        "ml.train",
+        "ss_glm_train",
+        "0.0.2",
+        "secretflow.component.ml.linear.ss_glm",
+        "ss_glm_train_comp",
+    ),
+    (
+        "ml.train",
+        "slnn_train",
+        "0.0.1",
+        "secretflow.component.ml.nn.sl.sl_train",
+        "slnn_train_comp",
+    ),
+    (
+        "ml.predict",
+        "slnn_predict",
+        "0.0.1",
+        "secretflow.component.ml.nn.sl.sl_predict",
+        "slnn_predict_comp",
+    ),
+    (
+        "preprocessing",
+        "onehot_encode",
+        "0.0.2",
+        "secretflow.component.preprocessing.unified_single_party_ops.onehot_encode",
+        "onehot_encode",
+    ),
+    (
+        "preprocessing",
+        "substitution",
+        "0.0.2",
+        "secretflow.component.preprocessing.unified_single_party_ops.substitution",
+        "substitution",
+    ),
+    (
+        "preprocessing",
+        "case_when",
+        "0.0.1",
+        "secretflow.component.preprocessing.unified_single_party_ops.case_when",
+        "case_when",
+    ),
+    (
+        "preprocessing",
+        "fillna",
+        "0.0.1",
+        "secretflow.component.preprocessing.unified_single_party_ops.fillna",
+        "fillna",
+    ),
+    ("io", "read_data", "0.0.1", "secretflow.component.io.io", "io_read_data"),
+    ("io", "write_data", "0.0.1", "secretflow.component.io.io", "io_write_data"),
+    (
+        "preprocessing",
+        "feature_calculate",
+        "0.0.1",
+        "secretflow.component.preprocessing.unified_single_party_ops.feature_calculate",
+        "feature_calculate",
+    ),
+    ("io", "identity", "0.0.1", "secretflow.component.io.identity", "identity"),
+    (
+        "model",
+        "model_export",
+        "0.0.1",
+        "secretflow.component.model_export.model_export",
+        "model_export_comp",
+    ),
 ]
 
+
 COMP_LIST_NAME = "secretflow"
 COMP_LIST_DESC = "First-party SecretFlow components."
 COMP_LIST_VERSION = "0.0.1"
@@ -118,24 +258,67 @@ def gen_key(domain: str, name: str, version: str) -> str:
     return f"{domain}/{name}:{version}"
 
 
+class LazyComponent:
+    """Placeholder of a registered component, the implementing module is
+    imported on first access to its definition or eval."""
+
+    def __init__(self, domain: str, name: str, version: str, module: str, attr: str):
+        self.domain = domain
+        self.name = name
+        self.version = version
+        self.module = module
+        self.attr = attr
+        self._comp = None
+
+    def load(self):
+        if self._comp is None:
+            comp = getattr(importlib.import_module(self.module), self.attr)
+            assert (comp.domain, comp.name, comp.version) == (
+                self.domain,
+                self.name,
+                self.version,
+            ), (
+                f"{self.module}.{self.attr} is registered as "
+                f"{gen_key(self.domain, self.name, self.version)}, but defines "
+                f"{gen_key(comp.domain, comp.name, comp.version)}"
+            )
+            self._comp = comp
+        return self._comp
+
+    def definition(self) -> ComponentDef:
+        return self.load().definition()
+
+    def eval(self, *args, **kwargs):
+        return self.load().eval(*args, **kwargs)
+
+
+COMP_MAP: Dict[str, LazyComponent] = {
+    gen_key(domain, name, version): LazyComponent(domain, name, version, module, attr)
+    for domain, name, version, module, attr in COMPONENT_INDEX
+}
+
+
 def generate_comp_list():
     comp_list = CompListDef()
     comp_list.name = COMP_LIST_NAME
     comp_list.desc = COMP_LIST_DESC
     comp_list.version = COMP_LIST_VERSION
-    comp_map = {}
-    all_comp_defs = []
-    for x in ALL_COMPONENTS:
-        x_def = x.definition()
-        comp_map[gen_key(x_def.domain, x_def.name, x_def.version)] = x
-        all_comp_defs.append(x_def)
-
+    all_comp_defs = [x.definition() for x in COMP_MAP.values()]
     all_comp_defs = sorted(all_comp_defs, key=lambda k: (k.domain, k.name, k.version))
     comp_list.comps.extend(all_comp_defs)
-    return comp_list, comp_map
+    return comp_list, COMP_MAP
 
 
-COMP_LIST, COMP_MAP = generate_comp_list()
+def __getattr__(name: str):
+    # building the full list imports every component, so it is deferred
+    # until someone asks for it.
+    if name == "COMP_LIST":
+        global COMP_LIST
+        COMP_LIST, _ = generate_comp_list()
+        return COMP_LIST
+    if name == "ALL_COMPONENTS":
+        return [x.load() for x in COMP_MAP.values()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_comp_def(domain: str, name: str, version: str) -> ComponentDef:
@@ -23,6 +23,8 @@ class AutoName(Enum):
 @unique
 class Envs(AutoName):
     ENABLE_NN = auto()
+    S3_PART_SIZE = auto()
+    S3_MAX_CONCURRENCY = auto()
 
 
 TRUE_STRINGS = ["true", "yes", "y", "enable", "enabled", "1"]
@@ -48,3 +50,7 @@ def get_env(name: Envs, default=None):
 
 def get_bool_env(name: Envs, default=False):
     return to_bool(get_env(name, default))
+
+
+def get_int_env(name: Envs, default: int = 0) -> int:
+    return int(get_env(name, default))
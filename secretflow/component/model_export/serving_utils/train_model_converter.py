@@ -757,6 +757,9 @@ def sgb_converter(
     assert set(party_features_length).issubset(set(input_schema))
     assert len(party_features_length) > 0
 
+    assert (
+        sgb_model.get_objective() != SgbRegType.Softmax
+    ), "serving export of multi class sgb model is not supported yet"
     if sgb_model.get_objective() == SgbRegType.Logistic:
         # refer to `SgbModel.predict`
         algo_func = SS_SGD_LINK_MAP[SigType.SR]
@@ -12,20 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+import hashlib
+import json
 import logging
 import os
 import platform
 import shutil
+import threading
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from io import BufferedIOBase
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
 
 import s3fs
 from botocore import exceptions as s3_exceptions
 
+from secretflow.component.env_utils import Envs, get_int_env
 from secretflow.spec.v1.data_pb2 import StorageConfig
 
+# objects larger than one part are transferred in parts concurrently.
+DEFAULT_S3_PART_SIZE = 64 * 1024 * 1024
+DEFAULT_S3_MAX_CONCURRENCY = 8
+# attempts of every part before the transfer fails and is left for resumption.
+S3_PART_RETRIES = 3
+
 
 class StorageImplBase:
     def __init__(self) -> None:
@@ -54,10 +66,97 @@ class StorageImplBase:
         pass
 
 
+def _part_ranges(size: int, part_size: int) -> List[Tuple[int, int]]:
+    return [(i, min(i + part_size, size)) for i in range(0, size, part_size)]
+
+
+def _multipart_etag(md5s: List[bytes]) -> str:
+    return f"{hashlib.md5(b''.join(md5s)).hexdigest()}-{len(md5s)}"
+
+
+def _file_md5s(local_fn: str, part_size: int) -> List[bytes]:
+    md5s = []
+    with open(local_fn, "rb") as f:
+        while True:
+            buf = f.read(part_size)
+            if not buf:
+                break
+            md5s.append(hashlib.md5(buf).digest())
+    return md5s
+
+
+def _file_md5(local_fn: str) -> str:
+    md5 = hashlib.md5()
+    with open(local_fn, "rb") as f:
+        for buf in iter(lambda: f.read(1024 * 1024), b""):
+            md5.update(buf)
+    return md5.hexdigest()
+
+
+class _TransferState:
+    """Progress of a multipart transfer saved next to the local file, so a
+    failed transfer can be resumed by calling download_file or upload_file
+    again with the same arguments."""
+
+    def __init__(self, path: str, key: Dict) -> None:
+        self.path = path
+        self.key = key
+        self.parts: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    saved = json.load(f)
+                if saved["key"] == key:
+                    self.parts = saved["parts"]
+            except (OSError, ValueError, KeyError):
+                logging.warning(f"ignore broken transfer state {path}")
+
+    def done(self, part: int, value: str) -> None:
+        with self._lock:
+            self.parts[str(part)] = value
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump({"key": self.key, "parts": self.parts}, f)
+            os.replace(tmp, self.path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
 class S3StorageImpl(StorageImplBase):
-    def __init__(self, config: StorageConfig) -> None:
+    def __init__(
+        self,
+        config: StorageConfig,
+        part_size: int = None,
+        max_concurrency: int = None,
+        verify_checksum: bool = True,
+    ) -> None:
+        """
+        Args:
+            config: storage config.
+            part_size: part size in bytes of multipart transfers, read from env
+                S3_PART_SIZE if not set.
+            max_concurrency: number of parts transferred concurrently, read from env
+                S3_MAX_CONCURRENCY if not set.
+            verify_checksum: send Content-MD5 of every uploaded part and check
+                downloaded files against object ETag when it is a md5 digest.
+        """
         super().__init__()
         assert config.type == "s3"
+        if part_size is None:
+            part_size = get_int_env(Envs.S3_PART_SIZE, DEFAULT_S3_PART_SIZE)
+        if max_concurrency is None:
+            max_concurrency = get_int_env(
+                Envs.S3_MAX_CONCURRENCY, DEFAULT_S3_MAX_CONCURRENCY
+            )
+        # s3 requires every part except the last one to be at least 5MB.
+        assert part_size >= 5 * 1024 * 1024, f"part_size {part_size} is under 5MB"
+        assert max_concurrency > 0, f"max_concurrency {max_concurrency} should > 0"
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._verify_checksum = verify_checksum
         config: StorageConfig.S3Config = config.s3
         self._prefix = config.prefix
         self._bucket = config.bucket
@@ -110,20 +209,206 @@ class S3StorageImpl(StorageImplBase):
     def _full_remote_fn(self, remote_fn):
         return f"s3://{os.path.join(self._bucket, self._prefix, remote_fn)}"
 
+    def _run_parts(self, fn, parts: List) -> None:
+        def with_retry(part):
+            for attempt in range(S3_PART_RETRIES):
+                try:
+                    return fn(part)
+                except Exception as e:
+                    if attempt + 1 == S3_PART_RETRIES:
+                        raise
+                    logging.warning(f"retry part {part[0]} after error: {e}")
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            # consume results to raise the first error.
+            list(executor.map(with_retry, parts))
+
+    def _verify_etag(
+        self, full_remote_fn, etag: str, local_fn: str, md5s: List[bytes]
+    ) -> None:
+        digest, _, part_count = etag.strip('"').partition("-")
+        if len(digest) != 32:
+            # not a md5 digest, e.g. objects encrypted by SSE-KMS.
+            return
+        if not part_count:
+            local = _file_md5(local_fn)
+        else:
+            # etag of a multipart object depends on the uploader's part size,
+            # which is the size of its first part.
+            bucket, key, _ = self._s3_client.split_path(full_remote_fn)
+            try:
+                resp = self._s3_client.call_s3(
+                    "head_object", Bucket=bucket, Key=key, PartNumber=1
+                )
+            except Exception as e:
+                logging.warning(f"skip checksum of {full_remote_fn}: {e}")
+                return
+            if resp["ContentLength"] != self._part_size:
+                md5s = _file_md5s(local_fn, resp["ContentLength"])
+            local = _multipart_etag(md5s)
+        if f"{digest}-{part_count}".rstrip("-") != local:
+            raise RuntimeError(
+                f"checksum mismatch of {full_remote_fn}, etag {etag}, local {local}"
+            )
+
+    def _download_parts(self, full_remote_fn, local_fn, meta: Dict) -> None:
+        size = meta["size"]
+        ranges = _part_ranges(size, self._part_size)
+        part_fn = local_fn + ".s3part"
+        state = _TransferState(
+            local_fn + ".s3part.json",
+            {
+                "remote": full_remote_fn,
+                "etag": meta["ETag"],
+                "size": size,
+                "part_size": self._part_size,
+            },
+        )
+        if not os.path.exists(part_fn) or os.path.getsize(part_fn) != size:
+            state.parts = {}
+            with open(part_fn, "wb") as f:
+                f.truncate(size)
+        md5s = [None] * len(ranges)
+        for i, md5 in state.parts.items():
+            md5s[int(i)] = bytes.fromhex(md5)
+
+        fd = os.open(part_fn, os.O_WRONLY)
+        try:
+
+            def download_part(part):
+                i, (start, end) = part
+                buf = self._s3_client.cat_file(full_remote_fn, start=start, end=end)
+                assert len(buf) == end - start, f"short read of part {i}"
+                os.pwrite(fd, buf, start)
+                md5s[i] = hashlib.md5(buf).digest()
+                state.done(i, md5s[i].hex())
+
+            todo = [(i, r) for i, r in enumerate(ranges) if md5s[i] is None]
+            self._run_parts(download_part, todo)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        if self._verify_checksum:
+            self._verify_etag(full_remote_fn, meta["ETag"], part_fn, md5s)
+        os.replace(part_fn, local_fn)
+        state.remove()
+
     def download_file(self, remote_fn, local_fn) -> None:
-        """blocked download whole file into local_fn, overwrite if local_fn exist"""
+        """blocked download whole file into local_fn, overwrite if local_fn exist
+
+        Objects larger than part_size are downloaded by concurrent ranged GETs,
+        a failed download is resumed from its finished parts on next call.
+        """
         full_remote_fn = self._full_remote_fn(remote_fn)
         try:
-            self._s3_client.download(full_remote_fn, local_fn)
+            meta = self._s3_client.info(full_remote_fn)
+            if meta["size"] <= self._part_size:
+                self._s3_client.download(full_remote_fn, local_fn)
+            else:
+                Path(local_fn).parent.mkdir(parents=True, exist_ok=True)
+                self._download_parts(full_remote_fn, local_fn, meta)
         except Exception as e:
             self._log_s3_error(e)
             raise
 
+    def _upload_parts(self, full_remote_fn, local_fn) -> None:
+        bucket, key, _ = self._s3_client.split_path(full_remote_fn)
+        stat = os.stat(local_fn)
+        ranges = _part_ranges(stat.st_size, self._part_size)
+        state = _TransferState(
+            local_fn + ".s3upload.json",
+            {
+                "remote": full_remote_fn,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+                "part_size": self._part_size,
+            },
+        )
+        upload_id = state.parts.get("upload_id")
+        etags = {}
+        if upload_id is not None:
+            try:
+                resp = self._s3_client.call_s3(
+                    "list_parts", Bucket=bucket, Key=key, UploadId=upload_id
+                )
+                etags = {p["PartNumber"]: p["ETag"] for p in resp.get("Parts", [])}
+            except Exception as e:
+                logging.warning(f"restart upload {upload_id}, can not resume: {e}")
+                upload_id = None
+        if upload_id is None:
+            state.parts = {}
+            resp = self._s3_client.call_s3(
+                "create_multipart_upload", Bucket=bucket, Key=key
+            )
+            upload_id = resp["UploadId"]
+            state.done("upload_id", upload_id)
+
+        fd = os.open(local_fn, os.O_RDONLY)
+        try:
+
+            def upload_part(part):
+                i, (start, end) = part
+                buf = os.pread(fd, end - start, start)
+                md5 = hashlib.md5(buf).digest()
+                kwargs = {}
+                if self._verify_checksum:
+                    kwargs["ContentMD5"] = base64.b64encode(md5).decode()
+                resp = self._s3_client.call_s3(
+                    "upload_part",
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=i + 1,
+                    Body=buf,
+                    **kwargs,
+                )
+                etags[i + 1] = resp["ETag"]
+
+            # a resumed part is trusted only if the server has its data.
+            todo = [
+                (i, r)
+                for i, r in enumerate(ranges)
+                if i + 1 not in etags or state.parts.get(str(i + 1)) != etags[i + 1]
+            ]
+            for i, _ in todo:
+                etags.pop(i + 1, None)
+
+            def upload_and_save(part):
+                upload_part(part)
+                state.done(part[0] + 1, etags[part[0] + 1])
+
+            self._run_parts(upload_and_save, todo)
+        finally:
+            os.close(fd)
+
+        self._s3_client.call_s3(
+            "complete_multipart_upload",
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": i + 1, "ETag": etags[i + 1]}
+                    for i in range(len(ranges))
+                ]
+            },
+        )
+        self._s3_client.invalidate_cache(full_remote_fn)
+        state.remove()
+
     def upload_file(self, remote_fn, local_fn) -> None:
-        """blocked upload whole file into remote_fn, overwrite if remote_fn exist"""
+        """blocked upload whole file into remote_fn, overwrite if remote_fn exist
+
+        Files larger than part_size are uploaded as concurrent multipart uploads,
+        a failed upload is resumed from its finished parts on next call.
+        """
         full_remote_fn = self._full_remote_fn(remote_fn)
         try:
-            self._s3_client.upload(local_fn, full_remote_fn)
+            if os.path.getsize(local_fn) <= self._part_size:
+                self._s3_client.upload(local_fn, full_remote_fn)
+            else:
+                self._upload_parts(full_remote_fn, local_fn)
         except Exception as e:
             self._log_s3_error(e)
             raise
@@ -131,7 +416,9 @@ class S3StorageImpl(StorageImplBase):
     def get_reader(self, remote_fn) -> BufferedIOBase:
         full_remote_fn = self._full_remote_fn(remote_fn)
         try:
-            return self._s3_client.open(full_remote_fn, "rb")
+            return self._s3_client.open(
+                full_remote_fn, "rb", block_size=self._part_size
+            )
         except Exception as e:
             self._log_s3_error(e)
             raise
@@ -139,7 +426,9 @@ class S3StorageImpl(StorageImplBase):
     def get_writer(self, remote_fn) -> BufferedIOBase:
         full_remote_fn = self._full_remote_fn(remote_fn)
         try:
-            return self._s3_client.open(full_remote_fn, "wb")
+            return self._s3_client.open(
+                full_remote_fn, "wb", block_size=self._part_size
+            )
         except Exception as e:
             self._log_s3_error(e)
             raise
@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Union
+from typing import Dict, List, Union
 
 import jax.numpy as jnp
 import numpy as np
@@ -217,6 +217,100 @@ class DataFrameGroupBy:
             values = np.repeat(reshaped_column, target_col_num, axis=1)
         return self.to_df(values, target_col_names, cast_type=np.int32)
 
+    def agg(self, func: Dict[str, Union[str, List[str]]]) -> pd.DataFrame:
+        """Apply several aggregation functions to several columns at once.
+
+        All aggregations share one secret random order, run in one spu program
+        together with the key shuffle, and are revealed together.
+
+        Args:
+            func (Dict[str, Union[str, List[str]]]): map from column name to
+                aggregation name(s), chosen from sum, mean, var, max, min and count.
+
+        Returns:
+            pd.DataFrame: indexed by group keys, with (column, agg) MultiIndex columns.
+        """
+        value_agg_pairs = []
+        for col_name, aggs in func.items():
+            assert (
+                col_name in self.target_columns_names
+            ), f"{col_name} not in {self.target_columns_names}"
+            if isinstance(aggs, str):
+                aggs = [aggs]
+            for agg in aggs:
+                if agg != 'count':
+                    # fail fast before any spu work
+                    get_agg_fun(agg)
+                if (col_name, agg) not in value_agg_pairs:
+                    value_agg_pairs.append((col_name, agg))
+        assert len(value_agg_pairs) > 0, "no aggregation requested"
+
+        # group columns by agg, so each agg function runs once on a matrix
+        agg_col_names = {}
+        for col_name, agg in value_agg_pairs:
+            if agg == 'count':
+                continue
+            col_names = agg_col_names.setdefault(agg, [])
+            if col_name not in col_names:
+                col_names.append(col_name)
+        agg_cols = {
+            agg: [
+                self.target_columns_sorted[self.target_columns_names.index(col_name)]
+                for col_name in col_names
+            ]
+            for agg, col_names in agg_col_names.items()
+        }
+        aggs = list(agg_cols.keys())
+
+        def fused_agg(agg_cols, key_cols, segment_end_marks, segment_ids, order):
+            agg_results = [
+                get_agg_fun(agg)(agg_cols[agg], segment_end_marks, segment_ids, order)
+                for agg in aggs
+            ]
+            keys = shuffle_cols(key_cols, segment_end_marks, order)
+            return agg_results, keys
+
+        secret_order = self.gen_secret_random_order()
+        fused_result = self.spu(fused_agg)(
+            agg_cols,
+            self.key_columns_sorted,
+            self.seg_end_marks,
+            self.segment_ids,
+            secret_order,
+        )
+        need_count = any(agg == 'count' for _, agg in value_agg_pairs)
+        if need_count:
+            (agg_results, keys), segment_ids = reveal([fused_result, self.segment_ids])
+            counts = groupby_count_cleartext(segment_ids).astype(np.int32)
+        else:
+            agg_results, keys = reveal(fused_result)
+
+        by_keys = view_key_postprocessing(keys, self.num_groups)
+        assert by_keys.shape[1] == len(
+            self.key_col_names
+        ), f"by key data {by_keys}, key names {self.key_col_names}"
+        agg_values = {}
+        for agg, agg_result in zip(aggs, agg_results):
+            values = groupby_agg_postprocess(
+                agg_result[0], agg_result[1], agg_result[2], self.num_groups
+            ).reshape((self.num_groups, -1))
+            for i, col_name in enumerate(agg_col_names[agg]):
+                agg_values[(col_name, agg)] = values[:, i]
+
+        if self.num_key_cols == 1:
+            index = pd.Index(by_keys.reshape((-1)), name=self.key_col_names[0])
+        else:
+            index = pd.MultiIndex.from_arrays(
+                matrix_to_cols(by_keys), names=self.key_col_names
+            )
+        data = {
+            pair: counts if pair[1] == 'count' else agg_values[pair]
+            for pair in value_agg_pairs
+        }
+        df = pd.DataFrame(data, index=index)
+        df.columns = pd.MultiIndex.from_tuples(value_agg_pairs)
+        return df
+
     def to_df(self, values, target_col_names, cast_type=None):
         if isinstance(target_col_names, tuple):
             target_col_names = list(target_col_names)
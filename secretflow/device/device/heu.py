@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from functools import reduce
 from pathlib import Path
-from typing import List, Union
+from typing import List, Sequence, Union
 
 import cloudpickle as pickle
 import jax.tree_util
@@ -26,8 +27,11 @@ from heu import numpy as hnp, phe
 
 import secretflow.distributed as sfd
 from secretflow.utils.errors import PartyNotFoundError
+from secretflow.utils.tracing import trace_span
 
 from .base import Device, DeviceType
+from .heu_object import HEUObject
+from .pyu import PYU, PYUObject
 from .spu import SPU_PROTOCOLS_MAP, SPUIOInfo, SPUValueMeta
 from .type_traits import (
     heu_datatype_to_numpy,
@@ -378,6 +382,38 @@ class HEUSkKeeper(HEUActor):
         """
         return self.decode(self.decrypt(data), edr)
 
+    def batch_decrypt_and_decode(
+        self,
+        *data: hnp.CiphertextArray,
+        edr=None,
+        shared_rows: Sequence[int] = None,
+        num_threads: int = None,
+    ) -> List[np.ndarray]:
+        """Decrypt several 2-D ciphertext arrays in one call, concurrently.
+
+        Args:
+            data: ciphertext arrays.
+            edr: encoder
+            shared_rows: indices of rows known to hold the same values in each
+                array, e.g. the per feature endpoints of cumulative bucket sums.
+                Only the last one of them is decrypted and copied to the others.
+            num_threads: max number of arrays decrypted at the same time.
+        """
+        skipped = set(shared_rows[:-1]) if shared_rows else set()
+
+        def _decrypt(arr):
+            if not skipped:
+                return self.decrypt_and_decode(arr, edr)
+            keep = [r for r in range(arr.rows) if r not in skipped]
+            decoded = self.decrypt_and_decode(arr[keep], edr)
+            result = np.empty((arr.rows,) + decoded.shape[1:], dtype=decoded.dtype)
+            result[keep] = decoded
+            result[list(shared_rows[:-1])] = result[shared_rows[-1]]
+            return result
+
+        with ThreadPoolExecutor(max_workers=num_threads) as pool:
+            return list(pool.map(_decrypt, data))
+
     def h2a_decrypt_make_share(
         self, data_with_mask: hnp.CiphertextArray, spu_field_type
     ):
@@ -688,6 +724,50 @@ class HEU(Device):
     def __call__(self, fn, *, num_returns=None, static_argnames=None):
         raise NotImplementedError("Heu function call is not implemented")
 
+    def batch_decrypt(
+        self,
+        objs: List[HEUObject],
+        pyu: PYU,
+        config: HEUMoveConfig = None,
+        shared_rows: Union[PYUObject, Sequence[int]] = None,
+    ) -> PYUObject:
+        """Move ciphertext objects to the sk keeper's PYU with a single decryption.
+
+        Unlike calling `to(pyu)` on each object, which decrypts them one remote
+        call after another, all objects are decrypted by one call of the sk
+        keeper.
+
+        Args:
+            objs: ciphertext HEUObjects of this device.
+            pyu: the PYU of the sk keeper.
+            config: move config, heu_dest_party is ignored.
+            shared_rows: see `HEUSkKeeper.batch_decrypt_and_decode`, a PYUObject
+                must be on the sk keeper's PYU.
+
+        Returns:
+            a PYUObject of the list of cleartext arrays.
+        """
+        assert (
+            pyu.party == self.sk_keeper_name()
+        ), f'Can not convert to PYU device {pyu.party} without secret key'
+        config = HEUMoveConfig() if config is None else config
+        move_config = replace(config, heu_dest_party=pyu.party)
+        refs = []
+        for obj in objs:
+            assert obj.device is self, f'Object of {obj.device} is not on this heu.'
+            assert not obj.is_plain, f'Only ciphertext can be decrypted.'
+            if obj.location != pyu.party:
+                obj = obj.to(self, move_config)
+            refs.append(obj.data)
+        if isinstance(shared_rows, PYUObject):
+            assert shared_rows.device == pyu, f'shared_rows must be on {pyu}.'
+            shared_rows = shared_rows.data
+        with trace_span('batch_decrypt', 'heu_decrypt', device=pyu, num=len(refs)):
+            cleartext = self.sk_keeper.batch_decrypt_and_decode.remote(
+                *refs, edr=config.heu_encoder, shared_rows=shared_rows
+            )
+        return PYUObject(pyu, cleartext)
+
 
 def heu_from_base_config(
     base_heu_config: dict, new_sk_keeper: str, new_evaluators: List[str]
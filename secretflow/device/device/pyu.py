@@ -21,6 +21,7 @@ import ray
 
 import secretflow.distributed as sfd
 from secretflow.utils.logging import LOG_FORMAT, get_logging_level
+from secretflow.utils.tracing import trace_span
 
 from ._utils import check_num_returns
 from .base import Device, DeviceObject, DeviceType
@@ -96,12 +97,13 @@ class PYU(Device):
             )
 
             _num_returns = check_num_returns(fn) if num_returns is None else num_returns
-            data = (
-                sfd.remote(self._run)
-                .party(self.party)
-                .options(num_returns=_num_returns)
-                .remote(fn, *args_, **kwargs_)
-            )
+            with trace_span(getattr(fn, '__name__', 'fn'), 'pyu', device=self):
+                data = (
+                    sfd.remote(self._run)
+                    .party(self.party)
+                    .options(num_returns=_num_returns)
+                    .remote(fn, *args_, **kwargs_)
+                )
             logging.debug(
                 (
                     f'PYU remote function: {fn}, num_returns={num_returns}, '
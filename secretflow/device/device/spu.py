@@ -21,8 +21,10 @@ import struct
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum, unique
 from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Union
@@ -46,6 +48,7 @@ import secretflow.distributed as sfd
 from secretflow.utils.errors import InvalidArgumentError
 from secretflow.utils.ndarray_bigint import BigintNdArray
 from secretflow.utils.progress import ProgressData
+from secretflow.utils.tracing import trace_span, watch_device
 
 from .base import Device, DeviceObject, DeviceType
 from .pyu import PYUObject
@@ -191,14 +194,13 @@ class SPUObject(DeviceObject):
     def __del__(self):
         if hasattr(self, "shares_name"):
             assert len(self.shares_name) == len(self.device.actors)
-            for i, actor in enumerate(self.device.actors.values()):
-                try:
-                    actor.del_share.remote(self.shares_name[i])
-                except TypeError:
-                    # Python doesn't make any guarantees about when __del__ is called,
-                    # actor may not exist, been GCed before this function called.
-                    # This may happened when Host(Driver) progress exit.
-                    pass
+            try:
+                self.device.del_shares(self.shares_name)
+            except TypeError:
+                # Python doesn't make any guarantees about when __del__ is called,
+                # actor may not exist, been GCed before this function called.
+                # This may happened when Host(Driver) progress exit.
+                pass
 
 
 class SPUIO:
@@ -442,6 +444,19 @@ class SPURuntime:
             assert isinstance(name, str)
             self.runtime.del_var(name)
 
+    def del_shares(self, *vals: Any):
+        for val in vals:
+            self.del_share(val)
+
+    def get_link_stats(self) -> Dict[str, int]:
+        stats = self.link.get_stats()
+        return {
+            'sent_bytes': stats.sent_bytes,
+            'sent_actions': stats.sent_actions,
+            'recv_bytes': stats.recv_bytes,
+            'recv_actions': stats.recv_actions,
+        }
+
     def dump(self, meta: Any, val: Any, path: Union[str, Callable]):
         flatten_names, _ = jax.tree_util.tree_flatten(val)
         shares = []
@@ -1438,6 +1453,11 @@ def _spu_compile(fn, copts, *meta_args, **meta_kwargs):
     return executable, output_tree
 
 
+def _link_stats(name: str, actors: Dict) -> Dict[str, Dict[str, int]]:
+    stats = sfd.get([actor.get_link_stats.remote() for actor in actors.values()])
+    return {f"{name}/{party}": s for party, s in zip(actors, stats)}
+
+
 class SPU(Device):
     def __init__(
         self,
@@ -1445,6 +1465,7 @@ class SPU(Device):
         link_desc: Dict = None,
         log_options: spu_logging.LogOptions = spu_logging.LogOptions(),
         id: str = None,
+        share_del_batch_size: int = 64,
     ):
         """SPU device constructor.
 
@@ -1529,6 +1550,10 @@ class SPU(Device):
 
                     8. brpc_channel_connection_type refer to `https://github.com/apache/brpc/blob/master/docs/en/client.md#connection-type`
             log_options: Optional. Options of spu logging.
+            share_del_batch_size: Optional. Shares of garbage collected SPUObjects
+                are queued and deleted in one actor call per party once this many
+                objects are pending, or when SPUObjects of this device are
+                revealed. 1 deletes every object immediately.
         """
         super().__init__(DeviceType.SPU)
         self.cluster_def = cluster_def
@@ -1543,7 +1568,13 @@ class SPU(Device):
         self._task_id = -1
         self.io = SPUIO(self.conf, self.world_size)
         self.id = id
+        self.share_del_batch_size = max(share_del_batch_size, 1)
+        # __del__ may run in any thread, deque appends are atomic and the lock
+        # keeps each batch sent to all actors before the next one.
+        self._pending_dels = deque()
+        self._dels_lock = threading.Lock()
         self.init()
+        watch_device(self)
 
     def init(self):
         """Init SPU runtime in each party"""
@@ -1567,9 +1598,48 @@ class SPU(Device):
         self.init()
 
     def shutdown(self):
+        with self._dels_lock:
+            self._pending_dels.clear()
         for actor in self.actors.values():
             sfd.kill(actor)
 
+    def trace_name(self) -> str:
+        return f"SPU({','.join(self.actors)})"
+
+    def trace_stats_collector(self) -> Callable[[], Dict[str, Dict[str, int]]]:
+        """Callable returning link statistics of every party, used by tracer.
+        It holds actors only, so it can be called when spu is finalized."""
+        return functools.partial(_link_stats, self.trace_name(), self.actors)
+
+    def del_shares(self, shares_name: Sequence[Union[ray.ObjectRef, fed.FedObject]]):
+        """Queue shares of a released SPUObject for deletion.
+
+        The queue is shared by all parties and flushed in the same order to every
+        actor, so each runtime deletes the same vars. Flushes only happen on
+        the queue size and on reveal, which are the same in the driver of every
+        party, so parties issue the same sequence of actor calls.
+        """
+        self._pending_dels.append(shares_name)
+        if len(self._pending_dels) >= self.share_del_batch_size:
+            # __del__ may run while this thread is flushing, the pending
+            # shares are left to the next flush then.
+            self.flush_dels(blocking=False)
+
+    def flush_dels(self, blocking: bool = True):
+        """Delete all queued shares with one actor call per party."""
+        if not self._dels_lock.acquire(blocking=blocking):
+            return
+        try:
+            pending = []
+            while self._pending_dels:
+                pending.append(self._pending_dels.popleft())
+            if not pending:
+                return
+            for i, actor in enumerate(self.actors.values()):
+                actor.del_shares.remote(*[shares_name[i] for shares_name in pending])
+        finally:
+            self._dels_lock.release()
+
     def _place_arguments(self, *args, **kwargs):
         def place(obj):
             if isinstance(obj, DeviceObject):
@@ -1628,12 +1698,14 @@ class SPU(Device):
 
             # it's ok to choose any party to compile,
             # here we choose party 0.
-            executable, out_shape = (
-                sfd.remote(_spu_compile)
-                .party(self.cluster_def['nodes'][0]['party'])
-                .options(num_returns=2)
-                .remote(fn, copts, *meta_args, **meta_kwargs)
-            )
+            fn_name = getattr(func, '__name__', 'fn')
+            with trace_span(fn_name, 'spu_compile', device=self.trace_name()):
+                executable, out_shape = (
+                    sfd.remote(_spu_compile)
+                    .party(self.cluster_def['nodes'][0]['party'])
+                    .options(num_returns=2)
+                    .remote(fn, copts, *meta_args, **meta_kwargs)
+                )
 
             if num_returns_policy == SPUCompilerNumReturnsPolicy.FROM_COMPILER:
                 # Since user choose to use num of returns from compiler result,
@@ -1649,18 +1721,19 @@ class SPU(Device):
 
             # run executable and get returns.
             outputs = [None] * self.world_size
-            for i, actor in enumerate(self.actors.values()):
-                (actor_args, actor_kwargs) = jax.tree_util.tree_map(
-                    lambda x: x.shares_name[i], (args, kwargs)
-                )
+            with trace_span(fn_name, 'spu_run', device=self.trace_name()):
+                for i, actor in enumerate(self.actors.values()):
+                    (actor_args, actor_kwargs) = jax.tree_util.tree_map(
+                        lambda x: x.shares_name[i], (args, kwargs)
+                    )
 
-                val, _ = jax.tree_util.tree_flatten((actor_args, actor_kwargs))
+                    val, _ = jax.tree_util.tree_flatten((actor_args, actor_kwargs))
 
-                actor_out = actor.run.options(num_returns=2 * num_returns).remote(
-                    num_returns_policy, out_shape, executable, *val
-                )
+                    actor_out = actor.run.options(num_returns=2 * num_returns).remote(
+                        num_returns_policy, out_shape, executable, *val
+                    )
 
-                outputs[i] = actor_out
+                    outputs[i] = actor_out
 
             if num_returns_policy == SPUCompilerNumReturnsPolicy.SINGLE:
                 return SPUObject(self, outputs[0][0], [output[1] for output in outputs])
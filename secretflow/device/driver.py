@@ -29,6 +29,7 @@ from secretflow.distributed.primitive import DISTRIBUTION_MODE
 from secretflow.utils.errors import InvalidArgumentError
 from secretflow.utils.logging import set_logging_level
 from secretflow.utils.ray_compatibility import ray_version_less_than_2_0_0
+from secretflow.utils.tracing import trace_span
 
 from .device import (
     HEU,
@@ -137,6 +138,15 @@ def reveal(func_or_object, heu_encoder=None):
     all_spu_chunks_count = []
     spu_chunks_idx = 0
 
+    # reveal is a sync point of all parties, pending share deletions of spu
+    # devices are flushed here besides on queue size.
+    spu_devices = []
+    for x in flatten_val:
+        if isinstance(x, SPUObject) and x.device not in spu_devices:
+            spu_devices.append(x.device)
+    for device in spu_devices:
+        device.flush_dels()
+
     for x in flatten_val:
         if isinstance(x, PYUObject):
             all_object_refs.append(x.data)
@@ -159,7 +169,8 @@ def reveal(func_or_object, heu_encoder=None):
             logging.debug(f'Getting teeu data from TEEU {x.device.party}.')
 
     cur_idx = 0
-    all_object = sfd.get(all_object_refs)
+    with trace_span('reveal', 'sync', num=len(all_object_refs)):
+        all_object = sfd.get(all_object_refs)
 
     new_flatten_val = []
     for x in flatten_val:
@@ -210,7 +221,8 @@ def wait(objects: Any):
         if isinstance(x, (PYUObject, SPUObject, TEEUObject))
     ]
 
-    reveal([o.device(lambda o: None)(o) for o in objs])
+    with trace_span('wait', 'sync', num=len(objs)):
+        reveal([o.device(lambda o: None)(o) for o in objs])
 
 
 def init(
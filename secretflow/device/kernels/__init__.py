@@ -13,4 +13,4 @@
 # limitations under the License.
 
 from . import heu, pyu, spu
-from .spu import psi_df
+from .spu import psi_df, spu_to_pyu_blocks, spu_to_pyu_file
@@ -28,6 +28,7 @@ from secretflow.device import (
 )
 from secretflow.device.device.base import register_to
 from secretflow.device.device.heu import HEUMoveConfig
+from secretflow.utils.tracing import trace_span
 
 
 @register_to(DeviceType.HEU, DeviceType.HEU)
@@ -65,9 +66,10 @@ def heu_to_pyu(self: HEUObject, pyu: PYU, config: HEUMoveConfig = None):
     ), f'Can not convert to PYU device {pyu.party} without secret key'
 
     # HEU -> PYU: Decrypt
-    cleartext = self.device.sk_keeper.decrypt_and_decode.remote(
-        self.data, config.heu_encoder
-    )
+    with trace_span('heu_to_pyu', 'heu_decrypt', device=pyu):
+        cleartext = self.device.sk_keeper.decrypt_and_decode.remote(
+            self.data, config.heu_encoder
+        )
     return PYUObject(pyu, cleartext)
 
 
@@ -37,6 +37,7 @@ from secretflow.device import (
 )
 from secretflow.device.device.base import register_to
 from secretflow.device.device.heu import HEUMoveConfig
+from secretflow.utils.tracing import trace_span
 
 
 @register_to(DeviceType.PYU, DeviceType.PYU)
@@ -98,10 +99,11 @@ def pyu_to_heu(self: PYUObject, heu: HEU, config: HEUMoveConfig = None):
     if config.heu_dest_party == 'auto':
         config.heu_dest_party = list(heu.evaluator_names())[0]
 
-    data = heu.get_participant(self.device.party).encode.remote(
-        self.data, config.heu_encoder
-    )
-    return HEUObject(heu, data, self.device.party, True).to(heu, config)
+    with trace_span('pyu_to_heu', 'heu_encrypt', device=self.device):
+        data = heu.get_participant(self.device.party).encode.remote(
+            self.data, config.heu_encoder
+        )
+        return HEUObject(heu, data, self.device.party, True).to(heu, config)
 
 
 @register_to(DeviceType.PYU, DeviceType.TEEU)
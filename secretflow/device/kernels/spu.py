@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Dict, List, Union
+import os
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Union
+
+import jax
+import numpy as np
 
 import secretflow.distributed as sfd
 from secretflow.device import (
@@ -25,6 +30,7 @@ from secretflow.device import (
     HEUObject,
     PYUObject,
     SPUObject,
+    SPUValueMeta,
     register,
 )
 from secretflow.device.device.base import register_to
@@ -50,6 +56,130 @@ def spu_to_pyu(self: SPUObject, pyu: Device, config: HEUMoveConfig = None):
     )
 
 
+def _slice_rows(x, start, size):
+    return jax.lax.dynamic_slice_in_dim(x, start, size, axis=0)
+
+
+def spu_row_blocks(obj: SPUObject, block_rows: int) -> Iterator[SPUObject]:
+    """Split an SPUObject of a single array into row blocks.
+
+    Slicing runs inside SPU and is local to each party.
+    Blocks are generated lazily, the last block may have fewer rows.
+
+    Args:
+        obj (SPUObject): an SPUObject of a single array with at least one dim.
+        block_rows (int): max rows of each block.
+    """
+    assert block_rows > 0, f'block_rows should be positive, got {block_rows}'
+    meta = sfd.get(obj.meta)
+    assert isinstance(
+        meta, SPUValueMeta
+    ), f'Only SPUObject of a single array could be split, got meta {meta}.'
+    assert len(meta.shape) > 0, 'Can not split a scalar into row blocks.'
+    rows = meta.shape[0]
+    for start in range(0, rows, block_rows):
+        size = min(block_rows, rows - start)
+        yield obj.device(_slice_rows, static_argnames='size')(obj, start, size=size)
+
+
+def spu_to_pyu_blocks(
+    obj: SPUObject, pyu: PYU, block_rows: int, max_inflight: int = 2
+) -> Iterator[PYUObject]:
+    """Reveal an SPUObject to pyu block by block.
+
+    At most max_inflight blocks are being transferred and reconstructed
+    while the caller consumes the current block, so the receiver never holds
+    the full shares of obj and transfer overlaps with consumption.
+
+    Example:
+        for block in spu_to_pyu_blocks(pred, alice, 1 << 20):
+            alice(process)(block)
+
+    Args:
+        obj (SPUObject): an SPUObject of a single array.
+        pyu (PYU): receiver.
+        block_rows (int): max rows of each block.
+        max_inflight (int): max number of blocks launched but not yet yielded.
+
+    Yields:
+        PYUObject: numpy array of each row block at pyu, in order.
+    """
+    assert isinstance(pyu, PYU), f'Expect a PYU but got {type(pyu)}.'
+    assert max_inflight > 0, f'max_inflight should be positive, got {max_inflight}'
+    inflight = deque()
+    for block in spu_row_blocks(obj, block_rows):
+        inflight.append(block.to(pyu))
+        if len(inflight) >= max_inflight:
+            yield inflight.popleft()
+    while inflight:
+        yield inflight.popleft()
+
+
+def _init_block_file(path: str, file_format: str, shape, dtype) -> int:
+    dir_name = os.path.dirname(path)
+    if dir_name:
+        os.makedirs(dir_name, exist_ok=True)
+    if file_format == 'npy':
+        np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=tuple(shape))
+    else:
+        open(path, 'w').close()
+    return 0
+
+
+def _write_block_file(offset: int, block, path: str, file_format: str) -> int:
+    block = np.asarray(block)
+    if file_format == 'npy':
+        arr = np.lib.format.open_memmap(path, mode='r+')
+        arr[offset : offset + block.shape[0]] = block
+        arr.flush()
+        del arr
+    else:
+        with open(path, 'ab') as f:
+            np.savetxt(f, block.reshape(block.shape[0], -1), delimiter=',')
+    return offset + block.shape[0]
+
+
+def spu_to_pyu_file(
+    obj: SPUObject,
+    pyu: PYU,
+    path: str,
+    block_rows: int,
+    file_format: str = 'npy',
+    max_inflight: int = 2,
+) -> PYUObject:
+    """Reveal an SPUObject to pyu and write it to path block by block.
+
+    Only max_inflight blocks are held by pyu at the same time,
+    the whole value is never reconstructed in memory.
+
+    Args:
+        obj (SPUObject): an SPUObject of a single array.
+        pyu (PYU): receiver, path is a local path of this party.
+        path (str): output file.
+        block_rows (int): max rows of each block.
+        file_format (str): 'npy' writes into a preallocated npy file in place,
+            'csv' appends rows as comma separated values.
+        max_inflight (int): max number of blocks being transferred or written.
+
+    Returns:
+        PYUObject: number of rows written.
+    """
+    assert file_format in ('npy', 'csv'), f'Unsupported file format {file_format}.'
+    meta = sfd.get(obj.meta)
+    assert isinstance(
+        meta, SPUValueMeta
+    ), f'Only SPUObject of a single array could be written, got meta {meta}.'
+    offset = pyu(_init_block_file)(path, file_format, meta.shape, meta.dtype)
+    pending = deque()
+    for block in spu_to_pyu_blocks(obj, pyu, block_rows, max_inflight):
+        # chain on offset so blocks are written in order.
+        offset = pyu(_write_block_file)(offset, block, path, file_format)
+        pending.append(offset)
+        if len(pending) >= max_inflight:
+            sfd.get(pending.popleft().data)
+    return offset
+
+
 # WARNING: you may need to wait spu to spu for following applications
 @register_to(DeviceType.SPU, DeviceType.SPU)
 def spu_to_spu(self: SPUObject, spu: SPU):
@@ -13,11 +13,16 @@
 # limitations under the License.
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import spu.libspu.link as link
 
-from secretflow.ic.proxy.serializer import deserialize, serialize
+from secretflow.ic.proxy.serializer import (
+    deserialize,
+    deserialize_frames,
+    serialize,
+    serialize_frames,
+)
 
 
 class LinkProxy:
@@ -26,16 +31,29 @@ class LinkProxy:
 
     _link = None
     _parties_rank = None
+    _chunk_bytes = None
 
     @classmethod
     def init(
         cls,
         addresses: Dict,
         self_party: str,
+        chunk_bytes: Optional[int] = None,
     ):
+        """
+        Args:
+            addresses: addresses of all parties.
+            self_party: name of this party.
+            chunk_bytes: Optional; if set, large ndarrays and ndarray lists are
+                split into frames of about chunk_bytes, and each frame is sent
+                as soon as it is serialized. Smaller messages are sent as one
+                message, as if it is unset. All parties must use the same
+                setting, peers not running secretflow expect it to be unset.
+        """
         cls._parties_rank = {party: i for i, party in enumerate(addresses)}
         cls.self_party = self_party
         cls.all_parties = list(addresses.keys())
+        cls._chunk_bytes = chunk_bytes
 
         desc = link.Desc()
         for party, addr in addresses.items():
@@ -57,14 +75,21 @@ class LinkProxy:
 
     @classmethod
     def send(cls, dest_party: str, data: Any):
-        msg_bytes = serialize(data)
-        cls.send_raw(dest_party, msg_bytes)
+        if cls._chunk_bytes:
+            for frame in serialize_frames(data, cls._chunk_bytes):
+                cls.send_raw(dest_party, frame)
+        else:
+            msg_bytes = serialize(data)
+            cls.send_raw(dest_party, msg_bytes)
         logging.debug(f'send type {type(data)} to {dest_party}')
 
     @classmethod
     def recv(cls, src_party: str) -> Any:
-        msg_bytes = cls.recv_raw(src_party)
-        data = deserialize(msg_bytes)
+        if cls._chunk_bytes:
+            data = deserialize_frames(lambda: cls.recv_raw(src_party))
+        else:
+            msg_bytes = cls.recv_raw(src_party)
+            data = deserialize(msg_bytes)
         logging.debug(f'recv type {type(data)} from {src_party}')
         return data
 
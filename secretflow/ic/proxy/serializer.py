@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, List, Sequence, Union
+from typing import Any, Callable, Iterator, List, Sequence, Union
 
 import jax
 import numpy as np
@@ -58,6 +58,95 @@ def deserialize(msg_bytes: bytes) -> Any:
         return _ndarray_list_from_bytes(data_pb.f_ndarray_list, data_pb.scalar_type)
 
 
+# kinds of chunked messages, the header frame is an int list of
+# [kind, frame count, *shape of the whole ndarray if kind is ndarray] tagged
+# with _FRAME_HEADER as scalar_type_name.
+_FRAME_HEADER = "frame_header"
+_FRAME_NDARRAY_ROWS = 1
+_FRAME_NDARRAY_LIST = 2
+
+
+def serialize_frames(data: Any, chunk_bytes: int) -> Iterator[bytes]:
+    """Serialize data into frames of at most about chunk_bytes payload each.
+
+    Data larger than chunk_bytes is sent as a header frame followed by its
+    chunks. Frames are produced lazily, so the caller can put each frame on
+    the link before the next one is serialized, and only one chunk of an
+    ndarray is copied at a time. Everything else, including all types other
+    than ndarrays and ndarray lists, is sent inline as one frame, the same
+    message `serialize` produces. Every frame is a plain DataExchangeProtocol
+    message.
+    """
+    if isinstance(data, jax.numpy.ndarray) and not isinstance(data, np.ndarray):
+        data = np.asarray(data)
+    if isinstance(data, np.ndarray) and data.ndim > 0 and data.nbytes > chunk_bytes:
+        data = np.ascontiguousarray(data)
+        row_bytes = max(data.nbytes // max(data.shape[0], 1), 1)
+        rows = max(chunk_bytes // row_bytes, 1)
+        starts = range(0, data.shape[0], rows)
+        yield _serialize_frame_header(
+            [_FRAME_NDARRAY_ROWS, len(starts)] + list(data.shape)
+        )
+        for start in starts:
+            yield _serialize_ndarray(data[start : start + rows])
+    elif (
+        isinstance(data, (list, tuple))
+        and len(data) > 1
+        and all(isinstance(item, np.ndarray) for item in data)
+        and sum(item.nbytes for item in data) > chunk_bytes
+    ):
+        groups, group, group_bytes = [], [], 0
+        for item in data:
+            if group and group_bytes + item.nbytes > chunk_bytes:
+                groups.append(group)
+                group, group_bytes = [], 0
+            group.append(item)
+            group_bytes += item.nbytes
+        groups.append(group)
+        yield _serialize_frame_header([_FRAME_NDARRAY_LIST, len(groups)])
+        for group in groups:
+            yield _serialize_ndarray_list(group)
+    else:
+        yield serialize(data)
+
+
+def deserialize_frames(recv_frame: Callable[[], bytes]) -> Any:
+    """Receive frames written by `serialize_frames` with recv_frame and rebuild
+    the data. ndarray chunks are copied into the output as they arrive."""
+    msg_bytes = recv_frame()
+    data_pb = de.DataExchangeProtocol()
+    data_pb.ParseFromString(msg_bytes)
+    if data_pb.scalar_type_name != _FRAME_HEADER:
+        return deserialize(msg_bytes)
+
+    header = _int_list_from_bytes(data_pb.f_scalar_list, data_pb.scalar_type)
+    kind, num_frames = header[0], header[1]
+    if kind == _FRAME_NDARRAY_ROWS:
+        out = None
+        offset = 0
+        for _ in range(num_frames):
+            chunk = deserialize(recv_frame())
+            if out is None:
+                out = np.empty(header[2:], dtype=chunk.dtype)
+            out[offset : offset + chunk.shape[0]] = chunk
+            offset += chunk.shape[0]
+        assert offset == out.shape[0], f'expect {out.shape[0]} rows, got {offset}'
+        return out
+    else:
+        assert kind == _FRAME_NDARRAY_LIST, f'unknown header {header}'
+        data = []
+        for _ in range(num_frames):
+            data.extend(deserialize(recv_frame()))
+        return data
+
+
+def _serialize_frame_header(header: List[int]) -> bytes:
+    data_pb = de.DataExchangeProtocol()
+    data_pb.ParseFromString(_serialize_int_list(header))
+    data_pb.scalar_type_name = _FRAME_HEADER
+    return data_pb.SerializeToString()
+
+
 def _serialize_public_key(data: PublicKey) -> bytes:
     data_pb = de.DataExchangeProtocol()
     data_pb.scalar_type = de.SCALAR_TYPE_OBJECT
@@ -47,7 +47,11 @@ def _init_link(link_config: dict):
         else:
             addresses[party] = addr['address']
 
-    LinkProxy.init(addresses=addresses, self_party=self_party)
+    LinkProxy.init(
+        addresses=addresses,
+        self_party=self_party,
+        chunk_bytes=link_config.get('chunk_bytes', None),
+    )
 
 
 def _stop_link():
@@ -30,6 +30,7 @@ __all__ = [
     "TrainingCallback",
     "EarlyStopping",
     "EvaluationMonitor",
+    "TuneReportCallback",
     "CallbackContainer",
     "CallBackCompatibleModel",
 ]
@@ -428,4 +429,30 @@ class EvaluationMonitor(TrainingCallback):
         return model
 
 
+class TuneReportCallback(TrainingCallback):
+    """Report the latest evaluation result of each iteration to secretflow.tune,
+    so tune schedulers like ASHA can stop unpromising trials early.
+
+    Metrics are named `{data}-{metric}`, e.g. `val-roc_auc`, one report per
+    round, so `training_iteration` of tune counts rounds. Only use it inside a
+    tune trial.
+    """
+
+    def after_iteration(
+        self,
+        _: CallBackCompatibleModel,
+        epoch: int,
+        evals_log: TrainingCallback.EvalsLog,
+    ) -> bool:
+        import secretflow.tune as tune
+
+        metrics = {}
+        for data, metric in evals_log.items():
+            for metric_name, log in metric.items():
+                score = log[-1][0] if isinstance(log[-1], tuple) else log[-1]
+                metrics[f"{data}-{metric_name}"] = float(score)
+        tune.train.report(metrics)
+        return False
+
+
 # TODO(zoupeicheng.zpc): support model checkpoint
@@ -19,6 +19,7 @@ from secretflow.device import PYUObject, reveal
 from secretflow.ml.boost.core.callback import VData
 from secretflow.stats.core.metrics import (
     mean_squared_error,
+    multi_class_log_loss,
     roc_auc_score,
     root_mean_squared_error,
 )
@@ -40,4 +41,5 @@ METRICS = {
     'roc_auc': metric_wrapper(roc_auc_score, 'roc_auc'),
     'rmse': metric_wrapper(root_mean_squared_error, 'rmse'),
     'mse': metric_wrapper(mean_squared_error, 'mse'),
+    'mlogloss': metric_wrapper(multi_class_log_loss, 'mlogloss'),
 }
@@ -30,7 +30,7 @@ from .complete_tree import CompleteTree
 from .complete_tree import from_dict as complete_tree_from_dict
 from .complete_tree import from_distributed_tree
 from .core.params import RegType
-from .core.pure_numpy_ops.pred import sigmoid
+from .core.pure_numpy_ops.pred import sigmoid, softmax
 from .model import SgbModel
 
 
@@ -68,12 +68,13 @@ class CompleteSgbModel:
             pred = tree.predict(x)
             preds.append(pred)
 
-        pred = (jnp.sum(jnp.concatenate(preds, axis=1), axis=1) + self.base).reshape(
-            -1, 1
-        )
+        # each tree predicts (samples, 1) or (samples, num_class)
+        pred = jnp.sum(jnp.stack(preds, axis=0), axis=0) + self.base
 
         if self.objective == RegType.Logistic:
             pred = sigmoid(pred)
+        elif self.objective == RegType.Softmax:
+            pred = softmax(pred)
 
         return pred
 
@@ -21,6 +21,7 @@ import numpy as np
 class RegType(Enum):
     Linear = 'linear'
     Logistic = 'logistic'
+    Softmax = 'softmax'
 
 
 class TreeGrowingMethod(Enum):
@@ -53,6 +54,10 @@ class SGBParams:
     'batch_encoding_enabled': bool. if use batch encoding optimization.
         default: True.
     'audit_paths': dict. {device : path to save log for audit}
+    'order_map_cache_paths': dict. {party : directory to cache order maps}
+        Order maps and split points are cached by content hash of each partition and bucket number,
+        repeated fits on the same data (e.g. tuning trials) load them instead of rebuilding.
+        default: {}
     'enable_quantization': Whether enable quantization of g and h.
         only recommended for encryption schemes with small plaintext range, like elgamal.
         default: False
@@ -74,6 +79,11 @@ class SGBParams:
     'max_leaf': int, maximum leaf of a tree. only effective if train leaf wise.
         default: 15
         range: [1, 2**15]
+    'leaf_wise_expand_num': int, number of split candidates with top gains expanded together
+        in one round. only effective if train leaf wise.
+        Larger values reduce the number of cross party rounds, 1 means classic leaf wise growth.
+        default: 1
+        range: [1, 2**15]
     'max_depth': int, maximum depth of a tree.only effective if train level wise.
         default: 5
         range: [1, 16]
@@ -101,15 +111,23 @@ class SGBParams:
         default: 0.1
         range: (0, 1]
     'objective': Specify the learning objective.
+        'softmax' trains multi-class trees, each tree has a leaf weight vector of num_class entries.
         default: 'logistic'
-        range: ['linear', 'logistic']
+        range: ['linear', 'logistic', 'softmax']
+    'num_class': int. number of classes, labels must be in [0, num_class). only effective if objective is softmax.
+        default: 2
+        range: [2, 1024]
     'base_score': The initial prediction score of all instances, global bias.
         default: 0
     'tree_growing_method': how to grow tree?
         default: level-wise
     'enable_packbits': bool. if true, turn on packbits transmission.
         default: False
-    'eval_metric': str. evaluation metric name, must be one of 'roc_auc', 'mse' or 'rmse' Note if objective is not logistic, auc may not work.
+    'enable_batch_decrypt': bool. if true, label holder decrypts all nodes' bucket sums of a worker
+        in one concurrent call, and decrypts the equal last bucket of each feature only once.
+        default: False
+    'eval_metric': str. evaluation metric name, must be one of 'roc_auc', 'mse', 'rmse' or 'mlogloss'.
+        Note if objective is not logistic, auc may not work. Use 'mlogloss' if objective is softmax.
         default: 'roc_auc'
     'enable_monitor': bool. whether enable model monitor call back.
         default: False
@@ -127,6 +145,9 @@ class SGBParams:
         default: 0.001
     'save_best_model': bool. whether save best model on validation set during training, only effective if early stop enabled.
         default: False
+    'enable_tune_report': bool. whether report evaluation results of each round to secretflow.tune,
+    so tune schedulers like ASHA can stop trials early. It requires enable_early_stop, which provides the evaluation results.
+        default: False
     """
 
     # security or encryption related params
@@ -134,6 +155,7 @@ class SGBParams:
     fixed_point_parameter: int = 20
     batch_encoding_enabled: bool = True
     audit_paths: dict = field(default_factory=dict)
+    order_map_cache_paths: dict = field(default_factory=dict)
     enable_quantization: bool = False
     quantization_scale: float = 10000.0
 
@@ -143,6 +165,8 @@ class SGBParams:
     learning_rate: float = 0.3
     # only effective if tree growing method is leaf wise
     max_leaf: int = 15
+    # only effective if tree growing method is leaf wise
+    leaf_wise_expand_num: int = 1
     # only effective if tree growing method is level wise
     max_depth: int = 5
     gamma: float = 0.0
@@ -154,9 +178,11 @@ class SGBParams:
     bottom_rate: float = 0.5
     sketch_eps: float = 0.1
     objective: RegType = RegType('logistic')
+    num_class: int = 2
     base_score: float = 0.0
     tree_growing_method: TreeGrowingMethod = TreeGrowingMethod.LEVEL
     enable_packbits: bool = False
+    enable_batch_decrypt: bool = False
 
     # callback params
     eval_metric: str = 'roc_auc'
@@ -166,6 +192,7 @@ class SGBParams:
     stopping_rounds: int = 1
     stopping_tolerance: float = 0.001
     save_best_model: bool = False
+    enable_tune_report: bool = False
 
 
 default_params = SGBParams()
@@ -199,6 +226,7 @@ numeric_params_range = {
     'reg_lambda': (0, 10000, True, True),
     'learning_rate': (0, 1, False, True),
     'max_leaf': (1, 32768, True, True),
+    'leaf_wise_expand_num': (1, 32768, True, True),
     'max_depth': (1, 16, True, True),
     'gamma': (0, 10000, True, True),
     'rowsample_by_tree': (0, 1, False, True),
@@ -208,6 +236,7 @@ numeric_params_range = {
     'sketch_eps': (0, 1, False, True),
     'validation_fraction': (0, 1, False, False),
     'stopping_rounds': (1, 1024, True, True),
+    'num_class': (2, 1024, True, True),
     'stopping_tolerance': (0, np.inf, True, False),
 }
 
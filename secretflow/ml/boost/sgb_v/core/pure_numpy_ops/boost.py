@@ -65,12 +65,22 @@ def compute_weight(
 def calculate_gains(
     level_nodes_G: List[np.ndarray], level_nodes_H: List[np.ndarray], reg_lambda: float
 ) -> np.ndarray:
-    GL = np.concatenate(level_nodes_G, axis=0)
-    HL = np.concatenate(level_nodes_H, axis=0)
+    """
+    compute split gains of each bucket for each node.
+
+    Args:
+        level_nodes_G/level_nodes_H: each element has shape (num_class, buckets).
+            multi class gains are summed over classes.
+
+    Return:
+        gains in shape (node number, buckets).
+    """
+    GL = np.stack(level_nodes_G, axis=0)
+    HL = np.stack(level_nodes_H, axis=0)
 
     # last buckets is the total gradient sum of all samples belong to current level nodes.
-    GA = GL[:, -1].reshape(-1, 1)
-    HA = HL[:, -1].reshape(-1, 1)
+    GA = GL[:, :, -1:]
+    HA = HL[:, :, -1:]
     # gradient sums of right child nodes after splitting by each bucket
     GR = GA - GL
     HR = HA - HL
@@ -78,8 +88,8 @@ def calculate_gains(
     obj_r = compute_obj(GR, HR, reg_lambda)
 
     # last objective value means split all sample to left, equal to no split.
-    obj = obj_l[:, -1].reshape(-1, 1)
-    gain = obj_l + obj_r - obj
+    obj = obj_l[:, :, -1:]
+    gain = np.sum(obj_l + obj_r - obj, axis=1)
     return gain
 
 
@@ -31,14 +31,14 @@ def batch_select_sum(arr, children_nodes_selects: List, order_map, bucket_num):
     """select sum
 
     Args:
-        arr: array of shape (n, 2). n is the sample number.
+        arr: array of shape (n, 2 * num_class). n is the sample number.
         children_nodes_selects (List): List of length node number. Each element is a boolean array of size sample number,
             indicating whether the node is selected or not.
         order_map (np.ndarray): an array of shape (sample_number, feature_number), indicating which feature each sample belongs to.
         bucket_num (int): number of buckets in each feature
 
     Returns:
-        bucket sums (List): return a list of length node number. Each element is an array of shape (order_map.shape[1] * bucket_num, 2)
+        bucket sums (List): return a list of length node number. Each element is an array of shape (order_map.shape[1] * bucket_num, arr.shape[1])
     """
     children_node_select_one_arr_form = np.zeros(
         children_nodes_selects[0].shape, dtype=np.int64
@@ -54,7 +54,7 @@ def batch_select_sum(arr, children_nodes_selects: List, order_map, bucket_num):
     bucket_sums_arr = batch_select_sum_inner(
         arr, children_node_select_one_arr_form, order_map, bucket_num, node_num
     )
-    return [bucket_sums_arr[i].reshape(-1, 2) for i in range(node_num)]
+    return [bucket_sums_arr[i].reshape(-1, arr.shape[1]) for i in range(node_num)]
 
 
 @njit(parallel=True)
@@ -63,9 +63,10 @@ def batch_select_sum_inner(
 ):
     feature_number = order_map.shape[1]
     sample_num = arr.shape[0]
+    col_num = arr.shape[1]
 
     bucket_sums_arr = np.zeros(
-        (node_num, feature_number, bucket_num, 2), dtype=arr.dtype
+        (node_num, feature_number, bucket_num, col_num), dtype=arr.dtype
     )
 
     for j in prange(feature_number):
@@ -77,7 +78,7 @@ def batch_select_sum_inner(
 
     for j in prange(feature_number):
         for n in range(node_num):
-            for k in range(2):
+            for k in range(col_num):
                 bucket_sums_arr[n, j, 0:bucket_num, k] = np.cumsum(
                     bucket_sums_arr[n, j, 0:bucket_num, k]
                 )
@@ -16,7 +16,7 @@ from typing import List, Tuple, Union
 import jax.numpy as jnp
 import numpy as np
 
-from .pred import sigmoid
+from .pred import sigmoid, softmax
 
 
 def compute_sum_abs(y: np.ndarray) -> float:
@@ -48,5 +48,23 @@ def compute_gh_logistic(y: np.ndarray, pred: np.ndarray):
     return yhat - y, yhat * (1 - yhat)
 
 
+def compute_gh_softmax(y: np.ndarray, pred: np.ndarray):
+    """g and h of all classes, pred has shape (samples, num_class) and y holds class labels."""
+    yhat = softmax(pred)
+    one_hot = (y.reshape(-1, 1) == np.arange(pred.shape[1]).reshape(1, -1)).astype(
+        np.float32
+    )
+    return yhat - one_hot, yhat * (1 - yhat)
+
+
+def pack_gh(g: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """interleave g and h into shape (samples, 2 * num_class), [g_0, h_0, g_1, h_1, ...].
+
+    Keeps each class's (g, h) pair adjacent, so batch encoding packs a pair into one plaintext.
+    """
+    return np.stack([g, h], axis=2).reshape(g.shape[0], -1)
+
+
 def split_GH(x) -> Tuple[np.ndarray, np.ndarray]:
-    return x[:, 0].reshape(1, -1), x[:, 1].reshape(1, -1)
+    """split bucket sums of packed gh into G and H, each of shape (num_class, buckets)"""
+    return x[:, 0::2].T, x[:, 1::2].T
@@ -15,13 +15,14 @@
 from functools import reduce
 from typing import List
 
+import jax.numpy as jnp
 import numpy as np
 
 from secretflow.utils import sigmoid as appr_sig
 
 
-def init_pred(base: float, samples: int) -> np.ndarray:
-    shape = (samples, 1)
+def init_pred(base: float, samples: int, num_class: int = 1) -> np.ndarray:
+    shape = (samples, num_class)
     return np.full(shape, base, order='F')
 
 
@@ -29,20 +30,26 @@ def sigmoid(pred: np.ndarray) -> np.ndarray:
     return appr_sig.sr_sig(pred)
 
 
+def softmax(pred: np.ndarray) -> np.ndarray:
+    """row wise softmax of raw scores with shape (samples, num_class)"""
+    exp = jnp.exp(pred - jnp.max(pred, axis=1, keepdims=True))
+    return exp / jnp.sum(exp, axis=1, keepdims=True)
+
+
 def predict_tree_weight(selects: List[np.ndarray], weights: np.ndarray) -> np.ndarray:
     """
     get final pred for this tree.
 
     Args:
         selects: leaf nodes' sample selects from each model handler.
-        weights: leaf weights.
+        weights: leaf weights, shape (leaf number, 1) or (leaf number, num_class).
 
     Return:
-        pred
+        pred, shape (samples, 1) or (samples, num_class).
     """
     # get final leaf selects based on collective information
     select = reduce(np.multiply, selects)
     assert (
         select.shape[1] == weights.shape[0]
     ), f"select {select.shape}, weights {weights.shape}"
-    return np.matmul(select, weights).reshape((select.shape[0]), 1)
+    return np.matmul(select, weights).reshape((select.shape[0]), -1)
@@ -239,9 +239,9 @@ class GlobalOrdermapBooster(Composite, CallBackCompatibleModel):
                 .get_trees()[-1]
                 .predict(x.partitions)
             )
-            new_pred = pred.device(lambda x, y: np.add(x, y).reshape(-1, 1))(
-                pred, cache
-            )
+            new_pred = pred.device(
+                lambda x, y: np.add(x, y).reshape(np.shape(x)[0], -1)
+            )(pred, cache)
 
         else:
             new_pred = self.components.model_builder.finish().predict(x)
@@ -14,10 +14,14 @@
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 from secretflow.data import FedNdarray
 from secretflow.device import PYU, HEUObject, PYUObject
+from secretflow.device.device.heu import HEUMoveConfig
 from secretflow.ml.boost.sgb_v.factory.sgb_actor import SGBActor
 
+from ....core.params import default_params
 from ....core.pure_numpy_ops.bucket_sum import batch_select_sum, regroup_bucket_sums
 from ....core.pure_numpy_ops.grad import split_GH
 from ....core.pure_numpy_ops.node_select import (
@@ -31,6 +35,29 @@ from ..logging import LoggingParams, LoggingTools
 from ..shuffler import Shuffler
 
 
+def batch_decrypt_bucket_sums(
+    bucket_sums: List[HEUObject],
+    bucket_list: PYUObject,
+    label_holder: PYU,
+    move_config: HEUMoveConfig,
+) -> PYUObject:
+    """Decrypt shuffled bucket sums of all nodes from one worker in one call.
+
+    Shuffling keeps the last bucket of each feature in place, and as bucket sums
+    are cumulative, it holds the node total for every feature. So only the last
+    of them is decrypted.
+
+    Returns:
+        PYUObject of list of bucket sums, one per node.
+    """
+    feature_ends = label_holder(lambda bl: [int(e) - 1 for e in np.cumsum(bl)])(
+        bucket_list.to(label_holder)
+    )
+    return bucket_sums[0].device.batch_decrypt(
+        bucket_sums, label_holder, move_config, shared_rows=feature_ends
+    )
+
+
 @dataclass
 class BucketSumCalculatorParams:
     """
@@ -38,10 +65,13 @@ class BucketSumCalculatorParams:
         default: False
     'enable_packbits': bool. if true, turn on packbits transmission.
         default: False
+    'enable_batch_decrypt': bool. if true, decrypt all nodes' bucket sums of a worker in one call.
+        default: False
     """
 
     label_holder_feature_only: bool = False
     enable_packbits: bool = False
+    enable_batch_decrypt: bool = default_params.enable_batch_decrypt
 
 
 @dataclass
@@ -65,11 +95,15 @@ class BucketSumCalculator(Composite):
             params.get('label_holder_feature_only', False)
         )
         self.params.enable_packbits = bool(params.get('enable_packbits', False))
+        self.params.enable_batch_decrypt = bool(
+            params.get('enable_batch_decrypt', default_params.enable_batch_decrypt)
+        )
 
     def get_params(self, params: dict):
         LoggingTools.logging_params_write_dict(params, self.logging_params)
         params['label_holder_feature_only'] = self.params.label_holder_feature_only
         params['enable_packbits'] = self.params.enable_packbits
+        params['enable_batch_decrypt'] = self.params.enable_batch_decrypt
 
     def set_devices(self, devices: Devices):
         super().set_devices(devices)
@@ -139,13 +173,21 @@ class BucketSumCalculator(Composite):
                         for j, bucket_sum in enumerate(bucket_sums)
                     ]
 
-                    bucket_sums_list[i] = [
-                        bucket_sum.to(
+                    if self.params.enable_batch_decrypt and len(bucket_sums) > 0:
+                        bucket_sums_list[i] = batch_decrypt_bucket_sums(
+                            bucket_sums,
+                            bucket_lists[i],
                             self.label_holder,
                             gradient_encryptor.get_move_config(self.label_holder),
                         )
-                        for bucket_sum in bucket_sums
-                    ]
+                    else:
+                        bucket_sums_list[i] = [
+                            bucket_sum.to(
+                                self.label_holder,
+                                gradient_encryptor.get_move_config(self.label_holder),
+                            )
+                            for bucket_sum in bucket_sums
+                        ]
             else:
                 bucket_sums = self.label_holder(batch_select_sum)(
                     encrypted_gh_dict[worker],
@@ -19,6 +19,7 @@ from secretflow.data import FedNdarray
 from secretflow.device import PYU, HEUObject, PYUObject
 from secretflow.ml.boost.sgb_v.factory.sgb_actor import SGBActor
 
+from ....core.params import default_params
 from ....core.pure_numpy_ops.bucket_sum import batch_select_sum, regroup_bucket_sums
 from ....core.pure_numpy_ops.grad import split_GH
 from ....core.pure_numpy_ops.node_select import (
@@ -30,6 +31,7 @@ from ..component import Composite, Devices, print_params
 from ..gradient_encryptor import GradientEncryptor
 from ..logging import LoggingParams, LoggingTools
 from ..shuffler import Shuffler
+from .bucket_sum_calculator import batch_decrypt_bucket_sums
 
 
 @dataclass
@@ -39,10 +41,13 @@ class LeafWiseBucketSumCalculatorParams:
         default: False
     'enable_packbits': bool. if true, turn on packbits transmission.
         default: False
+    'enable_batch_decrypt': bool. if true, decrypt all nodes' bucket sums of a worker in one call.
+        default: False
     """
 
     label_holder_feature_only: bool = False
     enable_packbits: bool = False
+    enable_batch_decrypt: bool = default_params.enable_batch_decrypt
 
 
 @dataclass
@@ -66,11 +71,15 @@ class LeafWiseBucketSumCalculator(Composite):
             'label_holder_feature_only', False
         )
         self.params.enable_packbits = bool(params.get('enable_packbits', False))
+        self.params.enable_batch_decrypt = bool(
+            params.get('enable_batch_decrypt', default_params.enable_batch_decrypt)
+        )
 
     def get_params(self, params: dict):
         LoggingTools.logging_params_write_dict(params, self.logging_params)
         params['label_holder_feature_only'] = self.params.label_holder_feature_only
         params['enable_packbits'] = self.params.enable_packbits
+        params['enable_batch_decrypt'] = self.params.enable_batch_decrypt
 
     def set_devices(self, devices: Devices):
         super().set_devices(devices)
@@ -141,13 +150,21 @@ class LeafWiseBucketSumCalculator(Composite):
                         for j, bucket_sum in zip(all_children_node_indices, bucket_sums)
                     ]
 
-                    bucket_sums_list[i] = [
-                        bucket_sum.to(
+                    if self.params.enable_batch_decrypt and len(bucket_sums) > 0:
+                        bucket_sums_list[i] = batch_decrypt_bucket_sums(
+                            bucket_sums,
+                            bucket_lists[i],
                             self.label_holder,
                             gradient_encryptor.get_move_config(self.label_holder),
                         )
-                        for bucket_sum in bucket_sums
-                    ]
+                    else:
+                        bucket_sums_list[i] = [
+                            bucket_sum.to(
+                                self.label_holder,
+                                gradient_encryptor.get_move_config(self.label_holder),
+                            )
+                            for bucket_sum in bucket_sums
+                        ]
             else:
                 bucket_sums = self.label_holder(batch_select_sum)(
                     encrypted_gh_dict[worker],
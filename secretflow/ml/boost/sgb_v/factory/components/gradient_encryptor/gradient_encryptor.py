@@ -21,6 +21,7 @@ from heu import phe
 from secretflow.device import PYU, HEUObject, PYUObject
 from secretflow.device.device.heu import HEUMoveConfig
 from secretflow.ml.boost.sgb_v.core.params import default_params
+from secretflow.ml.boost.sgb_v.core.pure_numpy_ops.grad import pack_gh
 
 from ..component import Component, Devices, print_params
 from ..logging import LoggingParams, LoggingTools
@@ -115,7 +116,8 @@ class GradientEncryptor(Component):
         self.logging_params = LoggingTools.logging_params_from_dict(params)
 
     def pack(self, g: PYUObject, h: PYUObject) -> PYUObject:
-        return self.label_holder(lambda g, h: np.concatenate([g, h], axis=1))(g, h)
+        """pack g and h of all classes, so one encryption and one bucket sum pass serve all classes."""
+        return self.label_holder(pack_gh)(g, h)
 
     @LoggingTools.enable_logging
     def encrypt(self, gh: PYUObject, tree_index: int) -> Union[None, HEUObject]:
@@ -32,7 +32,7 @@ class LossComputerParams:
     """
     'objective': Specify the learning objective.
         default: 'logistic'
-        range: ['linear', 'logistic']
+        range: ['linear', 'logistic', 'softmax']
     'enable_quantization': Whether enable quantization of g and h.
         only recommended for encryption schemes with small plaintext range, like elgamal.
         default: False
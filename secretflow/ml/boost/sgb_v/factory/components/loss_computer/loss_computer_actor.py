@@ -21,6 +21,7 @@ from ....core.params import RegType
 from ....core.pure_numpy_ops.grad import (
     compute_gh_linear,
     compute_gh_logistic,
+    compute_gh_softmax,
     compute_relative_scaling_factor,
     compute_sum_abs,
     scale,
@@ -42,6 +43,8 @@ class LossComputerActor:
             g, h = compute_gh_linear(y, pred)
         elif obj == RegType.Logistic:
             g, h = compute_gh_logistic(y, pred)
+        elif obj == RegType.Softmax:
+            g, h = compute_gh_softmax(y, pred)
         else:
             raise f"unknown objective {obj}"
         return g, h
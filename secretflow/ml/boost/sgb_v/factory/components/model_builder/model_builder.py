@@ -31,13 +31,17 @@ class ModelBuilderParams:
     """
     'objective': Specify the learning objective.
         default: 'logistic'
-        range: ['linear', 'logistic']
+        range: ['linear', 'logistic', 'softmax']
     'base_score': The initial prediction score of all instances, global bias.
         default: 0
+    'num_class': int. number of classes. only effective if objective is softmax.
+        default: 2
+        range: [2, 1024]
     """
 
     base_score: float = default_params.base_score
     objective: RegType = default_params.objective
+    num_class: int = default_params.num_class
 
 
 class ModelBuilder(Component):
@@ -54,10 +58,12 @@ class ModelBuilder(Component):
         obj = RegType(obj)
         self.params.objective = obj
         self.params.base_score = params.get('base_score', default_params.base_score)
+        self.params.num_class = params.get('num_class', default_params.num_class)
 
     def get_params(self, params: dict):
         params['base_score'] = self.params.base_score
         params['objective'] = self.params.objective
+        params['num_class'] = self.params.num_class
 
     def set_devices(self, devices: Devices):
         self.label_holder = devices.label_holder
@@ -70,7 +76,12 @@ class ModelBuilder(Component):
 
     def init_pred(self, sample_num: Union[PYUObject, int]) -> PYUObject:
         base = self.params.base_score
-        return self.label_holder(init_pred)(base=base, samples=sample_num)
+        num_class = (
+            self.params.num_class if self.params.objective == RegType.Softmax else 1
+        )
+        return self.label_holder(init_pred)(
+            base=base, samples=sample_num, num_class=num_class
+        )
 
     def init_model(self):
         self.model = SgbModel(
@@ -13,10 +13,16 @@
 # limitations under the License.
 
 
+import logging
 from typing import List, Tuple, Union
 
 import numpy as np
 
+from .order_map_cache import (
+    load_order_map_cache,
+    order_map_cache_key,
+    save_order_map_cache,
+)
 from .order_map_context import OrderMapContext
 
 
@@ -26,13 +32,36 @@ class OrderMapActor:
         self.idx = idx
         self.ordermap_context = OrderMapContext()
 
-    def build_order_map(self, x: np.ndarray, buckets: int, seed: int) -> np.ndarray:
+    def build_order_map(
+        self,
+        x: np.ndarray,
+        buckets: int,
+        seed: int,
+        cache_dir: Union[str, None] = None,
+    ) -> np.ndarray:
         """
         Set up global context.
+
+        If cache_dir is set, order map and split points are loaded from
+        the cache keyed by content of x and buckets, or built and saved on miss.
         """
         np.random.seed(seed)
+        if cache_dir is not None:
+            key = order_map_cache_key(x, buckets)
+            cached = load_order_map_cache(cache_dir, key)
+            if cached is not None:
+                logging.info(f"order map cache hit {key}.")
+                self.ordermap_context.load_maps(*cached, buckets)
+                return self.ordermap_context.get_order_map()
         x = np.array(x, order='F')
         self.ordermap_context.build_maps(x, buckets)
+        if cache_dir is not None:
+            save_order_map_cache(
+                cache_dir,
+                key,
+                self.ordermap_context.get_order_map(),
+                self.ordermap_context.get_split_points(),
+            )
         return self.ordermap_context.get_order_map()
 
     def get_features(self) -> int:
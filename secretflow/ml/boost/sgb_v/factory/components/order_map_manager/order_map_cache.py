@@ -0,0 +1,100 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from typing import List, Tuple, Union
+
+import numpy as np
+
+# bump this when the way order maps or split points are built changes,
+# so stale caches are not picked up.
+ORDER_MAP_CACHE_VERSION = 1
+
+
+def order_map_cache_key(x: np.ndarray, buckets: int) -> str:
+    """Content hash of a partition and the bucket count.
+
+    Args:
+        x (np.ndarray): dataset of this partition.
+        buckets (int): number of buckets used to build the order map.
+
+    Returns:
+        str: hex digest used as file name prefix of cache entries.
+    """
+    x = np.ascontiguousarray(x)
+    hasher = hashlib.sha256()
+    hasher.update(
+        f"v{ORDER_MAP_CACHE_VERSION}:{x.dtype.str}:{x.shape}:{buckets}".encode()
+    )
+    hasher.update(memoryview(x).cast('B'))
+    return hasher.hexdigest()
+
+
+def _cache_files(cache_dir: str, key: str) -> Tuple[str, str]:
+    return (
+        os.path.join(cache_dir, key + ".order_map.npy"),
+        os.path.join(cache_dir, key + ".split_points.json"),
+    )
+
+
+def load_order_map_cache(
+    cache_dir: str, key: str
+) -> Union[None, Tuple[np.ndarray, List[List[float]]]]:
+    """Load order map (memory-mapped, read only) and split points.
+
+    Returns:
+        None if cache missed or corrupted, else (order_map, split_points).
+    """
+    order_map_file, split_points_file = _cache_files(cache_dir, key)
+    if not (os.path.exists(order_map_file) and os.path.exists(split_points_file)):
+        return None
+    try:
+        order_map = np.load(order_map_file, mmap_mode='r')
+        with open(split_points_file, 'r') as f:
+            split_points = json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"failed to load order map cache {key}, rebuilding: {e}")
+        return None
+    if len(split_points) != order_map.shape[1]:
+        logging.warning(f"order map cache {key} is inconsistent, rebuilding.")
+        return None
+    return order_map, split_points
+
+
+def save_order_map_cache(
+    cache_dir: str,
+    key: str,
+    order_map: np.ndarray,
+    split_points: List[List[float]],
+):
+    """Save order map and split points.
+
+    Files are written to temporary names then renamed,
+    so concurrent fits on the same worker never see partial entries.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    order_map_file, split_points_file = _cache_files(cache_dir, key)
+    suffix = "." + uuid.uuid4().hex + ".tmp"
+    with open(order_map_file + suffix, 'wb') as f:
+        np.save(f, order_map)
+    with open(split_points_file + suffix, 'w') as f:
+        # padded split points are inf, which python json round trips.
+        json.dump(split_points, f)
+    # order map is renamed last, so its existence implies complete split points.
+    os.replace(split_points_file + suffix, split_points_file)
+    os.replace(order_map_file + suffix, order_map_file)
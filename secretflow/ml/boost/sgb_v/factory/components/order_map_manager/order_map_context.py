@@ -66,6 +66,24 @@ class OrderMapContext:
 
         self.order_map_shape = self.order_map.shape
 
+    def load_maps(
+        self, order_map: np.ndarray, split_points: List[List[float]], buckets: int
+    ) -> None:
+        """
+        restore maps built by build_maps, e.g. from a cache.
+
+        Args:
+            order_map: order map of this partition, may be memory-mapped.
+            split_points: padded bucket split points for all features.
+            buckets: number of buckets used to build the maps.
+        """
+        self.order_map = order_map
+        self.split_points = split_points
+        self.feature_buckets = [len(split_point) for split_point in split_points]
+        self.features = order_map.shape[1]
+        self.buckets = buckets
+        self.order_map_shape = self.order_map.shape
+
     def get_order_map(self) -> np.ndarray:
         return self.order_map
 
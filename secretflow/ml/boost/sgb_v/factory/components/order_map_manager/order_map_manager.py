@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Union
 
 from secretflow.data import FedNdarray, PartitionWay
@@ -35,10 +35,16 @@ class OrderMapBuilderParams:
 
     'seed': Pseudorandom number generator seed.
         default: 1212
+
+    'order_map_cache_paths': dict. {party : directory to cache order maps and split points}
+        cache is keyed by content hash of the partition and the bucket number,
+        later fits on the same data load the memory-mapped order map instead of rebuilding.
+        default: {}
     """
 
     sketch_eps: float = default_params.sketch_eps
     seed: int = default_params.seed
+    order_map_cache_paths: dict = field(default_factory=dict)
 
 
 class OrderMapManager(Component):
@@ -60,12 +66,14 @@ class OrderMapManager(Component):
         # derive attributes
         self.buckets = eps_inverse(sketch)
         self.params.seed = params.get('seed', default_params.seed)
+        self.params.order_map_cache_paths = params.get('order_map_cache_paths', {})
 
         self.logging_params = LoggingTools.logging_params_from_dict(params)
 
     def get_params(self, params: dict):
         params['sketch_eps'] = self.params.sketch_eps
         params['seed'] = self.params.seed
+        params['order_map_cache_paths'] = self.params.order_map_cache_paths
 
         LoggingTools.logging_params_write_dict(params, self.logging_params)
 
@@ -96,6 +104,7 @@ class OrderMapManager(Component):
                     x.partitions[order_map_actor.device].data,
                     buckets,
                     seed,
+                    self.params.order_map_cache_paths.get(order_map_actor.device.party),
                 )
                 for order_map_actor in self.order_map_actors
             },
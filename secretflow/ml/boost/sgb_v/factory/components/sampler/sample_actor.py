@@ -48,7 +48,8 @@ class SampleActor:
         fact = (1 - top_rate) / bottom_rate
         top_N = math.ceil(top_rate * row_num)
         rand_N = math.ceil(bottom_rate * row_num)
-        sorted_indices = np.argsort(abs(g.reshape(-1)))
+        # multi class gradients are ranked by the sum over classes
+        sorted_indices = np.argsort(np.sum(abs(g.reshape(row_num, -1)), axis=1))
         top_set = sorted_indices[:top_N]
         rand_set = self.rng.choice(sorted_indices[top_N:], rand_N, replace=False)
         # subsampling rows is public
@@ -189,12 +189,15 @@ class Sampler(Component):
         x: PYUObject,
         indices: Union[PYUObject, np.ndarray],
     ):
-        """Sample x for a single partition. Assuming we have a column vector.
+        """Sample x for a single partition. Assuming we have a column vector,
+        or a matrix with one column per class.
         Assume the indices was generated from row sampling by sampler"""
         if self.params.rowsample_by_tree < 1:
-            return x.device(lambda x, indices: x.reshape(-1, 1)[indices, :])(x, indices)
+            return x.device(lambda x, indices: x.reshape(x.shape[0], -1)[indices, :])(
+                x, indices
+            )
         else:
-            return x.device(lambda x: x.reshape(-1, 1))(x)
+            return x.device(lambda x: x.reshape(x.shape[0], -1))(x)
 
     def apply_vector_sampling_weighted(
         self,
@@ -204,9 +207,9 @@ class Sampler(Component):
     ):
         if self.params.enable_goss:
             return x.device(
-                lambda x, indices, weight: (
-                    np.multiply(x.reshape(-1)[indices], weight.reshape(-1))
-                ).reshape(-1, 1)
+                lambda x, indices, weight: np.multiply(
+                    x.reshape(x.shape[0], -1)[indices], weight.reshape(-1, 1)
+                )
             )(
                 x,
                 indices,
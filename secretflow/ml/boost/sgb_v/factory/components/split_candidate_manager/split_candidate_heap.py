@@ -105,6 +105,17 @@ class SplitCandidateHeap:
             best_candidate.info.split_bucket,
         )
 
+    def extract_top_k_split_info(
+        self, k: int
+    ) -> Tuple[List[int], List[np.ndarray], List[int]]:
+        """pop at most k candidates with largest gains, in descending gain order."""
+        candidates = [self.pop() for _ in range(min(k, len(self.heap)))]
+        return (
+            [candidate.node_index for candidate in candidates],
+            [candidate.info.sample_selects for candidate in candidates],
+            [candidate.info.split_bucket for candidate in candidates],
+        )
+
     def extract_all_nodes(self) -> Tuple[List[int], List[np.ndarray]]:
         ids = [candidate.node_index for candidate in self.heap]
         sample_selects = [candidate.info.sample_selects for candidate in self.heap]
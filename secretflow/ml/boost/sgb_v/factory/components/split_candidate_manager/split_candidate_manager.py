@@ -103,6 +103,14 @@ class SplitCandidateManager(Component):
             'SplitCandidateHeap', 'extract_best_split_info'
         )
 
+    def extract_top_k_split_info(
+        self, k: int
+    ) -> Tuple[List[int], List[np.ndarray], List[int]]:
+        """Get node indices, sample selects and split buckets of at most k best candidates."""
+        return self.heap.invoke_class_method_three_ret(
+            'SplitCandidateHeap', 'extract_top_k_split_info', k
+        )
+
     def extract_all_nodes(self) -> Tuple[List[int], List[np.ndarray]]:
         """Get all sample ids and sample selects and clean the heap"""
         return self.heap.invoke_class_method_two_ret(
@@ -60,9 +60,14 @@ class LeafWiseTreeTrainerParams:
     'max_leaf': int, maximum leaf of a tree.
             default: 15
             range: [1, 2**15]
+    'leaf_wise_expand_num': int, number of split candidates with top gains expanded in one round.
+            children of all expanded nodes compute bucket sums together in the next round.
+            default: 1
+            range: [1, 2**15]
     """
 
     max_leaf: int = default_params.max_leaf
+    leaf_wise_expand_num: int = default_params.leaf_wise_expand_num
 
 
 class LeafWiseTreeTrainer(TreeTrainer):
@@ -98,11 +103,15 @@ class LeafWiseTreeTrainer(TreeTrainer):
 
     def _get_trainer_params(self, params: dict):
         params['max_leaf'] = self.params.max_leaf
+        params['leaf_wise_expand_num'] = self.params.leaf_wise_expand_num
         LoggingTools.logging_params_write_dict(params, self.logging_params)
 
     def _set_trainer_params(self, params: dict):
         leaf_num = params.get('max_leaf', default_params.max_leaf)
         self.params.max_leaf = leaf_num
+        self.params.leaf_wise_expand_num = params.get(
+            'leaf_wise_expand_num', default_params.leaf_wise_expand_num
+        )
         self.logging_params = LoggingTools.logging_params_from_dict(params)
 
     def train_tree_context_setup(
@@ -200,14 +209,20 @@ class LeafWiseTreeTrainer(TreeTrainer):
         new_split_node_indices = [0]
 
         logging.debug("begin leaf wise training")
-        for leaf in range(self.params.max_leaf):
-            logging.debug(f"training leaf {leaf}.")
+        # each split adds one leaf, top gain candidates may be expanded together
+        leaf = 0
+        while leaf < self.params.max_leaf:
+            expand_num = min(
+                self.params.leaf_wise_expand_num, self.params.max_leaf - leaf
+            )
+            logging.debug(f"training leaf {leaf}, expanding {expand_num} nodes.")
             new_split_node_selects, new_split_node_indices = self._train_leaf(
                 new_split_node_selects,
                 new_split_node_indices,
-                leaf,
                 cur_tree_num,
+                leaf,
                 order_map_manager,
+                expand_num,
             )
             if reveal(
                 self.components.node_selector.is_list_empty(new_split_node_indices)
@@ -215,6 +230,8 @@ class LeafWiseTreeTrainer(TreeTrainer):
                 # pruned all nodes
                 logging.info("all node pruned.")
                 break
+            # new split node indices come in pairs of children
+            leaf += len(new_split_node_indices) // 2
 
         # leaf nodes: all split candidates that are not pruned, but with max leaf reached, will turn into leaves
         # label_holder calc weights
@@ -252,7 +269,8 @@ class LeafWiseTreeTrainer(TreeTrainer):
         Info include sample_selects, bucket_sums and max gains.
         Pruned candiates will not appear in split candidate managers.
 
-        new_split_node_indices: List[int]. has length 1 or 2. root or a pair of new split candidates from a splitted node.
+        new_split_node_indices: List[int]. the root, or pairs of new split candidates from the nodes splitted in the last round,
+            so it holds 1 or up to 2 * leaf_wise_expand_num entries.
         """
 
         # pick only one node to calculate bucket sum.
@@ -318,7 +336,13 @@ class LeafWiseTreeTrainer(TreeTrainer):
         tree_num: int,
         leaf: int,
         order_map_manager: OrderMapManager,
+        expand_num: int = 1,
     ) -> Tuple[PYUObject, PYUObject]:
+        """Evaluate new split candidates and split the expand_num best candidates.
+
+        All children of the expanded nodes are returned together,
+        so their bucket sums are computed in one round in the next call.
+        """
         # new split candidates will be added to split candidates
         # or pruned away if gain is not cost effective
         gain_is_cost_effective = self._preprare_new_split_candidates(
@@ -338,21 +362,25 @@ class LeafWiseTreeTrainer(TreeTrainer):
 
         if reveal(self.components.split_candidate_manager.is_no_candidate_left()):
             return [], []
-        # select the best candidate to do split
+        # select the best candidates to do split
         (
-            node_index,
+            node_indices,
             sample_selects,
-            split_bucket,
-        ) = self.components.split_candidate_manager.extract_best_split_info()
+            split_buckets,
+        ) = self.components.split_candidate_manager.extract_top_k_split_info(expand_num)
+        # shape of tree is public
+        split_node_indices = reveal(node_indices)
+        # extracted candidates are all cost effective
+        should_split = [True] * len(split_node_indices)
 
         # split not in party will be marked as -1
         split_buckets_viewed_each_party = (
-            self.components.split_tree_builder.split_bucket_to_partition([split_bucket])
+            self.components.split_tree_builder.split_bucket_to_partition(split_buckets)
         )
         # -1 will retains
         unmasked_split_buckets_viewed_each_party = (
             self.components.shuffler.unshuffle_split_buckets_with_keys(
-                split_buckets_viewed_each_party, [node_index]
+                split_buckets_viewed_each_party, node_indices
             )
         )
         split_feature_buckets_each_party = (
@@ -373,8 +401,8 @@ class LeafWiseTreeTrainer(TreeTrainer):
             split_feature_buckets_each_party,
             split_points,
             left_selects_each_party,
-            [True],
-            [node_index],
+            should_split,
+            split_node_indices,
             select_shape,
         )
         (
@@ -383,7 +411,7 @@ class LeafWiseTreeTrainer(TreeTrainer):
             _,
             _,
         ) = self.components.node_selector.get_child_select(
-            [sample_selects], lchild_ss, [True], [node_index]
+            sample_selects, lchild_ss, should_split, split_node_indices
         )
         # samples at each node indices and shape of tree are public
         return new_split_candidate_selects, reveal(new_split_candidate_indices)
@@ -22,7 +22,11 @@ from secretflow.data import FedNdarray
 from secretflow.data.split import train_test_split
 from secretflow.data.vertical import VDataFrame
 from secretflow.device import HEU
-from secretflow.ml.boost.core.callback import EarlyStopping, EvaluationMonitor
+from secretflow.ml.boost.core.callback import (
+    EarlyStopping,
+    EvaluationMonitor,
+    TuneReportCallback,
+)
 from secretflow.ml.boost.core.metric import METRICS
 from secretflow.ml.boost.sgb_v.core.params import (
     default_params,
@@ -48,6 +52,7 @@ class SGBFactoryParams:
     stopping_tolerance: float = 0.001
     seed: int = 1212
     save_best_model: bool = False
+    enable_tune_report: bool = False
 
 
 class SGBFactory:
@@ -87,6 +92,7 @@ class SGBFactory:
         self.factory_params.stopping_tolerance = params.get('stopping_tolerance', 0.001)
         self.factory_params.seed = params.get('seed', 1212)
         self.factory_params.save_best_model = params.get('save_best_model', False)
+        self.factory_params.enable_tune_report = params.get('enable_tune_report', False)
 
     def set_heu(self, heu: HEU):
         self.heu = heu
@@ -116,6 +122,10 @@ class SGBFactory:
         assert (
             0 < self.factory_params.validation_fraction < 1
         ), f"validation fraction msut be in (0,1), got {self.factory_params.validation_fraction}"
+        assert (
+            not self.factory_params.enable_tune_report
+            or self.factory_params.enable_early_stop
+        ), "enable_tune_report reports evaluation results on the validation split, which requires enable_early_stop"
 
         booster = GlobalOrdermapBooster(self.heu, tree_trainer)
         # this line rectifies any conflicts in default settting of components
@@ -172,6 +182,10 @@ class SGBFactory:
                 random_state=self.factory_params.seed,
             )
             assert val_label is not None
+            if self.factory_params.enable_tune_report:
+                # callbacks after the one stopping training are skipped, so the
+                # last round is reported before early stopping.
+                callbacks.append(TuneReportCallback())
             callbacks.append(
                 EarlyStopping(
                     self.factory_params.stopping_rounds,
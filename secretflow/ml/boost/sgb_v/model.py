@@ -26,7 +26,7 @@ from secretflow.ml.boost.core.data_preprocess import prepare_dataset
 from .core.distributed_tree.distributed_tree import DistributedTree
 from .core.distributed_tree.distributed_tree import from_dict as dt_from_dict
 from .core.params import RegType
-from .core.pure_numpy_ops.pred import sigmoid
+from .core.pure_numpy_ops.pred import sigmoid, softmax
 
 common_path_postfix = "/common.json"
 leaf_weight_postfix = "/leaf_weight.json"
@@ -42,7 +42,7 @@ class SgbModel:
         """
         Args:
             label_holder: PYU device, label holder's PYU device.
-            objective: RegType, specifies doing logistic regression or regression
+            objective: RegType, specifies doing logistic regression, regression or multi class classification
             base: float
         """
         self.label_holder = label_holder
@@ -81,6 +81,7 @@ class SgbModel:
 
         Return:
             Pred values store in pyu object or FedNdarray.
+            shape is (samples, 1), or (samples, num_class) class probabilities if objective is softmax.
         """
         if len(self.trees) == 0:
             return None
@@ -92,12 +93,14 @@ class SgbModel:
         for tree in self.trees:
             pred = self.label_holder(lambda x, y: jnp.add(x, y))(tree.predict(x), pred)
 
-        pred = self.label_holder(lambda x, y: jnp.add(x, y).reshape(-1, 1))(
-            pred, self.base
-        )
+        pred = self.label_holder(
+            lambda x, y: jnp.add(x, y).reshape(jnp.shape(x)[0], -1)
+        )(pred, self.base)
 
         if self.objective == RegType.Logistic:
             pred = self.label_holder(sigmoid)(pred)
+        elif self.objective == RegType.Softmax:
+            pred = self.label_holder(softmax)(pred)
 
         if to_pyu is not None:
             assert isinstance(to_pyu, PYU)
@@ -279,6 +279,35 @@ def predict_tree_weight(selects: List[np.ndarray], weights: np.ndarray) -> np.nd
     return jnp.matmul(select, weights).reshape((1, select.shape[0]))
 
 
+def predict_forest_weight(
+    selects: List[np.ndarray], weights: List[np.ndarray]
+) -> np.ndarray:
+    '''
+    get sum of preds of a list of trees.
+
+    Sum of each tree's select matmul weight equals
+    concatenated selects matmul concatenated weights,
+    so all trees are predicted in one matmul.
+
+    Args:
+        selects: concatenated leaf nodes' sample selects of all trees from each model handler.
+        weights: leaf weights of each tree in secure share.
+
+    Return:
+        pred
+    '''
+    select = selects[0]
+    for i in range(1, len(selects)):
+        select = select * selects[i]
+
+    weight = jnp.concatenate([w.reshape(-1) for w in weights])
+    assert (
+        select.shape[1] == weight.shape[0]
+    ), f"select {select.shape}, weights {weight.shape}"
+
+    return jnp.matmul(select, weight).reshape((1, select.shape[0]))
+
+
 def get_weight(
     sums: List[List[np.ndarray]],
     reg_lambda: float,
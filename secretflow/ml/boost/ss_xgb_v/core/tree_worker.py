@@ -48,6 +48,32 @@ class XgbTreeWorker:
         x = x if isinstance(x, np.ndarray) else np.array(x)
         return hnp.tree_predict(x, tree.split_features, tree.split_values)
 
+    def predict_forest_weight_select(
+        self, x: np.ndarray, trees: List[XgbTree]
+    ) -> np.ndarray:
+        '''
+        computer leaf nodes' sample selects known by this partition for a list of trees.
+
+        Args:
+            x: dataset from this partition.
+            trees: tree models store by this partition.
+
+        Return:
+            leaf nodes' selects of all trees, concatenated along leaves
+            in shape (samples, total leaves of trees).
+        '''
+        x = x if isinstance(x, np.ndarray) else np.array(x)
+        return np.concatenate(
+            [
+                np.asarray(
+                    hnp.tree_predict(x, tree.split_features, tree.split_values),
+                    dtype=np.int8,
+                )
+                for tree in trees
+            ],
+            axis=1,
+        )
+
     def _qcut(self, x: np.ndarray) -> Tuple[np.ndarray, List]:
         return qcut(x, self.buckets)
 
@@ -51,17 +51,21 @@ class XgbModel:
         # List[SPUObject of np.array], owned by spu and not reveal to any one
         self.weights = list()
 
-    def _tree_pred(self, tree: Dict[PYU, PYUObject], weight: SPUObject) -> SPUObject:
-        assert len(tree) == len(self.x)
+    def _forest_pred(
+        self, trees: List[Dict[PYU, PYUObject]], weights: List[SPUObject]
+    ) -> SPUObject:
+        for tree in trees:
+            assert len(tree) == len(self.x)
 
         weight_selects = list()
         for worker in self.workers:
             device = worker.device
-            assert device in tree
-            s = worker.predict_weight_select(self.x[device].data, tree[device])
+            s = worker.predict_forest_weight_select(
+                self.x[device].data, [tree[device] for tree in trees]
+            )
             weight_selects.append(s.to(self.spu))
 
-        pred = self.spu(split_fn.predict_tree_weight)(weight_selects, weight)
+        pred = self.spu(split_fn.predict_forest_weight)(weight_selects, weights)
 
         return pred
 
@@ -69,6 +73,7 @@ class XgbModel:
         self,
         dtrain: Union[FedNdarray, VDataFrame],
         to_pyu: PYU = None,
+        tree_batch_size: int = None,
     ) -> Union[SPUObject, FedNdarray]:
         """
         predict on dtrain with this model.
@@ -82,6 +87,11 @@ class XgbModel:
                 if not None predict result is reveal to to_pyu device and save as FedNdarray
                 otherwise, keep predict result in secret and save as SPUObject.
 
+            tree_batch_size: number of trees predicted in one spu program.
+                None means all trees at once. Each party sends one select matrix
+                of shape (samples, total leaves in batch) per batch,
+                so lower it if memory is tight for large datasets.
+
         Return:
             Pred values store in spu object or FedNdarray.
         """
@@ -93,10 +103,16 @@ class XgbModel:
         ), f"{len(x.partitions)}, {self.trees[0]}"
         self.workers = [Worker(0, device=pyu) for pyu in x.partitions]
         self.x = x.partitions
+        tree_num = len(self.trees)
+        if tree_batch_size is None:
+            tree_batch_size = tree_num
+        assert tree_batch_size > 0, f"tree_batch_size should > 0, got {tree_batch_size}"
         pred = 0
-        for idx in range(len(self.trees)):
+        for start in range(0, tree_num, tree_batch_size):
+            end = min(start + tree_batch_size, tree_num)
             pred = self.spu(lambda x, y: jnp.add(x, y))(
-                self._tree_pred(self.trees[idx], self.weights[idx]), pred
+                self._forest_pred(self.trees[start:end], self.weights[start:end]),
+                pred,
             )
 
         pred = self.spu(lambda x, y: jnp.add(x, y).reshape(-1, 1))(pred, self.base)
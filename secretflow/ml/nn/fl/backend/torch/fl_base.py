@@ -49,6 +49,8 @@ class BaseTorchModel(ABC):
         self.train_set = None
         self.eval_set = None
         self.skip_bn = skip_bn
+        # exchange weights as one contiguous buffer instead of a list per layer
+        self.flat_weights = kwargs.get("flat_weights", False)
         if random_seed is not None:
             torch.manual_seed(random_seed)
         assert builder_base is not None, "Builder_base cannot be none"
@@ -118,8 +120,9 @@ class BaseTorchModel(ABC):
         repeat_count=1,
         sampler_method="batch",
         stage="train",
+        prefetch_batches=0,
     ):
-        """build torch.dataloader
+        """build in-memory batch iterator
 
         Args:
             x: feature, FedNdArray or HDataFrame
@@ -131,6 +134,7 @@ class BaseTorchModel(ABC):
             random_seed: Prg seed for shuffling
             repeat_count: num of repeats
             sampler: method of sampler
+            prefetch_batches: num of batches prepared by a background thread
         """
         if x is None or len(x.shape) == 0:
             raise Exception("Data 'x' cannot be None")
@@ -151,6 +155,7 @@ class BaseTorchModel(ABC):
             shuffle,
             repeat_count,
             random_seed,
+            prefetch_batches,
         )
         if stage == "train":
             self.train_set = data_set
@@ -230,6 +235,8 @@ class BaseTorchModel(ABC):
         return int(rows_count(filename=filename)) - 1  # except header line
 
     def get_weights(self):
+        if self.flat_weights:
+            return self.model.get_weights_flat(skip_bn=self.skip_bn)
         if self.skip_bn:
             return self.model.get_weights_not_bn(return_numpy=True)
         else:
@@ -237,7 +244,9 @@ class BaseTorchModel(ABC):
 
     def set_weights(self, weights):
         """set weights of client model"""
-        if self.skip_bn:
+        if self.flat_weights:
+            self.model.update_weights_flat(weights, skip_bn=self.skip_bn)
+        elif self.skip_bn:
             self.model.update_weights_not_bn(weights)
         else:
             self.model.update_weights(weights)
@@ -411,6 +420,21 @@ class BaseTorchModel(ABC):
     def get_stop_training(self):
         return False  # is not supported
 
+    def _forward_backward(self, x, y, dp_strategy=None):
+        """Run forward and back propagation of one batch, gradients are clipped
+        and noised per sample if dp_strategy has gradient dp.
+
+        Returns:
+            loss and predictions of the batch.
+        """
+        gradient_dp = getattr(dp_strategy, 'gradient_dp', None)
+        if gradient_dp is not None:
+            return gradient_dp.backward(self.model, self.loss, x, y)
+        y_pred = self.model(x)
+        loss = self.loss(y_pred, y)
+        loss.backward()
+        return loss, y_pred
+
     @abstractmethod
     def train_step(self, weights, cur_steps, train_steps, **kwargs):
         pass
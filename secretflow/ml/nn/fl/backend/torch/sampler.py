@@ -22,11 +22,20 @@ import random
 
 import numpy as np
 import torch
-from torch.utils.data import DataLoader, TensorDataset
+
+from secretflow.ml.nn.utils import NumpyBatchLoader
 
 
 def batch_sampler(
-    x, y, s_w, sampling_rate, buffer_size, shuffle, repeat_count, random_seed
+    x,
+    y,
+    s_w,
+    sampling_rate,
+    buffer_size,
+    shuffle,
+    repeat_count,
+    random_seed,
+    prefetch_batches=0,
 ):
     """
     implementation of batch sampler
@@ -40,8 +49,9 @@ def batch_sampler(
         shuffle: A bool that indicates whether the input should be shuffled
         repeat_count: num of repeats
         random_seed: Prg seed for shuffling
+        prefetch_batches: num of batches prepared by a background thread
     Returns:
-        data_set: tf.data.Dataset
+        data_set: NumpyBatchLoader
     """
     batch_size = math.floor(x.shape[0] * sampling_rate)
     assert batch_size > 0, "Unvalid batch size"
@@ -50,17 +60,19 @@ def batch_sampler(
         torch.manual_seed(random_seed)  # set random seed for cpu
         torch.cuda.manual_seed(random_seed)  # set random seed for cuda
         torch.backends.cudnn.deterministic = True
-    data_list = [torch.Tensor((x.astype(np.float64)).copy())]
+    data_list = [x]
     if y is not None and len(y.shape) > 0:
-        data_list.append(torch.Tensor(y.copy()))
+        data_list.append(y)
     if s_w is not None and len(s_w.shape) > 0:
-        data_list.append(torch.Tensor(s_w.copy()))
-    dataset = TensorDataset(*data_list)
-    dataloader = DataLoader(
-        dataset=dataset,
+        data_list.append(s_w)
+    # torch.Tensor is float32, convert once and share memory afterwards
+    dataloader = NumpyBatchLoader(
+        *data_list,
         batch_size=batch_size,
         shuffle=shuffle,
-    )  # create dataloader
+        prefetch=prefetch_batches,
+        dtype=np.float32,
+    )
 
     return dataloader
 
@@ -92,6 +104,7 @@ def sampler_data(
     shuffle=False,
     repeat_count=1,
     random_seed=1234,
+    prefetch_batches=0,
 ):
     """
     do sample data by sampler_method
@@ -105,12 +118,21 @@ def sampler_data(
         shuffle: A bool that indicates whether the input should be shuffled
         repeat_count: num of repeats
         random_seed: Prg seed for shuffling
+        prefetch_batches: num of batches prepared by a background thread
     Returns:
-        data_set: tf.data.Dataset
+        data_set: NumpyBatchLoader
     """
     if sampler_method == "batch":
         data_set = batch_sampler(
-            x, y, s_w, sampling_rate, buffer_size, shuffle, repeat_count, random_seed
+            x,
+            y,
+            s_w,
+            sampling_rate,
+            buffer_size,
+            shuffle,
+            repeat_count,
+            random_seed,
+            prefetch_batches,
         )
     else:
         logging.error(f'Unvalid sampler {sampler_method} during building local dataset')
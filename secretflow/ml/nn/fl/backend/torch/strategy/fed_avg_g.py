@@ -69,11 +69,8 @@ class FedAvgG(BaseTorchModel):
 
             x, y, s_w = self.next_batch()
             num_sample += x.shape[0]
-            y_pred = self.model(x)
-
             # do back propagation
-            loss = self.loss(y_pred, y)
-            loss.backward()
+            loss, y_pred = self._forward_backward(x, y, dp_strategy)
             local_gradients = self.model.get_gradients()
 
             if local_gradients_sum is None:
@@ -32,6 +32,11 @@ class FedAvgU(BaseTorchModel):
     FedAvgG when using the SGD optimizer, but may not for other optimizers (e.g., Adam).
     """
 
+    def _add_updates(self, weights, updates):
+        if self.flat_weights:
+            return np.add(weights, updates)
+        return [np.add(w, u) for w, u in zip(weights, updates)]
+
     def train_step(
         self,
         updates: np.ndarray,
@@ -54,8 +59,7 @@ class FedAvgU(BaseTorchModel):
             self._reset_data_iter()
         dp_strategy = kwargs.get('dp_strategy', None)
         if updates is not None:
-            weights = [np.add(w, u) for w, u in zip(self.get_weights(), updates)]
-            self.set_weights(weights)
+            self.set_weights(self._add_updates(self.get_weights(), updates))
 
         num_sample = 0
         logs = {}
@@ -65,11 +69,8 @@ class FedAvgU(BaseTorchModel):
 
             x, y, s_w = self.next_batch()
             num_sample += x.shape[0]
-            y_pred = self.model(x)
-
             # do back propagation
-            loss = self.loss(y_pred, y)
-            loss.backward()
+            loss, y_pred = self._forward_backward(x, y, dp_strategy)
             self.optimizer.step()
             for m in self.metrics:
                 m.update(y_pred.cpu(), y.cpu())
@@ -79,15 +80,21 @@ class FedAvgU(BaseTorchModel):
         self.logs = self.transform_metrics(logs)
         self.epoch_logs = copy.deepcopy(self.logs)
 
-        client_updates = [
-            np.subtract(new_w, old_w)
-            for new_w, old_w in zip(self.get_weights(), model_weights)
-        ]
+        if self.flat_weights:
+            client_updates = np.subtract(self.get_weights(), model_weights)
+        else:
+            client_updates = [
+                np.subtract(new_w, old_w)
+                for new_w, old_w in zip(self.get_weights(), model_weights)
+            ]
 
         # DP operation
         if dp_strategy is not None:
             if dp_strategy.model_gdp is not None:
-                client_updates = dp_strategy.model_gdp(client_updates)
+                if self.flat_weights:
+                    client_updates = dp_strategy.model_gdp([client_updates])[0]
+                else:
+                    client_updates = dp_strategy.model_gdp(client_updates)
 
         return client_updates, num_sample
 
@@ -98,8 +105,7 @@ class FedAvgU(BaseTorchModel):
             updates: global updates from params server
         """
         if updates is not None:
-            weights = [np.add(w, u) for w, u in zip(self.get_weights(), updates)]
-            self.set_weights(weights)
+            self.set_weights(self._add_updates(self.get_weights(), updates))
 
 
 @register_strategy(strategy_name='fed_avg_u', backend='torch')
@@ -64,11 +64,8 @@ class FedAvgW(BaseTorchModel):
 
             x, y, s_w = self.next_batch()
             num_sample += x.shape[0]
-            y_pred = self.model(x)
-
             # do back propagation
-            loss = self.loss(y_pred, y)
-            loss.backward()
+            loss, y_pred = self._forward_backward(x, y, dp_strategy)
             self.optimizer.step()
             for m in self.metrics:
                 m.update(y_pred.cpu(), y.cpu())
@@ -79,12 +76,18 @@ class FedAvgW(BaseTorchModel):
         self.wrapped_metrics.extend(self.wrap_local_metrics())
         self.epoch_logs = copy.deepcopy(self.logs)
 
-        model_weights = self.model.get_weights(return_numpy=True)
+        if self.flat_weights:
+            model_weights = self.get_weights()
+        else:
+            model_weights = self.model.get_weights(return_numpy=True)
 
         # DP operation
         if dp_strategy is not None:
             if dp_strategy.model_gdp is not None:
-                model_weights = dp_strategy.model_gdp(model_weights)
+                if self.flat_weights:
+                    model_weights = dp_strategy.model_gdp([model_weights])[0]
+                else:
+                    model_weights = dp_strategy.model_gdp(model_weights)
 
         return model_weights, num_sample
 
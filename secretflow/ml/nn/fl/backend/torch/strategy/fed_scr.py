@@ -78,11 +78,8 @@ class FedSCR(BaseTorchModel):
 
             x, y, s_w = self.next_batch()
             num_sample += x.shape[0]
-            y_pred = self.model(x)
-
             # do back propagation
-            loss = self.loss(y_pred, y)
-            loss.backward()
+            loss, y_pred = self._forward_backward(x, y, dp_strategy)
             self.optimizer.step()
             for m in self.metrics:
                 m.update(y_pred.cpu(), y.cpu())
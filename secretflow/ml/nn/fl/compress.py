@@ -16,7 +16,9 @@
 # limitations under the License.
 
 
-from typing import List
+import math
+from dataclasses import dataclass
+from typing import List, Tuple, Union
 
 import numpy as np
 
@@ -24,6 +26,10 @@ from secretflow.utils.compressor import STCSparse
 
 COMPRESS_STRATEGY = ("fed_stc", "fed_scr")
 
+# strategies whose server broadcasts full weights, which change slowly between
+# aggregations and so can be sent as deltas.
+DELTA_BROADCAST_STRATEGY = ("fed_avg_w", "fed_prox", "fed_per")
+
 
 def stc_compress(compressor, server_weights, agg_updates, res):
     def _add(matrices_a: List, matrices_b: List):
@@ -55,3 +61,156 @@ def do_compress(
 
     else:
         return server_weights, updates, res
+
+
+@dataclass
+class SparseDelta:
+    """Delta of one array, kept nonzeros are stored in ascending flat order.
+
+    Positions are either int32 flat indices (csr of the flattened row) or a
+    packed bitmap, whichever is smaller. Both empty means values is dense.
+    """
+
+    shape: Tuple[int, ...]
+    values: np.ndarray
+    indices: np.ndarray = None
+    bitmap: np.ndarray = None
+
+    def to_dense(self) -> np.ndarray:
+        if self.indices is None and self.bitmap is None:
+            return self.values.reshape(self.shape)
+        size = math.prod(self.shape)
+        dense = np.zeros(size, dtype=self.values.dtype)
+        if self.bitmap is not None:
+            dense[np.unpackbits(self.bitmap, count=size).astype(bool)] = self.values
+        else:
+            dense[self.indices] = self.values
+        return dense.reshape(self.shape)
+
+
+@dataclass
+class DeltaPayload:
+    """Deltas to apply on top of the receiver's copy of version `base_version`."""
+
+    base_version: int
+    version: int
+    deltas: List[SparseDelta]
+    is_list: bool
+
+
+@dataclass
+class DeltaBase:
+    """Last broadcast weights a client holds, mirrored on the server."""
+
+    version: int
+    weights: Union[List[np.ndarray], np.ndarray]
+
+
+def sparsify_delta(
+    delta: np.ndarray, topk_ratio: float = None, threshold: float = None
+) -> SparseDelta:
+    """Keep the largest entries of delta by magnitude.
+
+    Args:
+        delta: difference between the new weights and the receiver's copy.
+        topk_ratio: ratio of entries to keep, None means no top-k limit.
+        threshold: entries with magnitude not above threshold are dropped,
+            None means no threshold.
+    """
+    flat = delta.reshape(-1)
+    magnitude = np.abs(flat)
+    if threshold is not None:
+        keep = np.flatnonzero(magnitude > threshold)
+    else:
+        keep = np.arange(flat.size)
+    if topk_ratio is not None:
+        k = min(math.ceil(topk_ratio * flat.size), keep.size)
+        if k == 0:
+            keep = keep[:0]
+        elif k < keep.size:
+            keep = keep[np.argpartition(magnitude[keep], -k)[-k:]]
+    if keep.size == flat.size:
+        return SparseDelta(delta.shape, flat.copy())
+    keep = np.sort(keep).astype(np.int32)
+    values = flat[keep]
+    # 4 bytes per int32 index vs 1 bit per entry.
+    if flat.size < 32 * keep.size:
+        mask = np.zeros(flat.size, dtype=bool)
+        mask[keep] = True
+        return SparseDelta(delta.shape, values, bitmap=np.packbits(mask))
+    return SparseDelta(delta.shape, values, indices=keep)
+
+
+def _apply_deltas(
+    base: DeltaBase, payload: DeltaPayload
+) -> Union[List[np.ndarray], np.ndarray]:
+    if payload.base_version == 0:
+        weights = [d.to_dense() for d in payload.deltas]
+    else:
+        base_weights = base.weights if payload.is_list else [base.weights]
+        weights = [w + d.to_dense() for w, d in zip(base_weights, payload.deltas)]
+    return weights if payload.is_list else weights[0]
+
+
+def delta_encode(
+    weights: Union[List[np.ndarray], np.ndarray],
+    base: DeltaBase,
+    version: int,
+    topk_ratio: float = None,
+    threshold: float = None,
+) -> Tuple[DeltaPayload, DeltaBase]:
+    """Encode weights as sparse deltas relative to the receiver's last copy.
+
+    Runs on the sender, which keeps a mirror of what the receiver holds. Since
+    the mirror is updated with the sparsified deltas, entries dropped this
+    time are carried over into the next delta.
+
+    Args:
+        weights: weights to broadcast.
+        base: mirror of the receiver's copy, None sends the weights dense.
+        version: version of the weights to broadcast.
+        topk_ratio: see `sparsify_delta`.
+        threshold: see `sparsify_delta`.
+
+    Returns:
+        the payload to send and the updated mirror.
+    """
+    is_list = isinstance(weights, (list, tuple))
+    arrays = list(weights) if is_list else [weights]
+    if base is None:
+        payload = DeltaPayload(
+            0, version, [SparseDelta(w.shape, w.reshape(-1)) for w in arrays], is_list
+        )
+    else:
+        base_weights = base.weights if is_list else [base.weights]
+        assert len(base_weights) == len(
+            arrays
+        ), f'Weights have {len(arrays)} arrays but base has {len(base_weights)}.'
+        deltas = [
+            sparsify_delta(
+                (w - b).astype(w.dtype, copy=False),
+                topk_ratio=topk_ratio,
+                threshold=threshold,
+            )
+            for w, b in zip(arrays, base_weights)
+        ]
+        payload = DeltaPayload(base.version, version, deltas, is_list)
+    return payload, DeltaBase(version, _apply_deltas(base, payload))
+
+
+def delta_decode(
+    payload: DeltaPayload, base: DeltaBase
+) -> Tuple[Union[List[np.ndarray], np.ndarray], DeltaBase]:
+    """Rebuild broadcast weights on the receiver.
+
+    Returns:
+        the weights and the new copy to decode the next payload against.
+    """
+    base_version = 0 if base is None else base.version
+    if payload.base_version != 0 and payload.base_version != base_version:
+        raise RuntimeError(
+            f'Delta is based on version {payload.base_version}, '
+            f'but local copy is version {base_version}.'
+        )
+    weights = _apply_deltas(base, payload)
+    return weights, DeltaBase(payload.version, weights)
@@ -31,7 +31,13 @@ from secretflow.data.ndarray import FedNdarray
 from secretflow.device import PYU, reveal, wait
 from secretflow.device.device.pyu import PYUObject
 from secretflow.ml.nn.callbacks.callbacklist import CallbackList
-from secretflow.ml.nn.fl.compress import COMPRESS_STRATEGY, do_compress
+from secretflow.ml.nn.fl.compress import (
+    COMPRESS_STRATEGY,
+    DELTA_BROADCAST_STRATEGY,
+    delta_decode,
+    delta_encode,
+    do_compress,
+)
 from secretflow.ml.nn.fl.strategy_dispatcher import dispatch_strategy
 from secretflow.ml.nn.metrics import Metric, aggregate_metrics
 from secretflow.utils.compressor import sparse_encode
@@ -65,6 +71,13 @@ class FLModel:
             server_agg_method: If aggregator is none, server will use server_agg_method to aggregate params, The server_agg_method should be a function
                 that takes in a list of parameter values from different parties and returns the aggregated parameter value list
             skip_bn: Whether to skip batch normalization layers when aggregate models
+            flat_weights: Only for torch 'fed_avg_w' and 'fed_avg_u' strategies, exchange weights as one contiguous float32 buffer
+                instead of a list of per-layer arrays, so aggregation and dp noise work on a single array. It is incompatible with
+                compression strategies (fed_stc, fed_scr), which are rejected when flat_weights is set
+            delta_broadcast: Only for 'fed_avg_w', 'fed_prox' and 'fed_per' strategies, send aggregated weights to each device as sparse
+                deltas against the copy it received last time, entries dropped by sparsification are carried over into later deltas
+            delta_topk_ratio: Ratio of entries of each layer kept in a delta, None keeps all entries above delta_threshold
+            delta_threshold: Delta entries with magnitude not above it are dropped, None means no threshold
         """
         if backend == "tensorflow":
             import secretflow.ml.nn.fl.backend.tensorflow.strategy  # noqa
@@ -73,6 +86,34 @@ class FLModel:
         else:
             raise Exception(f"Invalid backend = {backend}")
         self.num_gpus = kwargs.get('num_gpus', 0)
+        flat_weights = kwargs.pop('flat_weights', False)
+        self.delta_broadcast = kwargs.pop('delta_broadcast', False)
+        self.delta_topk_ratio = kwargs.pop('delta_topk_ratio', None)
+        self.delta_threshold = kwargs.pop('delta_threshold', None)
+        if self.delta_broadcast and strategy not in DELTA_BROADCAST_STRATEGY:
+            raise Exception(
+                f"delta_broadcast only supports {DELTA_BROADCAST_STRATEGY}, got {strategy}"
+            )
+        if self.delta_topk_ratio is not None:
+            assert (
+                0 <= self.delta_topk_ratio <= 1
+            ), f'delta_topk_ratio should between 0 and 1, but get {self.delta_topk_ratio}'
+        if flat_weights and (
+            backend != "torch" or strategy not in ('fed_avg_w', 'fed_avg_u')
+        ):
+            raise Exception(
+                f"flat_weights only supports torch fed_avg_w and fed_avg_u, got {backend} {strategy}"
+            )
+        gradient_dp = getattr(kwargs.get('dp_strategy', None), 'gradient_dp', None)
+        if gradient_dp is not None and (
+            backend != "torch"
+            or strategy
+            not in ('fed_avg_w', 'fed_avg_u', 'fed_avg_g', 'fed_stc', 'fed_scr')
+        ):
+            raise Exception(
+                f"gradient_dp only supports torch fed_avg_w, fed_avg_u, fed_avg_g, "
+                f"fed_stc and fed_scr, got {backend} {strategy}"
+            )
         self.init_workers(
             model,
             device_list=device_list,
@@ -81,6 +122,7 @@ class FLModel:
             random_seed=random_seed,
             num_gpus=self.num_gpus,
             skip_bn=skip_bn,
+            flat_weights=flat_weights,
         )
         self.server = server
         self.device_list = device_list
@@ -93,6 +135,11 @@ class FLModel:
         self.dp_strategy = kwargs.get('dp_strategy', None)
         self.simulation = kwargs.get('simulation', False)
         self.server_agg_method = kwargs.get('server_agg_method', None)
+        # per device version of the last broadcast weights and the copies of
+        # them held by the device and mirrored by the sender.
+        self._delta_versions: Dict[PYU, int] = {}
+        self._client_delta_bases: Dict[PYU, PYUObject] = {}
+        self._server_delta_bases: Dict[PYU, PYUObject] = {}
 
     def init_workers(
         self,
@@ -103,6 +150,7 @@ class FLModel:
         random_seed,
         num_gpus,
         skip_bn,
+        flat_weights=False,
     ):
         self._workers = {
             device: dispatch_strategy(
@@ -113,10 +161,50 @@ class FLModel:
                 random_seed=random_seed,
                 num_gpus=num_gpus,
                 skip_bn=skip_bn,
+                flat_weights=flat_weights,
             )
             for device in device_list
         }
 
+    def _delta_broadcast(self, params_list: List[PYUObject]) -> List[PYUObject]:
+        """Send params to each device as sparse deltas and rebuild them there.
+        Params not held by a PYU are sent in full.
+
+        Returns:
+            rebuilt params, one on each device of device_list.
+        """
+        results = []
+        for device, params in zip(self.device_list, params_list):
+            sender = params.device
+            if not isinstance(sender, PYU):
+                # e.g. weights averaged by SPUAggregator are secret shared, and
+                # deltas can only be encoded on plaintext weights, so they are
+                # broadcast in full and the next delta starts over.
+                self._delta_versions.pop(device, None)
+                self._client_delta_bases.pop(device, None)
+                self._server_delta_bases.pop(device, None)
+                results.append(params.to(device))
+                continue
+            server_base = self._server_delta_bases.get(device)
+            if server_base is not None:
+                server_base = server_base.to(sender)
+            version = self._delta_versions.get(device, 0) + 1
+            payload, self._server_delta_bases[device] = sender(
+                delta_encode, num_returns=2
+            )(
+                params,
+                server_base,
+                version,
+                topk_ratio=self.delta_topk_ratio,
+                threshold=self.delta_threshold,
+            )
+            weights, self._client_delta_bases[device] = device(
+                delta_decode, num_returns=2
+            )(payload.to(device), self._client_delta_bases.get(device))
+            self._delta_versions[device] = version
+            results.append(weights)
+        return results
+
     def initialize_weights(self):
         clients_weights = []
         initial_weight = None
@@ -522,12 +610,6 @@ class FLModel:
                                 self.device_list,
                             ),
                         )(model_params_list)
-                        model_params_list = [
-                            params.to(device)
-                            for device, params in zip(
-                                self.device_list, model_params_list
-                            )
-                        ]
                     else:
                         raise Exception(
                             "Aggregation can be on either an aggregator or a server, but not none at the same time"
@@ -571,6 +653,9 @@ class FLModel:
                     res = []
                 if self._aggregator is not None:
                     model_params_list = [model_params for _ in self.device_list]
+                if self.delta_broadcast:
+                    model_params_list = self._delta_broadcast(model_params_list)
+                else:
                     model_params_list = [
                         params.to(device)
                         for device, params in zip(self.device_list, model_params_list)
@@ -27,6 +27,12 @@ import pandas as pd
 import tensorflow as tf
 
 from secretflow.ml.nn.metrics import AUC, Mean, Precision, Recall
+from secretflow.ml.nn.sl.backend.tensorflow.transport import (
+    ErrorFeedback,
+    check_transport_precision,
+    pack_tensors,
+    unpack_tensors,
+)
 from secretflow.ml.nn.sl.base import SLBaseModel
 from secretflow.ml.nn.sl.strategy_dispatcher import register_strategy
 from secretflow.security.privacy import DPStrategy
@@ -48,6 +54,15 @@ class SLBaseTFModel(SLBaseModel):
             self.dp_strategy.embedding_dp if dp_strategy is not None else None
         )
         self.label_dp = self.dp_strategy.label_dp if dp_strategy is not None else None
+        # precision of hiddens and gradients sent to other parties, None means as is.
+        self.transport_precision = kwargs.get("transport_precision", None)
+        check_transport_precision(self.transport_precision)
+        self.gradient_error_feedback = (
+            ErrorFeedback(self.transport_precision)
+            if self.transport_precision is not None
+            and kwargs.get("transport_error_feedback", False)
+            else None
+        )
 
         self.train_set = None
         self.eval_set = None
@@ -404,10 +419,12 @@ class SLBaseTFModel(SLBaseModel):
         self._pre_train_y = []
 
     def get_gradient(self, gradient):
-        self._gradient = gradient
+        self._gradient = unpack_tensors(gradient)
 
     def set_gradient(self):
-        return self._gradient
+        if self.gradient_error_feedback is not None:
+            return self.gradient_error_feedback.pack(self._gradient)
+        return pack_tensors(self._gradient, self.transport_precision)
 
     def get_batch_data(self, stage="train", epoch=1):
         self.cur_epoch = epoch
@@ -465,9 +482,48 @@ class SLBaseTFModel(SLBaseModel):
             forward_data.hidden = [tf.stop_gradient(h) for h in self._h]
         else:
             raise RuntimeError(f"Unknown type of self._h {type(self._h)}")
+        forward_data.hidden = pack_tensors(
+            forward_data.hidden, self.transport_precision
+        )
         # The compressor can only recognize np type but not tensor.
         return forward_data
 
+    def base_forward_block(self, steps: int) -> Optional[ForwardData]:
+        """Run base model over several eval batches in one call.
+
+        Hiddens, labels and sample weights of the batches are concatenated, so
+        the label party can evaluate or predict them as one large batch.
+
+        Args:
+            steps: number of eval batches to consume.
+        Returns:
+            packed forward data of concatenated hiddens, None if no base model.
+        """
+
+        def _concat(parts):
+            if parts[0] is None:
+                return None
+            return tf.nest.map_structure(lambda *xs: tf.concat(xs, axis=0), *parts)
+
+        hiddens, ys, sample_weights = [], [], []
+        for _ in range(steps):
+            self.get_batch_data(stage="eval")
+            if self.model_base:
+                data_x = (
+                    self._data_x[0]
+                    if isinstance(self._data_x, Tuple) and len(self._data_x) == 1
+                    else self._data_x
+                )
+                hiddens.append(self._base_forward_internal(data_x, training=False))
+            ys.append(self.eval_y)
+            sample_weights.append(self.eval_sample_weight)
+        self.eval_y = _concat(ys)
+        self.eval_sample_weight = _concat(sample_weights)
+        if not self.model_base:
+            return None
+        self._h = _concat(hiddens)
+        return self.pack_forward_data()
+
     def fuse_net(
         self,
         forward_data: Union[List[ForwardData], ForwardData],
@@ -497,7 +553,7 @@ class SLBaseTFModel(SLBaseModel):
         hiddens = []
 
         for fd in forward_data:
-            h = fd.hidden
+            h = unpack_tensors(fd.hidden)
             # h will be list, if basenet is multi output
             if isinstance(h, List):
                 for i in range(len(h)):
@@ -580,7 +636,7 @@ class SLBaseTFModel(SLBaseModel):
                 h.losses = None
         # get reg losses:
         losses = [h.losses for h in forward_data if h.losses is not None]
-        hidden_features = [h.hidden for h in forward_data]
+        hidden_features = [unpack_tensors(h.hidden) for h in forward_data]
         hiddens = []
         for h in hidden_features:
             if isinstance(h, List):
@@ -751,7 +807,7 @@ class SLBaseTFModel(SLBaseModel):
             assert h.hidden is not None, f"hidden cannot be found in forward_data[{i}]"
             if isinstance(h.losses, List) and h.losses[0] is None:
                 h.losses = None
-        hidden_features = [h.hidden for h in forward_data]
+        hidden_features = [unpack_tensors(h.hidden) for h in forward_data]
 
         hiddens = []
         for h in hidden_features:
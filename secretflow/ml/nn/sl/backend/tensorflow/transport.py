@@ -0,0 +1,97 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reduced precision transport of hiddens and gradients for tensorflow split learning.
+
+Tensors are cast with tensorflow ops only, int8 uses a symmetric scale per channel
+(the last dimension), so no numpy round trip is involved.
+"""
+from typing import Dict, List, Union
+
+import tensorflow as tf
+
+from secretflow.utils.communicate import PackedTensor
+
+TRANSPORT_PRECISIONS = ('fp16', 'bf16', 'int8')
+
+_FLOAT_TYPES = {'fp16': tf.float16, 'bf16': tf.bfloat16}
+
+
+def check_transport_precision(precision: str):
+    if precision is not None and precision not in TRANSPORT_PRECISIONS:
+        raise ValueError(
+            f"transport_precision should be one of {TRANSPORT_PRECISIONS}, got {precision}"
+        )
+
+
+def pack_tensor(t: tf.Tensor, precision: str) -> PackedTensor:
+    if precision in _FLOAT_TYPES:
+        return PackedTensor(data=tf.cast(t, _FLOAT_TYPES[precision]), dtype=t.dtype)
+    # int8 with per channel scale
+    rank = len(t.shape)
+    axis = list(range(rank - 1)) if rank >= 2 else None
+    amax = tf.reduce_max(tf.abs(t), axis=axis, keepdims=rank >= 2)
+    scale = tf.where(amax > 0, amax / 127.0, tf.ones_like(amax))
+    data = tf.cast(tf.clip_by_value(tf.round(t / scale), -127, 127), tf.int8)
+    return PackedTensor(data=data, scale=scale, dtype=t.dtype)
+
+
+def unpack_tensor(p: PackedTensor) -> tf.Tensor:
+    if p.scale is None:
+        return tf.cast(p.data, p.dtype)
+    return tf.cast(p.data, p.dtype) * p.scale
+
+
+def pack_tensors(
+    x: Union[tf.Tensor, List[tf.Tensor]], precision: str
+) -> Union[PackedTensor, List[PackedTensor]]:
+    if precision is None or x is None:
+        return x
+    if isinstance(x, (list, tuple)):
+        return [pack_tensor(t, precision) for t in x]
+    return pack_tensor(x, precision)
+
+
+def unpack_tensors(x):
+    """unpack PackedTensor or list of them, other data is returned as is."""
+    if isinstance(x, PackedTensor):
+        return unpack_tensor(x)
+    if isinstance(x, (list, tuple)):
+        return [unpack_tensor(t) if isinstance(t, PackedTensor) else t for t in x]
+    return x
+
+
+class ErrorFeedback:
+    """Carry quantization error of each gradient slot over to the next step."""
+
+    def __init__(self, precision: str):
+        self.precision = precision
+        self.residuals: Dict[int, tf.Tensor] = {}
+
+    def pack(
+        self, x: Union[tf.Tensor, List[tf.Tensor]]
+    ) -> Union[PackedTensor, List[PackedTensor]]:
+        if x is None:
+            return x
+        is_list = isinstance(x, (list, tuple))
+        packed = []
+        for i, t in enumerate(x if is_list else [x]):
+            residual = self.residuals.get(i)
+            # batch size may change at the end of an epoch
+            if residual is not None and residual.shape == t.shape:
+                t = t + residual
+            p = pack_tensor(t, self.precision)
+            self.residuals[i] = t - unpack_tensor(p)
+            packed.append(p)
+        return packed if is_list else packed[0]
@@ -21,12 +21,17 @@ import jax.tree_util
 import numpy as np
 import pandas as pd
 import torch
-import torch.utils.data as torch_data
 import torchmetrics
 
 from secretflow.ml.nn.metrics import AUC, Mean, Precision, Recall
+from secretflow.ml.nn.sl.backend.torch.transport import (
+    ErrorFeedback,
+    check_transport_precision,
+    pack_tensors,
+    unpack_tensors,
+)
 from secretflow.ml.nn.sl.base import SLBaseModel
-from secretflow.ml.nn.utils import TorchModel
+from secretflow.ml.nn.utils import NumpyBatchLoader, TorchModel
 from secretflow.security.privacy import DPStrategy
 from secretflow.utils.communicate import ForwardData
 
@@ -61,6 +66,15 @@ class SLBaseTorchModel(SLBaseModel, ABC):
             self.dp_strategy.embedding_dp if dp_strategy is not None else None
         )
         self.label_dp = self.dp_strategy.label_dp if dp_strategy is not None else None
+        # precision of hiddens and gradients sent to other parties, None means as is.
+        self.transport_precision = kwargs.get("transport_precision", None)
+        check_transport_precision(self.transport_precision)
+        self.gradient_error_feedback = (
+            ErrorFeedback(self.transport_precision)
+            if self.transport_precision is not None
+            and kwargs.get("transport_error_feedback", False)
+            else None
+        )
 
         self.train_set = None
         self.eval_set = None
@@ -164,10 +178,12 @@ class SLBaseTorchModel(SLBaseModel, ABC):
             return 0
 
     def get_gradient(self, gradient):
-        self._gradient = gradient
+        self._gradient = unpack_tensors(gradient)
 
     def set_gradient(self):
-        return self._gradient
+        if self.gradient_error_feedback is not None:
+            return self.gradient_error_feedback.pack(self._gradient)
+        return pack_tensors(self._gradient, self.transport_precision)
 
     def pack_forward_data(self):
         if not self.model_base:
@@ -179,8 +195,43 @@ class SLBaseTorchModel(SLBaseModel, ABC):
             forward_data.hidden = [h.detach() for h in self._h]
         else:
             raise RuntimeError(f"Unknown type of self._h {type(self._h)}")
+        forward_data.hidden = pack_tensors(
+            forward_data.hidden, self.transport_precision
+        )
         return forward_data
 
+    def base_forward_block(self, steps: int) -> Optional[ForwardData]:
+        """Run base model over several eval batches in one call.
+
+        Hiddens, labels and sample weights of the batches are concatenated, so
+        the label party can evaluate or predict them as one large batch.
+
+        Args:
+            steps: number of eval batches to consume.
+        Returns:
+            packed forward data of concatenated hiddens, None if no base model.
+        """
+
+        def _concat(parts):
+            if parts[0] is None:
+                return None
+            return jax.tree_util.tree_map(lambda *xs: torch.cat(xs), *parts)
+
+        hiddens, ys, sample_weights = [], [], []
+        with torch.no_grad():
+            for _ in range(steps):
+                self.get_batch_data(stage="eval")
+                if self.model_base:
+                    hiddens.append(self.base_forward_internal(self._data_x))
+                ys.append(self.eval_y)
+                sample_weights.append(self.eval_sample_weight)
+        self.eval_y = _concat(ys)
+        self.eval_sample_weight = _concat(sample_weights)
+        if not self.model_base:
+            return None
+        self._h = _concat(hiddens)
+        return self.pack_forward_data()
+
     def unpack_dataset(self, data, has_x, has_y, has_s_w):
         data_x, data_y, data_s_w = None, None, None
         # case: only has x or has y, and s_w is none
@@ -268,8 +319,9 @@ class SLBaseTorchModel(SLBaseModel, ABC):
         repeat_count=1,
         stage="train",
         random_seed=1234,
+        prefetch_batches=0,
     ):
-        """build torch.data.Dataset
+        """build in-memory batch iterator
 
         Args:
             x: feature, FedNdArray or HDataFrame.
@@ -281,6 +333,7 @@ class SLBaseTorchModel(SLBaseModel, ABC):
             repeat_count: num of repeats.
             stage: stage of this datset.
             random_seed: Prg seed for shuffling.
+            prefetch_batches: num of batches prepared by a background thread.
         """
         assert (
             x is not None or y is not None
@@ -310,16 +363,16 @@ class SLBaseTorchModel(SLBaseModel, ABC):
                     has_s_w = True
                     data_tuple.append(s_w)
 
-        # convert pandas.DataFrame to torch.tensor
+        # convert pandas.DataFrame to numpy, tensors share memory with them
         data_tuple = [
             t.values if isinstance(t, pd.DataFrame) else t for t in data_tuple
         ]
-        x_copy = [torch.tensor(t.copy()) for t in data_tuple]
-        data_set = torch_data.TensorDataset(*x_copy)
-        dataloader = torch_data.DataLoader(
-            dataset=data_set,
-            shuffle=shuffle,
+        dataloader = NumpyBatchLoader(
+            *data_tuple,
             batch_size=batch_size,
+            shuffle=shuffle,
+            prefetch=prefetch_batches,
+            pin_memory=self.use_gpu,
         )
 
         self.set_dataset_stage(
@@ -622,7 +675,7 @@ class SLBaseTorchModel(SLBaseModel, ABC):
             forward_data = [forward_data]
         forward_data[:] = (h for h in forward_data if h is not None)
 
-        hidden_features = [h.hidden for h in forward_data]
+        hidden_features = [unpack_tensors(h.hidden) for h in forward_data]
 
         hiddens = []
 
@@ -728,7 +781,7 @@ class SLBaseTorchModel(SLBaseModel, ABC):
             forward_data = [forward_data]
         forward_data[:] = (h for h in forward_data if h is not None)
 
-        hidden_features = [h.hidden for h in forward_data]
+        hidden_features = [unpack_tensors(h.hidden) for h in forward_data]
 
         hiddens = []
         for h in hidden_features:
@@ -21,6 +21,7 @@ from typing import Callable, List, Optional, Union
 import torch
 
 from secretflow.ml.nn.sl.backend.torch.sl_base import SLBaseTorchModel
+from secretflow.ml.nn.sl.backend.torch.transport import unpack_tensors
 from secretflow.ml.nn.sl.strategy_dispatcher import register_strategy
 from secretflow.ml.nn.utils import TorchModel
 from secretflow.security.privacy import DPStrategy
@@ -169,7 +170,7 @@ class PipelineTorchModel(SLBaseTorchModel):
             if isinstance(h.losses, List) and h.losses[0] is None:
                 h.losses = None
 
-        hidden_features = [h.hidden for h in forward_data]
+        hidden_features = [unpack_tensors(h.hidden) for h in forward_data]
 
         hiddens = []
         for h in hidden_features:
@@ -22,6 +22,7 @@ from typing import List, Union
 import torch
 
 from secretflow.ml.nn.sl.backend.torch.sl_base import SLBaseTorchModel
+from secretflow.ml.nn.sl.backend.torch.transport import unpack_tensors
 from secretflow.ml.nn.sl.strategy_dispatcher import register_strategy
 from secretflow.utils.communicate import ForwardData
 
@@ -103,7 +104,7 @@ class SLTorchModel(SLBaseTorchModel):
 
         hiddens = []
         for fd in forward_data:
-            h = fd.hidden
+            h = unpack_tensors(fd.hidden)
             # h will be list, if basenet is multi output
             if isinstance(h, List):
                 for i in range(len(h)):
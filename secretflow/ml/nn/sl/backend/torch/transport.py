@@ -0,0 +1,98 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reduced precision transport of hiddens and gradients for torch split learning.
+
+Tensors are cast with torch ops only, int8 uses a symmetric scale per channel
+(the last dimension), so no numpy round trip is involved.
+"""
+from typing import Dict, List, Union
+
+import torch
+
+from secretflow.utils.communicate import PackedTensor
+
+TRANSPORT_PRECISIONS = ('fp16', 'bf16', 'int8')
+
+_FLOAT_TYPES = {'fp16': torch.float16, 'bf16': torch.bfloat16}
+
+
+def check_transport_precision(precision: str):
+    if precision is not None and precision not in TRANSPORT_PRECISIONS:
+        raise ValueError(
+            f"transport_precision should be one of {TRANSPORT_PRECISIONS}, got {precision}"
+        )
+
+
+def pack_tensor(t: torch.Tensor, precision: str) -> PackedTensor:
+    if precision in _FLOAT_TYPES:
+        return PackedTensor(data=t.to(_FLOAT_TYPES[precision]), dtype=t.dtype)
+    # int8 with per channel scale
+    if t.dim() >= 2:
+        amax = t.abs().amax(dim=tuple(range(t.dim() - 1)), keepdim=True)
+    else:
+        amax = t.abs().max()
+    scale = torch.where(amax > 0, amax / 127.0, torch.ones_like(amax))
+    data = torch.round(t / scale).clamp_(-127, 127).to(torch.int8)
+    return PackedTensor(data=data, scale=scale, dtype=t.dtype)
+
+
+def unpack_tensor(p: PackedTensor) -> torch.Tensor:
+    if p.scale is None:
+        return p.data.to(p.dtype)
+    return p.data.to(p.dtype) * p.scale
+
+
+def pack_tensors(
+    x: Union[torch.Tensor, List[torch.Tensor]], precision: str
+) -> Union[PackedTensor, List[PackedTensor]]:
+    if precision is None or x is None:
+        return x
+    if isinstance(x, (list, tuple)):
+        return [pack_tensor(t, precision) for t in x]
+    return pack_tensor(x, precision)
+
+
+def unpack_tensors(x):
+    """unpack PackedTensor or list of them, other data is returned as is."""
+    if isinstance(x, PackedTensor):
+        return unpack_tensor(x)
+    if isinstance(x, (list, tuple)):
+        return [unpack_tensor(t) if isinstance(t, PackedTensor) else t for t in x]
+    return x
+
+
+class ErrorFeedback:
+    """Carry quantization error of each gradient slot over to the next step."""
+
+    def __init__(self, precision: str):
+        self.precision = precision
+        self.residuals: Dict[int, torch.Tensor] = {}
+
+    def pack(
+        self, x: Union[torch.Tensor, List[torch.Tensor]]
+    ) -> Union[PackedTensor, List[PackedTensor]]:
+        if x is None:
+            return x
+        is_list = isinstance(x, (list, tuple))
+        packed = []
+        for i, t in enumerate(x if is_list else [x]):
+            residual = self.residuals.get(i)
+            # batch size may change at the end of an epoch
+            if residual is not None and residual.shape == t.shape:
+                t = t + residual
+            p = pack_tensor(t, self.precision)
+            self.residuals[i] = t - unpack_tensor(p)
+            packed.append(p)
+        return packed if is_list else packed[0]
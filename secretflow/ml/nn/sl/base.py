@@ -12,17 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
+from secretflow.ml.nn.sl.predict_sink import PredictionSink
 from secretflow.utils.communicate import ForwardData
 
 
 class SLBaseModel(ABC):
     def __init__(self):
-        pass
+        self._predict_sink: PredictionSink = None
 
     @abstractmethod
     def base_forward(self, stage: str = 'train', **kwargs):
@@ -164,3 +165,37 @@ class SLBaseModel(ABC):
     @abstractmethod
     def get_skip_gradient(self):
         pass
+
+    def open_predict_sink(
+        self, path: str, file_format: str = 'csv', pred_name: str = 'pred'
+    ):
+        """Open a file to which `predict_to_sink` appends predictions."""
+        self._predict_sink = PredictionSink(path, file_format, pred_name)
+
+    def _check_predict_sink(self):
+        if self._predict_sink is None:
+            raise RuntimeError(
+                'Prediction sink is not opened, call open_predict_sink first.'
+            )
+
+    def predict_to_sink(
+        self,
+        forward_data: Union[List[ForwardData], ForwardData],
+    ) -> int:
+        """Predict one batch and append it to the sink instead of returning it.
+
+        Returns:
+            number of rows written.
+        """
+        self._check_predict_sink()
+        return self._predict_sink.write(self.predict(forward_data))
+
+    def close_predict_sink(self) -> Dict:
+        """Close the sink.
+
+        Returns:
+            file metadata, see `PredictionSink.close`.
+        """
+        self._check_predict_sink()
+        sink, self._predict_sink = self._predict_sink, None
+        return sink.close()
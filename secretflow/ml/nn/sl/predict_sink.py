@@ -0,0 +1,136 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SINK_FORMATS = ('csv', 'arrow', 'parquet')
+
+
+def _to_numpy(y_pred) -> np.ndarray:
+    if isinstance(y_pred, (list, tuple)):
+        raise ValueError(
+            f'Prediction sink only supports models with one output, '
+            f'got {len(y_pred)} outputs.'
+        )
+    if hasattr(y_pred, 'detach'):
+        # torch tensor
+        y_pred = y_pred.detach().cpu()
+    if hasattr(y_pred, 'numpy'):
+        y_pred = y_pred.numpy()
+    return np.asarray(y_pred)
+
+
+class PredictionSink:
+    """Appends batch predictions to a local file as they are produced.
+
+    Only the writer's buffer is held in memory, so the number of rows that can
+    be predicted is bounded by disk instead of memory.
+    """
+
+    def __init__(self, path: str, file_format: str = 'csv', pred_name: str = 'pred'):
+        """
+        Args:
+            path: output file path.
+            file_format: one of 'csv', 'arrow' (ipc file) and 'parquet'.
+            pred_name: column name of predictions, columns are named
+                `{pred_name}_{i}` when predictions have more than one column.
+        """
+        if file_format not in SINK_FORMATS:
+            raise ValueError(
+                f'file_format should be one of {SINK_FORMATS}, got {file_format}'
+            )
+        dir_name = os.path.dirname(path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        self.path = path
+        self.file_format = file_format
+        self.pred_name = pred_name
+        self.columns: List[str] = None
+        self.num_rows = 0
+        self.num_batches = 0
+        self._file = open(path, 'w') if file_format == 'csv' else None
+        self._writer = None
+
+    def _open(self, num_cols: int):
+        if num_cols == 1:
+            self.columns = [self.pred_name]
+        else:
+            self.columns = [f'{self.pred_name}_{i}' for i in range(num_cols)]
+        if self.file_format == 'csv':
+            self._file.write(','.join(self.columns) + '\n')
+        else:
+            self._file = pa.OSFile(self.path, 'wb')
+
+    def _write_table(self, table: pa.Table):
+        if self._writer is None:
+            if self.file_format == 'arrow':
+                self._writer = pa.ipc.new_file(self._file, table.schema)
+            else:
+                self._writer = pq.ParquetWriter(self._file, table.schema)
+        self._writer.write_table(table)
+
+    def write(self, y_pred) -> int:
+        """Write predictions of one batch.
+
+        Returns:
+            number of rows written.
+        """
+        y = _to_numpy(y_pred)
+        y = y.reshape(len(y), -1)
+        if self.columns is None:
+            self._open(y.shape[1])
+        assert y.shape[1] == len(
+            self.columns
+        ), f'Predictions have {y.shape[1]} columns, expected {len(self.columns)}.'
+        if self.file_format == 'csv':
+            pd.DataFrame(y).to_csv(self._file, header=False, index=False)
+        else:
+            table = pa.table({c: y[:, i] for i, c in enumerate(self.columns)})
+            self._write_table(table)
+        self.num_rows += len(y)
+        self.num_batches += 1
+        return len(y)
+
+    def close(self) -> Dict:
+        """Flush and close the file. If nothing is written, the file still
+        holds a header or schema of one float32 column named pred_name.
+
+        Returns:
+            file metadata: path, format, columns, num_rows and num_batches.
+        """
+        if self.columns is None:
+            self._open(1)
+            if self.file_format != 'csv':
+                self._write_table(
+                    pa.table({self.pred_name: pa.array([], type=pa.float32())})
+                )
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return {
+            'path': self.path,
+            'format': self.file_format,
+            'columns': self.columns,
+            'num_rows': self.num_rows,
+            'num_batches': self.num_batches,
+        }
@@ -36,6 +36,7 @@ from secretflow.ml.nn.sl.agglayer.agg_method import AggMethod
 from secretflow.ml.nn.sl.base import SLBaseModel
 from secretflow.ml.nn.sl.strategy_dispatcher import dispatch_strategy
 from secretflow.security.privacy import DPStrategy
+from secretflow.utils.errors import InvalidArgumentError
 from secretflow.utils.random import global_random
 
 
@@ -72,6 +73,8 @@ class SLModel:
             max_fuse_local_steps: Only for 'split_state_async' strategy, Maximum number of rounds for fuse local update in splitStateAS strategy?
             compressor: Define strategy tensor compression algorithms to speed up transmission.
             device_agg: The party do aggregation, it can be a PYU, SPU, etc.
+            transport_precision: Precision of hiddens and gradients sent between parties, one of fp16, bf16 and int8 (per channel scale), default None keeps the original precision. Only works without agg_method and compressor.
+            transport_error_feedback: Whether to carry quantization error of gradients over to the next step when transport_precision is set.
             **kwargs: For custom strategies.
         """
 
@@ -82,6 +85,12 @@ class SLModel:
         self.compressor = kwargs.pop('compressor', None)
         self.base_model_dict = base_model_dict
         self.backend = backend
+        if kwargs.get('transport_precision', None) is not None and (
+            agg_method is not None or self.compressor is not None
+        ):
+            raise InvalidArgumentError(
+                "transport_precision can not be used together with agg_method or compressor"
+            )
         self.num_parties = len(base_model_dict)
         self.agglayer = AggLayer(
             device_agg=self.device_agg if self.device_agg else self.device_y,
@@ -702,6 +711,10 @@ class SLModel:
         verbose=0,
         dataset_builder: Callable[[List], Tuple[int, Iterable]] = None,
         callbacks=None,
+        output_path: str = None,
+        output_format: str = 'csv',
+        pred_name: str = 'pred',
+        inference_block_steps: int = 1,
     ):
         """Vertical split learning offline prediction interface
 
@@ -717,11 +730,24 @@ class SLModel:
             dataset_builder: Callable function, its input is `x` or `[x, y]` if y is set, it should return
               steps_per_epoch and iterable dataset. Dataset builder is mainly for building graph dataset.
             callbacks: List of `keras.callbacks.Callback` instances.
+            output_path: If set, predictions are written batch by batch to this file on device_y instead of
+              being returned, so neither device_y nor the driver holds all of them.
+            output_format: File format of output_path, one of 'csv', 'arrow' and 'parquet'.
+            pred_name: Column name of predictions in output_path.
+            inference_block_steps: Number of batches each party runs through its base model in one remote call,
+              the label party predicts their concatenated hiddens at once. Values above 1 reduce round trips.
+
+        Returns:
+            A list of PYUObjects of batch predictions on device_y, or a PYUObject of file metadata
+            (path, format, columns, num_rows, num_batches) when output_path is set.
         """
 
         assert (
             isinstance(batch_size, int) and batch_size > 0
         ), f"batch_size should be integer > 0"
+        assert (
+            isinstance(inference_block_steps, int) and inference_block_steps > 0
+        ), f"inference_block_steps should be integer > 0"
         if isinstance(x, Dict):
             predict_steps = self.handle_file(
                 x,
@@ -756,43 +782,63 @@ class SLModel:
         res = []
         callbacks.on_predict_begin()
         [worker.reset_data_iter(stage="eval") for worker in self._workers.values()]
-        for step in range(0, predict_steps):
+        if output_path is not None:
+            self._workers[self.device_y].open_predict_sink(
+                output_path, output_format, pred_name
+            )
+        for step in range(0, predict_steps, inference_block_steps):
             callbacks.on_predict_batch_begin(step)
             forward_data_dict = {}
 
-            [
-                worker.get_batch_data(stage="eval", epoch=0)
-                for device, worker in self._workers.items()
-                if device in self.base_model_dict
-            ]
+            if inference_block_steps > 1:
+                block_steps = min(inference_block_steps, predict_steps - step)
+                callbacks.on_base_forward_begin()
+                for device, worker in self._workers.items():
+                    if device not in self.base_model_dict:
+                        continue
+                    forward_data_dict[device] = worker.base_forward_block(block_steps)
+                callbacks.on_base_forward_end()
+            else:
+                block_steps = 1
+                [
+                    worker.get_batch_data(stage="eval", epoch=0)
+                    for device, worker in self._workers.items()
+                    if device in self.base_model_dict
+                ]
 
-            callbacks.on_base_forward_begin()
-            # 1. Local calculation of basenet
-            [
-                worker.base_forward()
-                for device, worker in self._workers.items()
-                if device in self.base_model_dict
-            ]
-            callbacks.on_base_forward_end()
+                callbacks.on_base_forward_begin()
+                # 1. Local calculation of basenet
+                [
+                    worker.base_forward()
+                    for device, worker in self._workers.items()
+                    if device in self.base_model_dict
+                ]
+                callbacks.on_base_forward_end()
 
-            for device, worker in self._workers.items():
-                if device not in self.base_model_dict:
-                    continue
-                f_data = worker.pack_forward_data()
-                forward_data_dict[device] = f_data
+                for device, worker in self._workers.items():
+                    if device not in self.base_model_dict:
+                        continue
+                    f_data = worker.pack_forward_data()
+                    forward_data_dict[device] = f_data
             callbacks.on_agglayer_forward_begin(forward_data_dict)
             agg_hiddens = self.agglayer.forward(forward_data_dict)
 
-            y_pred = self._workers[self.device_y].predict(agg_hiddens)
-            result.append(y_pred)
+            if output_path is not None:
+                # only row counts come back, predictions stay in the sink.
+                y_pred = self._workers[self.device_y].predict_to_sink(agg_hiddens)
+            else:
+                y_pred = self._workers[self.device_y].predict(agg_hiddens)
+                result.append(y_pred)
 
-            callbacks.on_predict_batch_end(batch=step)
+            callbacks.on_predict_batch_end(batch=step + block_steps - 1)
             res.append(y_pred)
             if len(res) == wait_steps:
                 wait(res)
                 res = []
         wait(res)
         callbacks.on_predict_end()
+        if output_path is not None:
+            return self._workers[self.device_y].close_predict_sink()
         return result
 
     @reveal
@@ -810,6 +856,7 @@ class SLModel:
         dataset_builder: Dict = None,
         random_seed: int = None,
         callbacks=None,
+        inference_block_steps: int = 1,
     ):
         """Vertical split learning evaluate interface
 
@@ -829,6 +876,9 @@ class SLModel:
             dataset_builder: Callable function, its input is `x` or `[x, y]` if y is set, it should return dataset.
             random_seed: Seed for prgs, will only affect shuffle
             callbacks: List of `secretflow.ml.nn.callbacks.Callback` instances.
+            inference_block_steps: Number of batches each party runs through its base model in one remote call,
+                the label party evaluates their concatenated hiddens at once. Values above 1 reduce round trips,
+                metrics are the same while the returned loss is the one of the last block.
         Returns:
             metrics: federate evaluate result
         """
@@ -836,6 +886,9 @@ class SLModel:
         assert (
             isinstance(batch_size, int) and batch_size > 0
         ), f"batch_size should be integer > 0"
+        assert (
+            isinstance(inference_block_steps, int) and inference_block_steps > 0
+        ), f"inference_block_steps should be integer > 0"
 
         if random_seed is None:
             random_seed = global_random(self.device_y, 100000)
@@ -864,30 +917,38 @@ class SLModel:
         callbacks.on_test_begin()
         [worker.reset_data_iter(stage="eval") for worker in self._workers.values()]
         wait_steps = min(min(self.get_cpus()) * 2, 100)
-        for step in range(0, evaluate_steps):
+        for block, step in enumerate(range(0, evaluate_steps, inference_block_steps)):
             callbacks.on_test_batch_begin(step)
             f_datas = {}  # driver端
 
-            [
-                worker.get_batch_data(stage="eval", epoch=0)
-                for device, worker in self._workers.items()
-            ]
+            if inference_block_steps > 1:
+                block_steps = min(inference_block_steps, evaluate_steps - step)
+                callbacks.on_base_forward_begin()
+                for device, worker in self._workers.items():
+                    f_datas[device] = worker.base_forward_block(block_steps)
+                callbacks.on_base_forward_end()
+            else:
+                block_steps = 1
+                [
+                    worker.get_batch_data(stage="eval", epoch=0)
+                    for device, worker in self._workers.items()
+                ]
 
-            callbacks.on_base_forward_begin()
-            # 1. Local calculation of basenet
-            [worker.base_forward() for device, worker in self._workers.items()]
-            callbacks.on_base_forward_end()
+                callbacks.on_base_forward_begin()
+                # 1. Local calculation of basenet
+                [worker.base_forward() for device, worker in self._workers.items()]
+                callbacks.on_base_forward_end()
 
-            for device, worker in self._workers.items():
-                f_data = worker.pack_forward_data()
-                f_datas[device] = f_data
+                for device, worker in self._workers.items():
+                    f_data = worker.pack_forward_data()
+                    f_datas[device] = f_data
 
             agg_hiddens = self.agglayer.forward(f_datas)
 
             metrics = self._workers[self.device_y].evaluate(agg_hiddens)
-            if (step + 1) % wait_steps == 0:
+            if (block + 1) % wait_steps == 0:
                 wait(metrics)
-            callbacks.on_test_batch_end(batch=step)
+            callbacks.on_test_batch_end(batch=step + block_steps - 1)
 
         callbacks.on_test_end(metrics)
         return metrics
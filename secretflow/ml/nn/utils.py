@@ -16,8 +16,11 @@
 # limitations under the License.
 
 
+import math
+import queue
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import torch
@@ -56,6 +59,28 @@ class BaseModule(ABC, nn.Module):
 
         self.load_state_dict(weights_dict, strict=False)
 
+    def _flat_layout(self, skip_bn: bool) -> 'FlatParamsLayout':
+        layouts = self.__dict__.setdefault('_flat_layouts', {})
+        if skip_bn not in layouts:
+            keys = [
+                k
+                for k in self.state_dict().keys()
+                if not (
+                    skip_bn and isinstance(getattr(self, k.split('.')[0]), _BatchNorm)
+                )
+            ]
+            layouts[skip_bn] = FlatParamsLayout(self.state_dict(), keys)
+        return layouts[skip_bn]
+
+    def get_weights_flat(self, skip_bn=False) -> np.ndarray:
+        """all weights in one contiguous float32 buffer, see FlatParamsLayout."""
+        return self._flat_layout(skip_bn).flatten(self.state_dict())
+
+    def update_weights_flat(self, weights: np.ndarray, skip_bn=False):
+        self.load_state_dict(
+            self._flat_layout(skip_bn).unflatten(weights), strict=not skip_bn
+        )
+
     def get_weights(self, return_numpy=False):
         if not return_numpy:
             return {k: v.cpu() for k, v in self.state_dict().items()}
@@ -94,6 +119,46 @@ class BaseModule(ABC, nn.Module):
                 p.grad = tensor_g.to(p.device)
 
 
+class FlatParamsLayout:
+    """Static layout of weights packed in one contiguous buffer.
+
+    Weights are exchanged as float32, the same as update_weights which loads
+    them through torch.Tensor.
+
+    Args:
+        state_dict: state dict to take shapes from.
+        keys: keys of state_dict packed into the buffer, in order.
+    """
+
+    def __init__(self, state_dict: Dict[str, torch.Tensor], keys: List[str]):
+        self.keys = list(keys)
+        self.shapes = [tuple(state_dict[k].shape) for k in self.keys]
+        self.sizes = [int(np.prod(shape)) for shape in self.shapes]
+        self.size = sum(self.sizes)
+
+    def flatten(self, state_dict: Dict[str, torch.Tensor]) -> np.ndarray:
+        if not self.keys:
+            return np.zeros(0, dtype=np.float32)
+        flat = torch.cat(
+            [state_dict[k].detach().reshape(-1).to(torch.float32) for k in self.keys]
+        )
+        return flat.cpu().numpy()
+
+    def unflatten(self, weights: np.ndarray) -> Dict[str, torch.Tensor]:
+        weights = np.asarray(weights, dtype=np.float32)
+        assert weights.shape == (
+            self.size,
+        ), f"flat weights should have shape ({self.size},), got {weights.shape}"
+        # load_state_dict copies, so the views never outlive this call.
+        flat = torch.from_numpy(weights)
+        return {
+            k: v.reshape(shape)
+            for k, v, shape in zip(
+                self.keys, torch.split(flat, self.sizes), self.shapes
+            )
+        }
+
+
 class TorchModel:
     def __init__(
         self,
@@ -110,6 +175,111 @@ class TorchModel:
         self.kwargs = kwargs
 
 
+class NumpyBatchLoader:
+    """In-memory batch iterator over numpy arrays, a light DataLoader replacement.
+
+    Arrays are wrapped with torch.from_numpy without copying when they are
+    already contiguous with the wanted dtype. Batches are sliced as views, or
+    gathered with one index_select per array when shuffled, instead of
+    collating samples one by one.
+
+    Shuffling draws a permutation from the global torch generator in each
+    __iter__, so parties seeded alike get the same order.
+
+    Args:
+        arrays: arrays with the same number of rows.
+        batch_size: number of samples per batch.
+        shuffle: whether to shuffle samples in each epoch.
+        prefetch: number of batches prepared ahead by a background thread,
+            0 means no background thread.
+        pin_memory: whether to pin batches when cuda is available.
+        dtype: convert arrays to this numpy dtype first, keep their dtype if None.
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        *arrays: np.ndarray,
+        batch_size: int,
+        shuffle: bool = False,
+        prefetch: int = 0,
+        pin_memory: bool = False,
+        dtype: Optional[np.dtype] = None,
+    ):
+        assert len(arrays) > 0, "at least one array is required"
+        assert batch_size > 0, f"batch_size should be positive, got {batch_size}"
+        assert prefetch >= 0, f"prefetch should be non-negative, got {prefetch}"
+        self.tensors = [
+            torch.from_numpy(np.ascontiguousarray(a, dtype=dtype)) for a in arrays
+        ]
+        self.n_samples = self.tensors[0].shape[0]
+        assert all(
+            t.shape[0] == self.n_samples for t in self.tensors
+        ), "all arrays should have the same number of rows"
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = prefetch
+        self.pin_memory = pin_memory and torch.cuda.is_available()
+
+    def __len__(self):
+        return math.ceil(self.n_samples / self.batch_size)
+
+    def _batches(self, perm):
+        for start in range(0, self.n_samples, self.batch_size):
+            end = min(start + self.batch_size, self.n_samples)
+            if perm is None:
+                batch = [t[start:end] for t in self.tensors]
+            else:
+                idx = perm[start:end]
+                batch = [t.index_select(0, idx) for t in self.tensors]
+            if self.pin_memory:
+                batch = [t.pin_memory() for t in batch]
+            yield batch
+
+    def _prefetched(self, batches):
+        buffer = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for batch in batches:
+                    if not put(batch):
+                        return
+                put(self._END)
+            except Exception as e:
+                put(e)
+
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is self._END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # stop the producer if the consumer leaves early
+            stop.set()
+
+    def __iter__(self):
+        perm = torch.randperm(self.n_samples) if self.shuffle else None
+        batches = self._batches(perm)
+        if self.prefetch > 0:
+            return self._prefetched(batches)
+        return batches
+
+
 def metric_wrapper(func, *args, **kwargs):
     def wrapped_func():
         return func(*args, **kwargs)
@@ -41,6 +41,11 @@ class HomoBinning(HomoBinningBase):
         allow_duplicate: whether to allow duplicate bucket values
         aggregator:  to aggregate values with aggregator
         max_iter: max iteration round
+        use_sketch: each party builds a mergeable quantile summary in one pass,
+            summaries are merged by the first party to get split points in a
+            single round. Rank error is bounded by error * total count, but
+            the first party sees compressed summaries of the others instead of
+            only aggregated ranks.
     """
 
     def __init__(
@@ -55,6 +60,7 @@ class HomoBinning(HomoBinningBase):
         allow_duplicate: bool = False,
         max_iter: int = 10,
         aggregator=None,
+        use_sketch: bool = False,
     ):
         self.bin_num = bin_num
         self.compress_thres = compress_thres
@@ -65,6 +71,7 @@ class HomoBinning(HomoBinningBase):
         self.abnormal_list = abnormal_list
         self.allow_duplicate = allow_duplicate
         self.max_iter = max_iter
+        self.use_sketch = use_sketch
 
         self._total_count = 0
         self._missing_counts = 0
@@ -100,6 +107,8 @@ class HomoBinning(HomoBinningBase):
         if hdata is None:
             raise ValueError("Input data connot be none")
         logging.debug(f"abnormal_list: {self.abnormal_list}")
+        if self.use_sketch:
+            return self._fit_split_points_by_sketch(hdata)
 
         bin_results = {}
         header = hdata.columns
@@ -171,6 +180,34 @@ class HomoBinning(HomoBinningBase):
         ]
         return bin_results[0]
 
+    def _fit_split_points_by_sketch(self, hdata: HDataFrame):
+        assert 0 < self.error < 1, f"error should be in (0, 1), got {self.error}"
+        self._init_binning_worker(hdata)
+        new_header = [str(h) for h in hdata.columns]
+        (
+            self.bin_names,
+            self.bin_indexes,
+            self.bin_idx_name,
+            self.col_name_maps,
+        ) = self.setup_header_param(
+            header=new_header, bin_names=self.bin_names, bin_indexes=self.bin_indexes
+        )
+        summary_dicts = {}
+        for device, worker in self._workers.items():
+            worker.set_header_param(
+                self.bin_names, self.bin_indexes, self.bin_idx_name, self.col_name_maps
+            )
+            summary_dicts[device] = worker.cal_sketch_dict(
+                hdata.partitions[device].data
+            )
+        merge_device, merge_worker = next(iter(self._workers.items()))
+        others = [
+            summary_dict.to(merge_device)
+            for device, summary_dict in summary_dicts.items()
+            if device != merge_device
+        ]
+        return merge_worker.merge_sketch_bin_result(others)
+
     def setup_header_param(
         self, header: List[str], bin_names: List[str], bin_indexes: List[int]
     ) -> (List[str], List[int], Dict[int, str], Dict[int, str]):
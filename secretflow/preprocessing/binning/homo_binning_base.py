@@ -160,6 +160,39 @@ class HomoBinningBase(BaseBinning):
         )
         return self.summary_dict
 
+    def cal_sketch_dict(self, data):
+        self.summary_dict = QuantileBinning.feature_sketch(
+            data,
+            head_size=self.head_size,
+            error=self.error,
+            bin_dict=self.bin_idx_name,
+            abnormal_list=self.abnormal_list,
+        )
+        return self.summary_dict
+
+    def merge_sketch_bin_result(
+        self, summary_dicts: List[Dict[str, QuantileSummaries]]
+    ) -> Dict[str, List[float]]:
+        """Merge summaries of other parties into local ones and query equal
+        frequency split points, which finishes binning in a single round.
+
+        Args:
+            summary_dicts: summaries of other parties, built by cal_sketch_dict.
+        """
+        quantiles = np.linspace(0, 1, self.bin_num + 1)[1:]
+        self.query_points_dict = {}
+        for col in self.bin_names:
+            summary = self.summary_dict[col]
+            for summary_dict in summary_dicts:
+                summary = summary.merge(summary_dict[col])
+            self.missing_dict[col] = summary.missing_count
+            values = summary.batch_query_quantile(quantiles)
+            self.query_points_dict[col] = [
+                SplitPointNode(v, values[0], values[-1], error=self.error, fixed=True)
+                for v in values
+            ]
+        return self.get_bin_result()
+
     def init_query_points(
         self,
         split_num: int,
@@ -153,3 +153,35 @@ class QuantileBinning(BaseBinning):
             result[features_name] = summary_obj
 
         return result
+
+    @staticmethod
+    def feature_sketch(
+        data_frame: pd.DataFrame,
+        head_size: int,
+        error: float,
+        bin_dict: Dict[str, int],
+        abnormal_list: List[str],
+    ) -> Dict:
+        """
+        calculate mergeable summary in one streaming pass of head_size rows
+
+        Args:
+            data_frame: pandas.DataFrame, input data
+            head_size: int, rows inserted into summaries at a time
+            error: float, error tolerance
+            bin_dict: a dict store col name to index
+            abnormal_list: list of anomaly features
+        """
+        summary_dict = {
+            bin_name: QuantileSummaries(
+                head_size=head_size, error=error, abnormal_list=abnormal_list
+            )
+            for bin_name in bin_dict.values()
+        }
+        for start in range(0, len(data_frame), head_size):
+            chunk = data_frame.iloc[start : start + head_size]
+            for col_name, summary in summary_dict.items():
+                summary.insert(chunk[col_name].to_numpy())
+        for summary in summary_dict.values():
+            summary.compress()
+        return summary_dict
@@ -45,6 +45,11 @@ class QuantileSummaries(object):
         fast_init: A fast version implementation creates the summary with little performance loss
         compress: compress summary to some size
 
+    Summaries built by insert are mergeable: every sample satisfies
+    w + delta <= 2 * error * count, which holds after merge too, so a query on
+    merged summaries of several parties is within error * count ranks of the
+    exact answer on their union.
+
     Attributes:
         compress_thres: if num of stats greater than compress_thres, do compress
         head_size: buffer size for insert data, when samples come to head_size do create summary
@@ -98,8 +103,119 @@ class QuantileSummaries(object):
         if len(self.sampled) >= self.compress_thres:
             self.compress()
 
+    def insert(self, values: np.ndarray):
+        """insert a batch of values, buffered in head until head_size values.
+
+        NaN values are counted as missing and values in abnormal_list are
+        skipped. Memory is bounded by head_size plus O(1 / error) samples.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        nan_mask = np.isnan(values)
+        self.missing_count += int(nan_mask.sum())
+        values = values[~nan_mask]
+        for ab_item in self.abnormal_list:
+            values = values[values != ab_item]
+        if values.size == 0:
+            return
+        self.head_sampled.append(values)
+        if sum(len(h) for h in self.head_sampled) >= self.head_size:
+            self._flush_head()
+
+    def _flush_head(self):
+        if not self.head_sampled:
+            return
+        sorted_data = np.sort(np.concatenate(self.head_sampled))
+        self.head_sampled = []
+        n = len(sorted_data)
+        # exact ranks of every stride-th value, w <= 2 * error * n.
+        stride = max(int(2 * self.error * n), 1)
+        pos = np.arange(stride - 1, n, stride)
+        pos = np.unique(np.concatenate([[0], pos, [n - 1]]))
+        ws = np.diff(pos, prepend=-1)
+        head = QuantileSummaries(
+            self.compress_thres, self.head_size, self.error, self.abnormal_list
+        )
+        head.sampled = [
+            Stats(float(v), int(w), 0) for v, w in zip(sorted_data[pos], ws)
+        ]
+        head.count = n
+        merged = self.merge(head)
+        self.sampled = merged.sampled
+        self.count = merged.count
+
+    def merge(self, other: 'QuantileSummaries') -> 'QuantileSummaries':
+        """merge two summaries into a new one, error is the max of both.
+
+        Samples of one summary get the rank uncertainty of the other added to
+        delta, except those ahead of all samples of the other.
+        """
+        self._flush_head()
+        other._flush_head()
+        res = QuantileSummaries(
+            self.compress_thres,
+            self.head_size,
+            max(self.error, other.error),
+            self.abnormal_list,
+        )
+        res.missing_count = self.missing_count + other.missing_count
+        res.count = self.count + other.count
+        if not self.sampled or not other.sampled:
+            src = self.sampled or other.sampled
+            res.sampled = [Stats(s.value, s.w, s.delta) for s in src]
+            return res
+
+        self_delta = math.floor(2 * other.error * other.count)
+        other_delta = math.floor(2 * self.error * self.count)
+        merged = []
+        i, j = 0, 0
+        while i < len(self.sampled) and j < len(other.sampled):
+            if self.sampled[i].value < other.sampled[j].value:
+                s, extra = self.sampled[i], self_delta if j > 0 else 0
+                i += 1
+            else:
+                s, extra = other.sampled[j], other_delta if i > 0 else 0
+                j += 1
+            merged.append(Stats(s.value, s.w, s.delta + extra))
+        merged.extend(Stats(s.value, s.w, s.delta) for s in self.sampled[i:])
+        merged.extend(Stats(s.value, s.w, s.delta) for s in other.sampled[j:])
+        res.sampled = merged
+        res.compress()
+        return res
+
+    def batch_query_quantile(self, quantiles: List[float]) -> List[float]:
+        """query values of several quantiles in one pass.
+
+        The first sample whose rank interval is within error * count of the
+        target rank is returned, which exists when every sample satisfies
+        w + delta <= 2 * error * count. Otherwise the sample whose rank interval
+        center is nearest to the target is returned.
+
+        Args:
+            quantiles : List of float in [0.0, 1.0]
+        Returns:
+            List : value of each quantile
+        """
+        self._flush_head()
+        quantiles = np.asarray(quantiles, dtype=float)
+        if np.any(quantiles < 0) or np.any(quantiles > 1):
+            raise ValueError("Quantile should be in range [0.0, 1.0]")
+        if self.count == 0:
+            return [0] * len(quantiles)
+        min_ranks = np.cumsum([s.w for s in self.sampled])
+        max_ranks = min_ranks + np.array([s.delta for s in self.sampled])
+        ranks = np.maximum(np.ceil(quantiles * self.count), 1)[:, None]
+        # ranks are integers, so floor keeps the guarantee.
+        target_error = math.floor(self.error * self.count)
+        within = (max_ranks - target_error <= ranks) & (
+            ranks <= min_ranks + target_error
+        )
+        nearest = np.abs((min_ranks + max_ranks) / 2 - ranks).argmin(axis=1)
+        idx = np.where(within.any(axis=1), within.argmax(axis=1), nearest)
+        return [self.sampled[i].value for i in idx]
+
     def compress(self):
         """compress the summary, summary.sample will under compress_thres"""
+        self._flush_head()
         merge_threshold = 2 * self.error * self.count
         compressed = self._compress_immut(merge_threshold)
         self.sampled = compressed
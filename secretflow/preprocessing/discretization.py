@@ -24,12 +24,40 @@ from secretflow.data.vertical import VDataFrame
 from secretflow.device.driver import reveal
 from secretflow.preprocessing.base import _PreprocessBase
 from secretflow.preprocessing.binning.homo_binning import HomoBinning
+from secretflow.preprocessing.binning.kernels.quantile_binning import QuantileBinning
 from secretflow.security.aggregation import Aggregator
 from secretflow.security.compare import Comparator
 
 _STRATEGIES = ['uniform', 'quantile']
 
 
+def _sketch_discretizer(
+    n_bins: int, encode: str, strategy: str, error: float, df: pd.DataFrame
+) -> SkKBinsDiscretizer:
+    """Fit quantile bin edges from mergeable summaries built in one streaming
+    pass instead of sorting every column."""
+    summaries = QuantileBinning.feature_sketch(
+        df,
+        head_size=10000,
+        error=error,
+        bin_dict=dict(enumerate(df.columns)),
+        abnormal_list=[],
+    )
+    quantiles = np.linspace(0, 1, n_bins + 1)
+    bin_edges = np.zeros(len(df.columns), dtype=object)
+    n_bins_ = np.zeros(len(df.columns), dtype=int)
+    for i, col in enumerate(df.columns):
+        edges = np.array(summaries[col].batch_query_quantile(quantiles))
+        # remove bins whose width are too small, same as sklearn.
+        edges = edges[np.ediff1d(edges, to_begin=np.inf) > 1e-8]
+        bin_edges[i] = edges
+        n_bins_[i] = len(edges) - 1
+    discretizer = SkKBinsDiscretizer(n_bins=n_bins, encode=encode, strategy=strategy)
+    discretizer.bin_edges_ = bin_edges
+    discretizer.n_bins_ = n_bins_
+    return discretizer
+
+
 class KBinsDiscretizer(_PreprocessBase):
     """Bin continuous data into intervals.
 
@@ -63,6 +91,7 @@ class KBinsDiscretizer(_PreprocessBase):
         compress_thres: int = None,
         error: float = None,
         max_iter: int = None,
+        use_sketch: bool = False,
     ):
         assert df.aggregator is not None, 'HDataFrame should provide a aggregator.'
         binner = HomoBinning(
@@ -70,6 +99,7 @@ class KBinsDiscretizer(_PreprocessBase):
             compress_thres=compress_thres,
             error=error,
             max_iter=max_iter,
+            use_sketch=use_sketch,
         )
         result = reveal(binner.fit_split_points(df))
         discretizer = SkKBinsDiscretizer(
@@ -93,8 +123,9 @@ class KBinsDiscretizer(_PreprocessBase):
         aggregator: Aggregator = None,
         comparator: Comparator = None,
         compress_thres: int = 10000,
-        error: float = 1e04,
+        error: float = 1e-4,
         max_iter: int = 200,
+        use_sketch: bool = False,
     ) -> 'KBinsDiscretizer':
         """Fit the estimator.
 
@@ -105,6 +136,9 @@ class KBinsDiscretizer(_PreprocessBase):
             compress_thres: optional; the compress threshold of :py:class:`~secretflow.preprocessing.binning.homo_binning.HomoBinning`.
             error: optional; the error of :py:class:`~secretflow.preprocessing.binning.homo_binning.HomoBinning`.
             max_iter: optional; the max iterations of :py:class:`~secretflow.preprocessing.binning.homo_binning.HomoBinning`.
+            use_sketch: optional; compute quantiles from mergeable summaries built in one streaming pass,
+                horizontal data is binned in a single round with rank error bounded by `error`, see
+                :py:class:`~secretflow.preprocessing.binning.homo_binning.HomoBinning`.
 
         Returns:
             the instance itself.
@@ -126,8 +160,22 @@ class KBinsDiscretizer(_PreprocessBase):
             # Quantile binning.
             if isinstance(df, HDataFrame):
                 self._discretizer = self._fit_hdf(
-                    df, compress_thres=compress_thres, error=error, max_iter=max_iter
+                    df,
+                    compress_thres=compress_thres,
+                    error=error,
+                    max_iter=max_iter,
+                    use_sketch=use_sketch,
                 )
+            elif isinstance(df, VDataFrame) and use_sketch:
+                ests = [
+                    reveal(
+                        device(_sketch_discretizer)(
+                            self._n_bins, self._encode, self._strategy, error, part.data
+                        )
+                    )
+                    for device, part in df.partitions.items()
+                ]
+                self._discretizer = self._concat_discretizer(ests)
             elif isinstance(df, VDataFrame):
 
                 def _sk_dis(n_bins, encode, strategy, df: pd.DataFrame):
@@ -168,6 +216,7 @@ class KBinsDiscretizer(_PreprocessBase):
                             compress_thres=compress_thres,
                             error=error,
                             max_iter=max_iter,
+                            use_sketch=use_sketch,
                         )
                         for hdf in hdfs
                     ]
@@ -179,6 +228,7 @@ class KBinsDiscretizer(_PreprocessBase):
                             compress_thres=compress_thres,
                             error=error,
                             max_iter=max_iter,
+                            use_sketch=use_sketch,
                         )
                         for hdf in df.partitions
                     ]
@@ -268,8 +318,9 @@ class KBinsDiscretizer(_PreprocessBase):
         aggregator: Aggregator = None,
         comparator: Comparator = None,
         compress_thres: int = 10000,
-        error: float = 1e04,
+        error: float = 1e-4,
         max_iter: int = 200,
+        use_sketch: bool = False,
     ):
         """Fit the estimator with X and then transform.
         Just a convience combine of fit and transform methods.
@@ -281,6 +332,7 @@ class KBinsDiscretizer(_PreprocessBase):
             compress_thres=compress_thres,
             error=error,
             max_iter=max_iter,
+            use_sketch=use_sketch,
         )
         return self.transform(df)
 
@@ -356,17 +356,7 @@ class OneHotEncoder(_PreprocessBase):
             ), f'Args min_frequency/max_categories are only supported in VDataFrame'
 
         self._columns = df.columns
-        if isinstance(df, (HDataFrame, VDataFrame)):
-            categories = self._fit(df)
-        else:
-            categories_list = [self._fit(part) for part in df.partitions]
-            categories = categories_list[0]
-            for cat in categories_list[1:]:
-                for feature, category in cat.items():
-                    if feature in categories:
-                        categories[feature] = np.append(categories[feature], category)
-                    else:
-                        categories[feature] = category
+        categories = self._fit_categories(df)
 
         self._fitted = True
         if categories is None:
@@ -377,6 +367,48 @@ class OneHotEncoder(_PreprocessBase):
         self._encoder = SkOneHotEncoder()
         self._encoder.fit(pd.DataFrame(categories))
 
+    def _fit_categories(
+        self, df: Union[HDataFrame, VDataFrame, MixDataFrame]
+    ) -> Dict[str, np.array]:
+        if isinstance(df, (HDataFrame, VDataFrame)):
+            return self._fit(df)
+        categories_list = [self._fit(part) for part in df.partitions]
+        categories = categories_list[0]
+        for cat in categories_list[1:]:
+            for feature, category in cat.items():
+                if feature in categories:
+                    categories[feature] = np.append(categories[feature], category)
+                else:
+                    categories[feature] = category
+        return categories
+
+    def partial_fit(self, df: Union[HDataFrame, VDataFrame, MixDataFrame]):
+        """Update categories with a chunk of rows of X.
+
+        Categories of chunks are merged as sets, so fitting every chunk of a
+        table with partial_fit gives the same encoder as fit on the whole
+        table, with only one chunk in memory at a time. min_frequency and
+        max_categories are not supported, they need counts of whole table.
+        """
+        _check_dataframe(df)
+        assert not (
+            self.min_frequency or self.max_categories
+        ), 'partial_fit does not support min_frequency/max_categories.'
+        categories = self._fit_categories(df)
+        if hasattr(self, '_encoder'):
+            assert list(df.columns) == list(
+                self._columns
+            ), f'Columns {df.columns} differ from fitted {self._columns}.'
+            for feature, category in zip(
+                self._encoder.feature_names_in_, self._encoder.categories_
+            ):
+                categories[feature] = np.append(category, categories[feature])
+        self._columns = df.columns
+        self._fitted = True
+        self._fill_categories(categories)
+        self._encoder = SkOneHotEncoder()
+        self._encoder.fit(pd.DataFrame(categories))
+
     def _transform(
         self, df: Union[HDataFrame, VDataFrame]
     ) -> Union[HDataFrame, VDataFrame]:
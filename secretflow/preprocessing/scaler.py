@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -29,6 +29,31 @@ from secretflow.security.aggregation import Aggregator
 from secretflow.utils.errors import InvalidArgumentError
 
 
+def _local_moments(_df) -> Tuple[np.ndarray]:
+    """count, sum and sum of squared deviations from mean of each column,
+    NaN are ignored like sklearn."""
+    x = np.asarray(_df.to_numpy(), dtype=float)
+    count = (~np.isnan(x)).sum(axis=0)
+    total = np.nansum(x, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d = x - total / count
+        # same correction of rounding errors in mean as sklearn.
+        m2 = np.nansum(d**2, axis=0) - np.nansum(d, axis=0) ** 2 / count
+    return count, total, np.where(count > 0, m2, 0)
+
+
+def _merge_moments(a: Tuple[np.ndarray], b: Tuple[np.ndarray]) -> Tuple[np.ndarray]:
+    """Merge (count, sum, m2) of two disjoint sets of rows exactly."""
+    count_a, sum_a, m2_a = a
+    count_b, sum_b, m2_b = b
+    count = count_a + count_b
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = sum_b / count_b - sum_a / count_a
+        cross = delta**2 * count_a * count_b / count
+    cross = np.where((count_a > 0) & (count_b > 0), cross, 0)
+    return count, sum_a + sum_b, m2_a + m2_b + cross
+
+
 class MinMaxScaler(_PreprocessBase):
     """Transform features by scaling each feature to a given range.
 
@@ -61,6 +86,28 @@ class MinMaxScaler(_PreprocessBase):
         self._scaler.fit(min_max)
         self._columns = df.columns
 
+    def partial_fit(self, df: Union[HDataFrame, VDataFrame, MixDataFrame]):
+        """Update the minimum and maximum with a chunk of rows of X.
+
+        Fitting every chunk of a table with partial_fit gives the same result
+        as fit on the whole table, with only one chunk in memory at a time.
+        """
+        self._check_dataframe(df)
+        if hasattr(self, '_scaler'):
+            assert list(df.columns) == list(
+                self._columns
+            ), f'Columns {df.columns} differ from fitted {self._columns}.'
+        else:
+            self._scaler = SkMinMaxScaler()
+        min_max = pd.concat(
+            [
+                df.min().to_frame(name='min').transpose(),
+                df.max().to_frame(name='max').transpose(),
+            ]
+        )
+        self._scaler.partial_fit(min_max)
+        self._columns = df.columns
+
     def _transform(
         self, df: Union[HDataFrame, VDataFrame]
     ) -> Union[HDataFrame, VDataFrame]:
@@ -165,6 +212,7 @@ class StandardScaler(_PreprocessBase):
         """
         self._with_mean = with_mean
         self._with_std = with_std
+        self._moments = None
 
     @staticmethod
     def _check_dataframe(df):
@@ -172,47 +220,111 @@ class StandardScaler(_PreprocessBase):
             df, (HDataFrame, VDataFrame, MixDataFrame)
         ), f'Accepts HDataFrame/VDataFrame/MixDataFrame only but got {type(df)}'
 
-    def _fit_horizontal(
-        self, partitions: List[Partition], aggregator: Aggregator = None
-    ) -> SkStandardScaler:
-        means = [part.mean(numeric_only=True) for part in partitions]
-        cnts = [part.count(numeric_only=True) for part in partitions]
-        mean = reveal(
-            aggregator.average(
-                [m.values for m in means], axis=0, weights=[cnt.values for cnt in cnts]
-            )
+    def _horizontal_moments(
+        self, partitions: List[Partition], aggregator: Aggregator
+    ) -> Tuple[np.ndarray]:
+        local = [
+            part.data.device(_local_moments, num_returns=3)(part.data)
+            for part in partitions
+        ]
+        count = reveal(aggregator.sum([m[0] for m in local], axis=0))
+        total = reveal(aggregator.sum([m[1] for m in local], axis=0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = total / count
+
+        def _shift_m2(_count, _sum, _m2, _mean):
+            # m2 around global mean, so they can be summed exactly.
+            with np.errstate(divide='ignore', invalid='ignore'):
+                shift = _count * (_sum / _count - _mean) ** 2
+            return _m2 + np.where(_count > 0, shift, 0)
+
+        m2s = [m[0].device(_shift_m2)(m[0], m[1], m[2], mean) for m in local]
+        m2 = reveal(aggregator.sum(m2s, axis=0))
+        return count, total, m2
+
+    def _vertical_moments(self, df: VDataFrame) -> Tuple[np.ndarray]:
+        local = reveal(
+            [
+                device(_local_moments, num_returns=3)(part.data)
+                for device, part in df.partitions.items()
+            ]
         )
-        count = reveal(aggregator.sum([cnt.values for cnt in cnts], axis=0))
-        scaler = SkStandardScaler(with_mean=self._with_mean, with_std=self._with_std)
-        scaler.mean_ = mean if self._with_mean else None
+        return tuple(np.concatenate([m[i] for m in local]) for i in range(3))
 
-        if self._with_std:
+    def _df_moments(
+        self, df: Union[HDataFrame, VDataFrame, MixDataFrame], aggregator: Aggregator
+    ) -> Tuple[np.ndarray]:
+        if isinstance(df, MixDataFrame):
+            if df.partition_way == PartitionWay.HORIZONTAL:
+                assert aggregator is not None, (
+                    'Should provide a aggregator for horinzontal partitioned'
+                    'MixDataFrame'
+                )
+                parts_list = [list(part.partitions.values()) for part in df.partitions]
+                moments = [
+                    self._horizontal_moments(parts, aggregator)
+                    for parts in zip(*parts_list)
+                ]
+            else:
+                moments = [
+                    self._horizontal_moments(
+                        list(hdf.partitions.values()),
+                        aggregator if aggregator is not None else hdf.aggregator,
+                    )
+                    for hdf in df.partitions
+                ]
+            return tuple(np.concatenate([m[i] for m in moments]) for i in range(3))
+        elif isinstance(df, HDataFrame):
+            return self._horizontal_moments(
+                list(df.partitions.values()),
+                aggregator if aggregator is not None else df.aggregator,
+            )
+        else:
+            return self._vertical_moments(df)
 
-            def _cal_var(_mean, df: pd.DataFrame):
-                return ((df - _mean) ** 2).sum()
+    def _scaler_from_moments(self, moments: Tuple[np.ndarray]) -> SkStandardScaler:
+        count, total, m2 = moments
+        scaler = SkStandardScaler(with_mean=self._with_mean, with_std=self._with_std)
+        scaler.n_samples_seen_ = count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scaler.mean_ = total / count if self._with_mean else None
+            if self._with_std:
+                scaler.var_ = m2 / count
+                # constant columns are not scaled, same as sklearn.
+                scaler.scale_ = np.sqrt(scaler.var_)
+                scaler.scale_[scaler.scale_ == 0] = 1.0
+            else:
+                scaler.var_ = None
+                scaler.scale_ = None
+        return scaler
 
-            vars = [part.data.device(_cal_var)(mean, part.data) for part in partitions]
-            scaler.var_ = reveal(aggregator.sum(vars, axis=0))
-            if not scaler.var_.shape:
-                scaler.var_ = np.array([scaler.var_])
-            scaler.var_ = scaler.var_ / count
-            scaler.scale_ = np.sqrt(scaler.var_)
+    def partial_fit(
+        self,
+        df: Union[HDataFrame, VDataFrame, MixDataFrame],
+        aggregator: Aggregator = None,
+    ):
+        """Update mean and variance with a chunk of rows of X.
 
-        return scaler
+        Count, sum and sum of squared deviations of chunks and partitions are
+        merged exactly, so fitting every chunk of a table with partial_fit
+        gives the same result as fit on the whole table, with only one chunk in
+        memory at a time. Horizontal partitions are merged by the aggregator in
+        two rounds per chunk, without a second pass over data.
 
-    def _concatenate_scaler(self, scalers: List[SkStandardScaler]) -> SkStandardScaler:
-        scaler = SkStandardScaler(with_mean=self._with_mean, with_std=self._with_std)
-        if self._with_mean:
-            scaler.mean_ = np.concatenate([scaler.mean_ for scaler in scalers])
-        else:
-            scaler.mean_ = None
-        if self._with_std:
-            scaler.scale_ = np.concatenate([scaler.scale_ for scaler in scalers])
-            scaler.var_ = np.concatenate([scaler.var_ for scaler in scalers])
-        else:
-            scaler.scale_ = None
-            scaler.var_ = None
-        return scaler
+        Args:
+            df: a chunk of rows of X.
+            aggregator: optional; same as fit.
+        """
+        self._check_dataframe(df)
+        moments = self._df_moments(df, aggregator)
+        if self._moments is not None:
+            assert list(df.columns) == list(
+                self._columns
+            ), f'Columns {df.columns} differ from fitted {self._columns}.'
+            moments = _merge_moments(self._moments, moments)
+        self._moments = moments
+        self._columns = df.columns
+        self._scaler = self._scaler_from_moments(moments)
 
     def fit(
         self,
@@ -227,47 +339,10 @@ class StandardScaler(_PreprocessBase):
                 and standard variance. Shall provided if X is a horizontal
                 partitioned MixDataFrame.
         """
-        self._check_dataframe(df)
-        self._columns = df.columns
-        if isinstance(df, MixDataFrame):
-            if df.partition_way == PartitionWay.HORIZONTAL:
-                if self._with_mean or self._with_std:
-                    assert aggregator is not None, (
-                        'Should provide a aggregator for horinzontal partitioned'
-                        'MixDataFrame when with_mean or with_std is true'
-                    )
-
-                parts_list = [list(part.partitions.values()) for part in df.partitions]
-                scalers = [
-                    self._fit_horizontal(parts, aggregator)
-                    for parts in zip(*parts_list)
-                ]
-            else:
-                scalers = [
-                    self._fit_horizontal(
-                        list(hdf.partitions.values()),
-                        aggregator if aggregator is not None else hdf.aggregator,
-                    )
-                    for hdf in df.partitions
-                ]
-            self._scaler = self._concatenate_scaler(scalers)
-        elif isinstance(df, HDataFrame):
-            self._scaler = self._fit_horizontal(
-                list(df.partitions.values()),
-                aggregator if aggregator is not None else df.aggregator,
-            )
-        else:
-            # VDataFrame
-            def _sk_fit(with_mean, with_std, _df: pd.DataFrame):
-                scaler = SkStandardScaler(with_mean=with_mean, with_std=with_std)
-                scaler.fit(_df)
-                return scaler
-
-            scalers = [
-                reveal(device(_sk_fit)(self._with_mean, self._with_std, part.data))
-                for device, part in df.partitions.items()
-            ]
-            self._scaler = self._concatenate_scaler(scalers)
+        # fit is a partial_fit from scratch, so later partial_fit calls continue
+        # from statistics of df.
+        self._moments = None
+        self.partial_fit(df, aggregator)
 
     def _transform(
         self, scaler: SkStandardScaler, df: Union[HDataFrame, VDataFrame]
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .gradient import GaussianGradientDP
 from .layers import GaussianEmbeddingDP
 
 __all__ = [
     'GaussianEmbeddingDP',
+    'GaussianGradientDP',
 ]
@@ -0,0 +1,114 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Callable, Tuple
+
+import torch
+from torch import nn as nn
+from torch.func import functional_call, grad_and_value, vmap
+
+from secretflow.security.privacy.accounting.budget_accountant import BudgetAccountant
+
+
+class GaussianGradientDP(BudgetAccountant):
+    """DP-SGD on model parameters: per sample gradients are clipped to
+    l2_norm_clip and gaussian noise is added to their sum.
+
+    Per sample gradients of a batch are computed in one vectorized pass with
+    `torch.func.vmap`, and then clipped and noised together, without looping
+    over samples. Models with batch norm are not supported since it mixes
+    samples of a batch.
+    """
+
+    def __init__(
+        self,
+        noise_multiplier: float,
+        batch_size: int,
+        num_samples: int,
+        l2_norm_clip: float = 1.0,
+        delta: float = None,
+        is_secure_generator: bool = False,
+    ) -> None:
+        """
+        Args:
+            noise_multiplier: Ratio of the noise stddev to l2_norm_clip.
+            batch_size: Batch size used for accounting.
+            num_samples: Number of training samples.
+            l2_norm_clip: The clipping norm of the gradient of each sample.
+            delta: Target delta, default to min(1 / num_samples**2, 1e-5).
+            is_secure_generator: whether use the secure generator to generate noise.
+        """
+        super().__init__()
+        self.noise_multiplier = noise_multiplier
+        self.l2_norm_clip = l2_norm_clip
+        self.num_samples = num_samples
+        self.batch_size = batch_size
+        self.delta = delta if delta is not None else min(1 / num_samples**2, 1e-5)
+        self.is_secure_generator = is_secure_generator
+
+    def _noise(self, like: torch.Tensor) -> torch.Tensor:
+        stddev = self.noise_multiplier * self.l2_norm_clip
+        if self.is_secure_generator:
+            import secretflow.security.privacy._lib.random as random
+
+            noise = torch.from_numpy(
+                random.secure_normal_real(0, stddev, size=tuple(like.shape))
+            )
+            return noise.to(dtype=like.dtype, device=like.device)
+        return torch.normal(0.0, stddev, size=like.shape, device=like.device).to(
+            like.dtype
+        )
+
+    def backward(
+        self, model: nn.Module, loss_fn: Callable, x: torch.Tensor, y: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Set `.grad` of trainable parameters to the noised mean of clipped
+        per sample gradients, in place of `loss.backward()`.
+
+        Args:
+            model: the model to train.
+            loss_fn: loss function, it is called on batches of a single sample.
+            x: inputs of a batch.
+            y: labels of a batch.
+
+        Returns:
+            mean loss and predictions of the batch.
+        """
+        params = {
+            name: p.detach() for name, p in model.named_parameters() if p.requires_grad
+        }
+        buffers = {name: b.detach() for name, b in model.named_buffers()}
+
+        def _sample_loss(params, xi, yi):
+            output = functional_call(model, (params, buffers), (xi.unsqueeze(0),))
+            return loss_fn(output, yi.unsqueeze(0)), output.squeeze(0)
+
+        grads, (losses, y_pred) = vmap(
+            grad_and_value(_sample_loss, has_aux=True),
+            in_dims=(None, 0, 0),
+            randomness='different',
+        )(params, x, y)
+
+        # clip and noise in one pass over the per sample gradients.
+        batch_size = x.shape[0]
+        sq_norms = sum(
+            g.reshape(batch_size, -1).pow(2).sum(dim=1) for g in grads.values()
+        )
+        factors = torch.clamp(self.l2_norm_clip / (sq_norms.sqrt() + 1e-6), max=1.0)
+        named_params = dict(model.named_parameters())
+        for name, g in grads.items():
+            clipped_sum = torch.tensordot(factors, g, dims=1)
+            noised_sum = clipped_sum + self._noise(clipped_sum)
+            named_params[name].grad = noised_sum / batch_size
+        return losses.mean(), y_pred
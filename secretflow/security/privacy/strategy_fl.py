@@ -20,13 +20,18 @@ class DPStrategyFL:
         self,
         model_gdp: GaussianModelDP = None,
         accountant_type='rdp',
+        gradient_dp=None,
     ):
         """
         Args:
             model_gdp: global dp strategy on model parameters or gradients.
+            gradient_dp: local dp-sgd strategy clipping and noising per sample
+                gradients, e.g. `GaussianGradientDP`, only supported by torch
+                backend.
             accountant_type: Method of calculating accountant, only supports "rdp".
         """
         self.model_gdp = model_gdp
+        self.gradient_dp = gradient_dp
 
         if accountant_type == 'rdp':
             self.accountant_type = accountant_type
@@ -51,4 +56,15 @@ class DPStrategyFL:
             privacy_dict['model_eps'] = model_eps
             privacy_dict['model_delta'] = model_delta
 
+        if self.gradient_dp is not None:
+            if self.accountant_type == 'rdp':
+                grad_eps, grad_delta, _ = self.gradient_dp.privacy_spent_rdp(
+                    step, orders
+                )
+            else:
+                raise ValueError('the accountant_type only supports "rdp".')
+
+            privacy_dict['grad_eps'] = grad_eps
+            privacy_dict['grad_delta'] = grad_delta
+
         return privacy_dict
@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .biclassification_eval import BiClassificationEval
+from .biclassification_eval import BiClassificationEval, StreamingBiClassificationEval
+from .core.gram import GramCache
 from .prediction_bias_eval import prediction_bias_eval
-from .psi_eval import psi_eval
+from .psi_eval import psi_eval, psi_table_eval
 from .regression_eval import RegressionEval
 from .score_card import ScoreCard
 from .ss_pearsonr_v import PearsonR as SSVertPearsonR
@@ -26,10 +27,13 @@ __all__ = [
     'SSVertPearsonR',
     'SSVertVIF',
     'SSPValue',
+    'GramCache',
     'RegressionEval',
     'BiClassificationEval',
+    'StreamingBiClassificationEval',
     'prediction_bias_eval',
     'table_statistics',
     'psi_eval',
+    'psi_table_eval',
     'ScoreCard',
 ]
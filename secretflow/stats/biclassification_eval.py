@@ -13,13 +13,15 @@
 # limitations under the License.
 
 # This is a wrapper of evaluation functions
-from typing import Union
+from typing import Tuple, Union
+
+import pandas as pd
 
 from secretflow.data import FedNdarray
 from secretflow.data.vertical import VDataFrame
-from secretflow.device import PYUObject
+from secretflow.device import PYU, PYUObject
 
-from .core import gen_biclassification_reports
+from .core import gen_biclassification_reports, gen_biclassification_reports_from_chunks
 
 # BiClassification Report is different from Regression Evaluation in that many binning related statistics
 # are computed in a sequential batch processing manner, rather than independent evaluations
@@ -114,3 +116,91 @@ class BiClassificationEval:
         return self.device(gen_biclassification_reports)(
             self.y_true, self.y_score, self.bucket_size, self.min_item_cnt_per_bucket
         )
+
+
+class StreamingBiClassificationEval:
+    """Statistics Evaluation for a bi-classification model from a prediction csv file.
+
+    The file is read in chunks by its owner and accumulated into fine-grained
+    score histograms, so memory does not grow with the number of samples.
+    Results have an error bounded by the resolution of one histogram bin,
+    see core.biclassification_eval_core.ScoreHistogram.
+
+    Attribute:
+            device: PYU
+                owner of the prediction file
+            path: str
+                path of the csv file
+            label: str
+                column name of labels
+            prediction: str
+                column name of prediction scores
+            bucket_size: int
+                input of number of bins in report
+            min_item_cnt_per_bucket: int
+                min item cnt per bucket. If any bucket doesn't meet the requirement, error raises.
+            chunksize: int
+                number of rows read each time
+            n_bins: int
+                number of histogram bins
+            score_range: Tuple[float, float]
+                range of scores covered by histogram bins
+    """
+
+    def __init__(
+        self,
+        device: PYU,
+        path: str,
+        label: str,
+        prediction: str,
+        bucket_size: int,
+        min_item_cnt_per_bucket: int = None,
+        chunksize: int = 1 << 20,
+        n_bins: int = 1 << 16,
+        score_range: Tuple[float, float] = (0.0, 1.0),
+    ):
+        assert isinstance(device, PYU), "device should be PYU"
+        assert chunksize > 0, f"chunksize should be positive, got {chunksize}"
+        self.device = device
+        self.path = path
+        self.label = label
+        self.prediction = prediction
+        self.bucket_size = bucket_size
+        self.min_item_cnt_per_bucket = min_item_cnt_per_bucket
+        self.chunksize = chunksize
+        self.n_bins = n_bins
+        self.score_range = score_range
+
+    def get_all_reports(self) -> PYUObject:
+        """get all reports, same as BiClassificationEval.get_all_reports."""
+
+        def reports_from_csv(
+            path,
+            label,
+            prediction,
+            bucket_size,
+            min_item_cnt_per_bucket,
+            chunksize,
+            n_bins,
+            score_range,
+        ):
+            chunks = (
+                (chunk[label].to_numpy(), chunk[prediction].to_numpy())
+                for chunk in pd.read_csv(
+                    path, usecols=[label, prediction], chunksize=chunksize
+                )
+            )
+            return gen_biclassification_reports_from_chunks(
+                chunks, bucket_size, min_item_cnt_per_bucket, n_bins, score_range
+            )
+
+        return self.device(reports_from_csv)(
+            self.path,
+            self.label,
+            self.prediction,
+            self.bucket_size,
+            self.min_item_cnt_per_bucket,
+            self.chunksize,
+            self.n_bins,
+            self.score_range,
+        )
@@ -13,5 +13,8 @@
 # limitations under the License.
 
 from .biclassification_eval_core import gen_all_reports as gen_biclassification_reports
+from .biclassification_eval_core import (
+    gen_all_reports_from_chunks as gen_biclassification_reports_from_chunks,
+)
 from .prediction_bias_core import prediction_bias
-from .psi_core import psi
+from .psi_core import psi, psi_table
@@ -14,10 +14,11 @@
 
 # This is a single party based bi-classification report
 
-from typing import List, Tuple, Union
+from typing import Iterable, List, Tuple, Union
 
 import jax
 import jax.numpy as jnp
+import numpy as np
 import pandas as pd
 
 from .utils import equal_obs, equal_range
@@ -678,3 +679,246 @@ def compute_f1_score(
     precision = jnp.divide(true_positive, (true_positive + false_positive))
     recall = jnp.divide(true_positive, (true_positive + false_negative))
     return jnp.divide(2 * precision * recall, (precision + recall))
+
+
+# section of streaming evaluation
+class ScoreHistogram:
+    """Mergeable fine-grained histogram of scores per label.
+
+    Streaming alternative to gen_all_reports: chunks of predictions are
+    accumulated into n_bins equal width bins over score_range, so memory is
+    constant in the number of samples and no global sort is needed.
+    Exact min and max scores are kept per bin, scores out of score_range are
+    put in the first or last bin.
+
+    Counts, averages, bin boundaries and totals are exact, while split points,
+    auc and head reports have an error bounded by the resolution of one fine bin.
+
+    Attributes:
+        n_bins: int
+            number of fine bins.
+        score_range: Tuple[float, float]
+            range of scores covered by fine bins.
+    """
+
+    def __init__(
+        self, n_bins: int = 1 << 16, score_range: Tuple[float, float] = (0.0, 1.0)
+    ):
+        assert n_bins > 0, f"n_bins should be positive, got {n_bins}"
+        assert score_range[1] > score_range[0], f"invalid score range {score_range}"
+        self.n_bins = n_bins
+        self.score_range = (float(score_range[0]), float(score_range[1]))
+        self.pos_count = np.zeros(n_bins)
+        self.count = np.zeros(n_bins)
+        self.score_sum = np.zeros(n_bins)
+        self.score_min = np.full(n_bins, np.inf)
+        self.score_max = np.full(n_bins, -np.inf)
+
+    def update(
+        self,
+        y_true: Union[pd.DataFrame, np.ndarray],
+        y_score: Union[pd.DataFrame, np.ndarray],
+    ) -> 'ScoreHistogram':
+        """Accumulate a chunk of labels (0 or 1) and scores."""
+        y_true = np.asarray(y_true, dtype=np.float64).reshape(-1)
+        y_score = np.asarray(y_score, dtype=np.float64).reshape(-1)
+        assert y_true.shape == y_score.shape, "y_true and y_score size mismatch"
+        if y_score.size == 0:
+            return self
+        low, high = self.score_range
+        idx = np.floor((y_score - low) / (high - low) * self.n_bins)
+        idx = np.clip(idx, 0, self.n_bins - 1).astype(np.int64)
+        self.pos_count += np.bincount(idx, weights=y_true, minlength=self.n_bins)
+        self.count += np.bincount(idx, minlength=self.n_bins)
+        self.score_sum += np.bincount(idx, weights=y_score, minlength=self.n_bins)
+        np.minimum.at(self.score_min, idx, y_score)
+        np.maximum.at(self.score_max, idx, y_score)
+        return self
+
+    def merge(self, other: 'ScoreHistogram') -> 'ScoreHistogram':
+        """Merge another histogram built with the same n_bins and score_range."""
+        assert (
+            self.n_bins == other.n_bins and self.score_range == other.score_range
+        ), "can not merge histograms with different bins"
+        self.pos_count += other.pos_count
+        self.count += other.count
+        self.score_sum += other.score_sum
+        self.score_min = np.minimum(self.score_min, other.score_min)
+        self.score_max = np.maximum(self.score_max, other.score_max)
+        return self
+
+    def _sorted_bins(self):
+        """non-empty bins in decreasing score order"""
+        non_empty = np.flatnonzero(self.count)[::-1]
+        pos = self.pos_count[non_empty]
+        count = self.count[non_empty]
+        return (
+            pos,
+            count - pos,
+            self.score_sum[non_empty],
+            self.score_min[non_empty],
+            self.score_max[non_empty],
+        )
+
+    def gen_reports(self, bin_size: int, min_item_cnt_per_bucket: int = None) -> Report:
+        """Generate all reports, in the same layout as gen_all_reports.
+
+        Args:
+            bin_size: int
+                number of bins to evaluate
+            min_item_cnt_per_bucket: int
+                min item cnt per bucket. If any bucket doesn't meet the requirement, return NaN values.
+        """
+        pos, neg, score_sum, score_min, score_max = self._sorted_bins()
+        assert pos.size > 0, "no sample is accumulated"
+        total_pos = np.sum(pos)
+        total_neg = np.sum(neg)
+        n_samples = total_pos + total_neg
+
+        # equal frequency split points are the max score of the bin holding each
+        # quantile, so they fall on bin boundaries.
+        ascending_cum_count = np.cumsum((pos + neg)[::-1])
+        ranks = np.linspace(0, n_samples, bin_size + 1)
+        rank_bins = np.minimum(
+            np.searchsorted(ascending_cum_count, ranks, side='right'),
+            pos.size - 1,
+        )
+        eq_frequent_split_points = np.flip(score_max[::-1][rank_bins])
+        eq_frequent_result_arr_list = _evaluate_hist_bins(
+            pos,
+            neg,
+            score_sum,
+            score_min,
+            score_max,
+            eq_frequent_split_points,
+            min_item_cnt_per_bucket,
+        )
+        min_val, max_val = score_min[-1], score_max[0]
+        eq_range_split_points = np.flip(np.linspace(min_val, max_val, bin_size + 1))
+        eq_range_result_arr_list = _evaluate_hist_bins(
+            pos,
+            neg,
+            score_sum,
+            score_min,
+            score_max,
+            eq_range_split_points,
+            min_item_cnt_per_bucket,
+        )
+
+        # ks has index 15, f1 has index 8
+        ks = np.max([bin[15] for bin in eq_frequent_result_arr_list])
+        f1 = np.max([bin[8] for bin in eq_frequent_result_arr_list])
+
+        # roc points at bin boundaries, ties inside a bin count as half.
+        tps = np.cumsum(pos)
+        fps = np.cumsum(neg)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tpr = np.r_[0, tps] / total_pos
+            fpr = np.r_[0, fps] / total_neg
+        auc = np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2)
+        summary_report_arr = np.array([n_samples, total_pos, total_neg, auc, ks, f1])
+
+        # bins play the role of distinct thresholds in gen_pr_reports
+        head_prs = []
+        for t in HEAD_FPR_THRESHOLDS:
+            i = min(int(np.sum(score_min < t)), pos.size - 1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                precision = tps[i] / (tps[i] + fps[i])
+                recall = tps[i] / total_pos
+                false_positive_rate = fps[i] / total_neg
+            head_prs.append(np.array([false_positive_rate, precision, recall, t]))
+
+        return Report(
+            eq_frequent_result_arr_list,
+            eq_range_result_arr_list,
+            summary_report_arr,
+            head_prs,
+        )
+
+
+def _evaluate_hist_bins(
+    pos, neg, score_sum, score_min, score_max, split_points, min_item_cnt_per_bucket
+) -> List[np.ndarray]:
+    """evaluate_bins over decreasing non-empty fine bins.
+
+    A fine bin belongs to the bin on the left of a split point if all its scores
+    are larger than the split point.
+    """
+    total_pos = np.sum(pos)
+    total_neg = np.sum(neg)
+    cum_pos = np.r_[0, np.cumsum(pos)]
+    cum_neg = np.r_[0, np.cumsum(neg)]
+    cum_score = np.r_[0, np.cumsum(score_sum)]
+    # score_min is decreasing, so the bins above a split point form a prefix
+    end_positions = np.sum(score_min[:, None] > split_points[None, :], axis=0)
+    end_positions = np.r_[end_positions, pos.size]
+
+    bins = []
+    start = 0
+    for end in end_positions:
+        positive = cum_pos[end] - cum_pos[start]
+        negative = cum_neg[end] - cum_neg[start]
+        total = positive + negative
+        if end == start:
+            bins.append(np.zeros(BIN_REPORT_STATISTICS_ENTRY_COUNT))
+            continue
+        if min_item_cnt_per_bucket is not None and total < min_item_cnt_per_bucket:
+            bins.append(np.full(BIN_REPORT_STATISTICS_ENTRY_COUNT, np.nan))
+            start = end
+            continue
+        true_positive = cum_pos[end]
+        false_positive = cum_neg[end]
+        false_negative = total_pos - true_positive
+        true_negative = total_neg - false_positive
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = true_positive / (true_positive + false_positive)
+            recall = true_positive / (true_positive + false_negative)
+            false_positive_rate = false_positive / (false_positive + true_negative)
+            f1_score = 2 * precision * recall / (precision + recall)
+            cumulative_percent_of_positive = true_positive / total_pos
+            cumulative_percent_of_negative = false_positive / total_neg
+            bins.append(
+                np.array(
+                    [
+                        score_min[end - 1],
+                        score_max[start],
+                        positive,
+                        negative,
+                        total,
+                        precision,
+                        recall,
+                        false_positive_rate,
+                        f1_score,
+                        precision * (total_pos + total_neg) / total_pos,
+                        positive / total_pos,
+                        negative / total_neg,
+                        cumulative_percent_of_positive,
+                        cumulative_percent_of_negative,
+                        (true_positive + false_positive) / (total_pos + total_neg),
+                        abs(
+                            cumulative_percent_of_positive
+                            - cumulative_percent_of_negative
+                        ),
+                        (cum_score[end] - cum_score[start]) / total,
+                    ]
+                )
+            )
+        start = end
+    return bins
+
+
+def gen_all_reports_from_chunks(
+    chunks: Iterable[Tuple[np.ndarray, np.ndarray]],
+    bin_size: int,
+    min_item_cnt_per_bucket: int = None,
+    n_bins: int = 1 << 16,
+    score_range: Tuple[float, float] = (0.0, 1.0),
+) -> Report:
+    """Generate all reports from (y_true, y_score) chunks in constant memory.
+
+    See ScoreHistogram for the accuracy of results.
+    """
+    hist = ScoreHistogram(n_bins, score_range)
+    for y_true, y_score in chunks:
+        hist.update(y_true, y_score)
+    return hist.gen_reports(bin_size, min_item_cnt_per_bucket)
@@ -0,0 +1,144 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from typing import Dict, Tuple
+
+import jax.numpy as jnp
+
+from secretflow.data.vertical import VDataFrame
+from secretflow.device import SPU, SPUObject
+from secretflow.preprocessing.scaler import StandardScaler
+from secretflow.utils.blocked_ops import block_compute_vdata
+
+
+class GramMoments:
+    """
+    Augmented gram matrix G = [X 1].T @ [X 1] of a vertical slice dataset,
+    kept in secret sharing.
+
+    G[:-1, :-1] is X.T @ X, G[-1, :-1] is column sums, diagonal of X.T @ X is
+    column square sums and G[-1, -1] is the number of rows, so first and second
+    moments come from the same blocked matmul.
+
+    Attributes:
+        gram: SPUObject of shape (cols + 1, cols + 1).
+        rows: number of rows of dataset.
+        cols: number of columns of dataset.
+    """
+
+    def __init__(self, gram: SPUObject, rows: int, cols: int):
+        self.gram = gram
+        self.rows = rows
+        self.cols = cols
+
+    @property
+    def device(self) -> SPU:
+        return self.gram.device
+
+    def xtx(self) -> SPUObject:
+        return self.device(lambda g: g[:-1, :-1])(self.gram)
+
+    def col_sums(self) -> SPUObject:
+        return self.device(lambda g: g[-1, :-1])(self.gram)
+
+    def col_square_sums(self) -> SPUObject:
+        return self.device(lambda g: jnp.diagonal(g)[:-1])(self.gram)
+
+
+def gram_moments(
+    vdata: VDataFrame,
+    device: SPU,
+    standardize: bool = False,
+    infeed_elements_limit: int = 20000000,
+) -> GramMoments:
+    """
+    Compute GramMoments of vdata in row blocks by spu.
+
+    Args:
+        vdata: vertical slice dataset.
+        device: SPU device.
+        standardize: standardize vdata by StandardScaler before computing.
+        infeed_elements_limit: max elements of one block fed into spu.
+    """
+    if standardize:
+        scaler = StandardScaler()
+        vdata = scaler.fit_transform(vdata)
+    rows = vdata.shape[0]
+    cols = vdata.shape[1]
+    assert rows > 0 and cols > 0, "input dataset is empty"
+    row_number = max([math.ceil(infeed_elements_limit / cols), 1])
+
+    gram = block_compute_vdata(
+        vdata,
+        row_number,
+        device,
+        lambda x: x.T @ x,
+        lambda x, y: x + y,
+        pad_ones=True,
+    )
+    return GramMoments(gram, rows, cols)
+
+
+class GramCache:
+    """
+    Cache GramMoments of datasets, so PearsonR, VIF and linear PValue on the
+    same dataset share one pass of blocked matmul in spu.
+
+    Entries are keyed by partition objects of vdata and standardize, and hold
+    vdata until `clear` is called. PValue always uses raw (not standardized)
+    dataset, so it only shares entries with standardize=False calls.
+
+    Attributes:
+        device: SPU Device
+    """
+
+    def __init__(self, device: SPU):
+        self.device = device
+        self._entries: Dict[Tuple, Tuple[VDataFrame, GramMoments]] = {}
+
+    @staticmethod
+    def _key(vdata: VDataFrame, standardize: bool) -> Tuple:
+        parts = tuple((str(pyu), id(p.data)) for pyu, p in vdata.partitions.items())
+        return parts, bool(standardize)
+
+    def get(
+        self,
+        vdata: VDataFrame,
+        standardize: bool = False,
+        infeed_elements_limit: int = 20000000,
+    ) -> GramMoments:
+        """Get cached GramMoments of vdata, compute it if missed."""
+        key = self._key(vdata, standardize)
+        if key not in self._entries:
+            gram = gram_moments(vdata, self.device, standardize, infeed_elements_limit)
+            # keep vdata alive so ids in key are not reused.
+            self._entries[key] = (vdata, gram)
+        return self._entries[key][1]
+
+    def clear(self):
+        self._entries.clear()
+
+
+def get_gram_moments(
+    vdata: VDataFrame,
+    device: SPU,
+    standardize: bool,
+    infeed_elements_limit: int,
+    cache: GramCache = None,
+) -> GramMoments:
+    if cache is None:
+        return gram_moments(vdata, device, standardize, infeed_elements_limit)
+    assert cache.device == device, "gram cache should use same spu"
+    return cache.get(vdata, standardize, infeed_elements_limit)
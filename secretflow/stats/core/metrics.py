@@ -35,3 +35,11 @@ def mean_squared_error(y_true: jnp.array, y_pred: jnp.array) -> jnp.float32:
 
 def root_mean_squared_error(y_true: jnp.array, y_pred: jnp.array) -> jnp.float32:
     return jnp.sqrt(mean_of_difference_squares(y_true, y_pred))
+
+
+def multi_class_log_loss(y_true: jnp.array, y_pred: jnp.array) -> jnp.float32:
+    """y_true holds class labels, y_pred holds class probabilities of shape (n, num_class)"""
+    y_true = jnp.asarray(y_true).reshape(-1).astype(jnp.int32)
+    y_pred = jnp.asarray(y_pred)
+    prob = y_pred[jnp.arange(y_true.shape[0]), y_true]
+    return -jnp.mean(jnp.log(jnp.clip(prob, 1e-15, 1.0)))
@@ -14,9 +14,10 @@
 
 # This is a single party based population stability index calculation
 
-from typing import Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 import jax.numpy as jnp
+import numpy as np
 import pandas as pd
 
 
@@ -96,3 +97,114 @@ def psi(
     dist_x = distribution_generation(X, split_points)
     dist_y = distribution_generation(Y, split_points)
     return psi_score(dist_x, dist_y)
+
+
+def _pad_split_points(split_points: List[np.ndarray]) -> Tuple[np.ndarray]:
+    """Stack split points of features into a (features, max_edges) matrix,
+    padded with inf."""
+    n_edges = np.array([len(sp) for sp in split_points])
+    assert np.all(n_edges > 1), "there must be at least one bin"
+    edges = np.full((len(split_points), n_edges.max()), np.inf)
+    for i, sp in enumerate(split_points):
+        edges[i, : n_edges[i]] = sp
+    return edges, n_edges
+
+
+def batch_bin_counts(
+    X: Union[pd.DataFrame, np.ndarray, Iterable],
+    split_points: List[np.ndarray],
+    block_elements: int = 10000000,
+) -> Tuple[np.ndarray, int]:
+    """Count samples of every feature in each bin, all features at once.
+
+    Bins follow np.histogram: bin[i] is [split_points[i], split_points[i + 1])
+    and the last bin is closed, samples out of range are not counted.
+
+    Args:
+        X: (samples, features) data, or an iterable of such chunks for data
+            larger than memory.
+        split_points: ordered split points of each feature.
+        block_elements: rows are binned in blocks of at most this many
+            samples * features * edges elements.
+    Returns:
+        counts: (features, max_bins) array, bins beyond a feature's own
+            split points are 0.
+        n_samples: number of samples, including out of range ones.
+    """
+    edges, n_edges = _pad_split_points(split_points)
+    n_features, max_edges = edges.shape
+    max_bins = max_edges - 1
+    last_edges = edges[np.arange(n_features), n_edges - 1]
+    counts = np.zeros(n_features * max_bins, dtype=np.int64)
+    offsets = np.arange(n_features) * max_bins
+    n_samples = 0
+
+    if isinstance(X, (pd.DataFrame, np.ndarray)):
+        X = [X]
+    block_rows = max(block_elements // (n_features * max_edges), 1)
+    for chunk in X:
+        if len(chunk) == 0:
+            continue
+        if isinstance(chunk, pd.DataFrame):
+            chunk = chunk.to_numpy()
+        chunk = np.asarray(chunk, dtype=float).reshape(len(chunk), -1)
+        assert (
+            chunk.shape[1] == n_features
+        ), f"data has {chunk.shape[1]} features, split points have {n_features}"
+        n_samples += len(chunk)
+        for start in range(0, len(chunk), block_rows):
+            x = chunk[start : start + block_rows]
+            # searchsorted of every feature against its own edges.
+            idx = (x[:, :, None] >= edges[None, :, :]).sum(axis=2) - 1
+            idx = np.where(x == last_edges, n_edges - 2, idx)
+            valid = (idx >= 0) & (idx < n_edges - 1)
+            flat = (idx + offsets)[valid]
+            counts += np.bincount(flat, minlength=counts.size)
+    return counts.reshape(n_features, max_bins), n_samples
+
+
+def psi_table(
+    X: Union[pd.DataFrame, np.ndarray, Iterable],
+    Y: Union[pd.DataFrame, np.ndarray, Iterable],
+    split_points: Union[Dict[str, np.ndarray], List[np.ndarray]],
+    feature_names: List[str] = None,
+    block_elements: int = 10000000,
+) -> pd.DataFrame:
+    """Calculate population stability index of all features in one pass over
+    each of X and Y.
+
+    Args:
+        X: (samples, features) data or iterable of chunks, see batch_bin_counts.
+        Y: (samples, features) data or iterable of chunks, see batch_bin_counts.
+        split_points: ordered split points of each feature, dict keys are used
+            as feature names.
+        feature_names: names of features, columns of X if it is a DataFrame.
+        block_elements: see batch_bin_counts.
+    Returns:
+        result: DataFrame indexed by feature with column psi.
+    """
+    if isinstance(split_points, dict):
+        feature_names = list(split_points.keys())
+        split_points = list(split_points.values())
+    elif feature_names is None and isinstance(X, pd.DataFrame):
+        feature_names = X.columns.tolist()
+    split_points = [np.asarray(sp, dtype=float).ravel() for sp in split_points]
+    if feature_names is None:
+        feature_names = list(range(len(split_points)))
+    if isinstance(X, pd.DataFrame):
+        X = X[feature_names]
+    if isinstance(Y, pd.DataFrame):
+        Y = Y[feature_names]
+
+    count_x, n_x = batch_bin_counts(X, split_points, block_elements)
+    count_y, n_y = batch_bin_counts(Y, split_points, block_elements)
+    assert n_x > 0 and n_y > 0, "there must be at least one sample"
+    # same as distribution_generation, ratio of all samples including
+    # out of range ones.
+    dist_x = count_x / n_x
+    dist_y = count_y / n_y
+    n_bins = np.array([len(sp) - 1 for sp in split_points])
+    mask = np.arange(count_x.shape[1]) < n_bins[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        index = np.where(mask, (dist_x - dist_y) * np.log(dist_x / dist_y), 0)
+    return pd.DataFrame({'psi': index.sum(axis=1)}, index=feature_names)
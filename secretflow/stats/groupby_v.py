@@ -88,18 +88,32 @@ def ordinal_encoded_groupby_value_agg_pairs(
     logging.info("ordinal_encoded_groupby begin")
     df_groupby, encoder = ordinal_encoded_groupby(df, by, values, spu, max_group_size)
     logging.info("ordinal_encoded_groupby complete")
-    results = {}
+    func = {}
     for value, agg in value_agg_pairs:
-        stat = getattr(
-            df_groupby,
-            agg,
-        )([value])
-        logging.info(f" {value, agg} stats computed")
-        results[(value, agg)] = ordinal_encoded_postprocess(
-            df, stat, encoder, by, [value]
-        )
-        logging.info(f" {value, agg} postprocessed")
-    return results
+        func.setdefault(value, []).append(agg)
+    results = ordinal_encoded_fused_agg(df, df_groupby, encoder, by, func)
+    logging.info("fused stats computed and postprocessed")
+    return {pair: results[pair] for pair in value_agg_pairs}
+
+
+def ordinal_encoded_fused_agg(
+    df: VDataFrame,
+    df_groupby: DataFrameGroupBy,
+    encoder: VOrdinalEncoder,
+    by: List[str],
+    func: Dict[str, List[str]],
+) -> Dict[Tuple[str, str], pd.DataFrame]:
+    """run all aggregations in func at once and inverse encode the keys once"""
+    stats = df_groupby.agg(func)
+    pairs = list(stats.columns)
+    # flatten columns, so keys are inverse encoded once for all pairs
+    flat_names = [f"__agg_{i}" for i in range(len(pairs))]
+    stats.columns = flat_names
+    stats = ordinal_encoded_postprocess(df, stats, encoder, by, flat_names)
+    return {
+        pair: stats[[flat_name]].rename(columns={flat_name: pair[0]})
+        for pair, flat_name in zip(pairs, flat_names)
+    }
 
 
 def ordinal_encoded_groupby_aggs(
@@ -111,14 +125,10 @@ def ordinal_encoded_groupby_aggs(
     max_group_size: int = None,
 ):
     df_groupby, encoder = ordinal_encoded_groupby(df, by, values, spu, max_group_size)
-    results = {}
-    for agg in aggs:
-        stat = getattr(
-            df_groupby,
-            agg,
-        )()
-
-        stat = ordinal_encoded_postprocess(df, stat, encoder, by, values)
-        results[agg] = stat
-
-    return results
+    results = ordinal_encoded_fused_agg(
+        df, df_groupby, encoder, by, {value: aggs for value in values}
+    )
+    return {
+        agg: pd.concat([results[(value, agg)] for value in values], axis=1)
+        for agg in aggs
+    }
@@ -14,13 +14,13 @@
 
 # TODO: HDataFrame, VDataFrame and SPU support in future
 
-from typing import Union
+from typing import Dict, List, Union
 
 from secretflow.data import FedNdarray
 from secretflow.data.vertical import VDataFrame
 from secretflow.device import PYUObject
 
-from .core import psi
+from .core import psi, psi_table
 
 
 def psi_eval(
@@ -71,3 +71,50 @@ def psi_eval(
     else:
         Y = ([*Y.partitions.values()][0]).data
     return device(psi)(X, Y, split_points)
+
+
+def psi_table_eval(
+    X: VDataFrame,
+    Y: VDataFrame,
+    split_points: Dict[str, List[float]],
+    block_elements: int = 10000000,
+) -> List[PYUObject]:
+    """Calculate population stability index of many features at once.
+
+    Every party bins all of its features in one pass over its partitions of X
+    and Y, instead of one psi_eval per feature.
+
+    Args:
+        X: VDataFrame
+            a collection of samples
+        Y: VDataFrame
+            a collection of samples, partitioned by the same parties as X.
+        split_points: Dict[str, List[float]]
+            ordered split points of each feature to evaluate.
+        block_elements: int
+            max elements binned at a time, see `core.psi_core.batch_bin_counts`.
+    Returns:
+        result: List[PYUObject]
+            one pd.DataFrame per party that holds some features, indexed by
+            feature with column psi.
+    """
+    assert isinstance(X, VDataFrame), "X should be VDataFrame"
+    assert isinstance(Y, VDataFrame), "Y should be VDataFrame"
+    assert (
+        X.partitions.keys() == Y.partitions.keys()
+    ), "X and Y should have the same partitions"
+
+    results = []
+    for device, x_part in X.partitions.items():
+        cols = [c for c in x_part.columns if c in split_points]
+        if not cols:
+            continue
+        results.append(
+            device(psi_table)(
+                x_part.data,
+                Y.partitions[device].data,
+                {c: split_points[c] for c in cols},
+                block_elements=block_elements,
+            )
+        )
+    return results
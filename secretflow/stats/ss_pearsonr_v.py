@@ -11,13 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import math
-
 import secretflow as sf
 from secretflow.data.vertical import VDataFrame
 from secretflow.device import SPU
-from secretflow.preprocessing.scaler import StandardScaler
-from secretflow.utils.blocked_ops import block_compute_vdata
+from secretflow.stats.core.gram import GramCache, get_gram_moments
 
 
 class PearsonR:
@@ -34,10 +31,13 @@ class PearsonR:
     Attributes:
 
         device: SPU Device
+        gram_cache: GramCache to share X.T @ X with VIF/PValue on same dataset,
+            computed for every call if None.
     """
 
-    def __init__(self, device: SPU):
+    def __init__(self, device: SPU, gram_cache: GramCache = None):
         self.spu_device = device
+        self.gram_cache = gram_cache
 
     def pearsonr(
         self,
@@ -58,17 +58,12 @@ class PearsonR:
                 - after standardize, the variance is 1 and the mean is 0, which can simplify the calculation.
         """
 
-        if standardize:
-            scaler = StandardScaler()
-            vdata = scaler.fit_transform(vdata)
-        rows = vdata.shape[0]
-        cols = vdata.shape[1]
-        row_number = max([math.ceil(infeed_elements_limit / cols), 1])
-
-        spu = self.spu_device
-
-        xTx = block_compute_vdata(
-            vdata, row_number, spu, lambda x: x.T @ x, lambda x, y: x + y
+        gram = get_gram_moments(
+            vdata,
+            self.spu_device,
+            standardize,
+            infeed_elements_limit,
+            self.gram_cache,
         )
-        xtx = sf.reveal(xTx)
-        return xtx / (rows - 1)
+        xtx = sf.reveal(gram.xtx())
+        return xtx / (gram.rows - 1)
@@ -22,14 +22,10 @@ from scipy import stats
 import secretflow as sf
 from secretflow.data.vertical import VDataFrame
 from secretflow.device import SPU, SPUObject, reveal
-from secretflow.utils.blocked_ops import (
-    block_compute,
-    block_compute_vdata,
-    cut_device_object,
-    cut_vdata,
-)
+from secretflow.utils.blocked_ops import block_compute, cut_device_object, cut_vdata
 from secretflow.utils.sigmoid import SigType
 
+from .core.gram import GramCache, get_gram_moments
 from .core.utils import newton_matrix_inverse
 
 
@@ -94,10 +90,13 @@ class PValue:
     Attributes:
 
         device: SPU Device
+        gram_cache: GramCache to share [X 1].T @ [X 1] of linear model with
+            PearsonR/VIF (standardize=False) on same dataset.
     """
 
-    def __init__(self, spu: SPU) -> None:
+    def __init__(self, spu: SPU, gram_cache: GramCache = None) -> None:
         self.spu = spu
+        self.gram_cache = gram_cache
 
     def _prepare_dataset(self, ds: VDataFrame) -> Tuple[SPUObject]:
         """
@@ -134,16 +133,10 @@ class PValue:
             x_shape[0] > x_shape[1]
         ), "num of samples must greater than num of features"
 
-        row_number = max([math.ceil(self.infeed_elements_limit / x_shape[1]), 1])
-
-        xTx = block_compute_vdata(
-            x,
-            row_number,
-            self.spu,
-            lambda x: x.T @ x,
-            lambda x, y: x + y,
-            pad_ones=True,
+        gram = get_gram_moments(
+            x, self.spu, False, self.infeed_elements_limit, self.gram_cache
         )
+        xTx = gram.gram
         y = self._prepare_dataset(y)
         assert len(y) == 1, "label should came from one party"
         y = y[0]
@@ -11,16 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import math
-
 import jax.numpy as jnp
 
 import secretflow as sf
 from secretflow.data.vertical import VDataFrame
 from secretflow.device import SPU
-from secretflow.preprocessing.scaler import StandardScaler
+from secretflow.stats.core.gram import GramCache, get_gram_moments
 from secretflow.stats.core.utils import newton_matrix_inverse
-from secretflow.utils.blocked_ops import block_compute_vdata
 
 
 class VIF:
@@ -54,10 +51,13 @@ class VIF:
 
     Attributes:
         device: SPU Device
+        gram_cache: GramCache to share X.T @ X with PearsonR/PValue on same dataset,
+            computed for every call if None.
     """
 
-    def __init__(self, device: SPU):
+    def __init__(self, device: SPU, gram_cache: GramCache = None):
         self.spu_device = device
+        self.gram_cache = gram_cache
 
     def vif(
         self,
@@ -78,21 +78,13 @@ class VIF:
                 - after standardize, the variance is 1 and the mean is 0, which can simplify the calculation.
 
         """
-        if standardize:
-            scaler = StandardScaler()
-            vdata = scaler.fit_transform(vdata)
-
-        rows = vdata.shape[0]
-        cols = vdata.shape[1]
-        row_number = max([math.ceil(infeed_elements_limit / cols), 1])
-
         spu = self.spu_device
-
-        xTx = block_compute_vdata(
-            vdata, row_number, spu, lambda x: x.T @ x, lambda x, y: x + y
+        gram = get_gram_moments(
+            vdata, spu, standardize, infeed_elements_limit, self.gram_cache
         )
+        rows = gram.rows
 
-        x_inv = spu(newton_matrix_inverse)(xTx)
+        x_inv = spu(newton_matrix_inverse)(gram.xtx())
 
         def compute_diag(x, multiplier):
             return jnp.diagonal(x) * multiplier
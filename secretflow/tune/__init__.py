@@ -30,6 +30,6 @@ except ImportError as exc:
 from . import train
 from .result_grid import ResultGrid
 from .search import grid_search
-from .trainable import with_parameters, with_resources
+from .trainable import clear_trial_cache, trial_cache, with_parameters, with_resources
 from .tune_config import TuneConfig
 from .tuner import Tuner
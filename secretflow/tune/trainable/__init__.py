@@ -12,4 +12,4 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .util import with_parameters, with_resources
+from .util import clear_trial_cache, trial_cache, with_parameters, with_resources
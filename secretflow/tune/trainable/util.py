@@ -12,7 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any, Callable, Dict
+
 from ray import tune
 
 with_resources = tune.with_resources
 with_parameters = tune.with_parameters
+
+_trial_cache: Dict[str, Any] = {}
+
+
+def trial_cache(key: str, loader: Callable[[], Any]) -> Any:
+    """Get an object cached in the current trial worker, or create it by loader.
+
+    Trials run one after another on a worker when `TuneConfig(reuse_actors=True)`,
+    so devices (e.g. SPU) and datasets loaded into them by a trial can be reused by
+    later trials instead of being created again.
+
+    Args:
+        key: cache key, should identify everything loader depends on.
+        loader: called without arguments on a cache miss.
+    """
+    if key not in _trial_cache:
+        _trial_cache[key] = loader()
+    return _trial_cache[key]
+
+
+def clear_trial_cache():
+    _trial_cache.clear()
@@ -60,6 +60,9 @@ class Tuner:
         run_config: Runtime configuration that is specific to individual trials.
             If passed, this will overwrite the run config passed to the Trainer,
             if applicable. Refer to ray.air.config.RunConfig for more info.
+        trials_per_device: How many trials share the resources of each device (party)
+            concurrently when cluster_resources is None. Default resources of a trial
+            are divided by it, lightweight trials can be packed to run in parallel.
     Basic usage:
 
     .. code-block:: python
@@ -115,6 +118,29 @@ class Tuner:
 
     Note that List input can also work in debug mode, the program will consider the total
     sum of all resources in the list as the resources used by one trail.
+
+    To pack lightweight trials onto the same devices, use trials_per_device instead of
+    writing cluster_resources by hand. Devices and datasets created in a trial can be
+    shared with later trials on the same worker by `tune.trial_cache` together with
+    `TuneConfig(reuse_actors=True)`, and model loops can report metrics of each round
+    (`AutoMLCallback` of SL, `enable_tune_report` of SGB) for early stopping schedulers
+    like `ray.tune.schedulers.ASHAScheduler`.
+
+    .. code-block:: python
+
+        def trainable(config):
+            spu = tune.trial_cache('spu', lambda: sf.SPU(cluster_def))
+            ...
+
+        tuner = tune.Tuner(
+            trainable,
+            trials_per_device=4,
+            param_space={'a': tune.grid_search([1, 2, 3, 4])},
+            tune_config=tune.TuneConfig(
+                scheduler=ASHAScheduler(metric='val-roc_auc', mode='max'),
+                reuse_actors=True,
+            ),
+        )
     """
 
     ray_tune: tune.Tuner
@@ -129,7 +155,12 @@ class Tuner:
         param_space: Optional[Dict[str, Any]] = None,
         tune_config: Optional[TuneConfig] = None,
         run_config: Optional[RunConfig] = None,
+        trials_per_device: int = 1,
     ):
+        assert (
+            isinstance(trials_per_device, int) and trials_per_device >= 1
+        ), f"trials_per_device should be a positive int, got {trials_per_device}"
+        self.trials_per_device = trials_per_device
         trainable = self._handle_global_params(trainable)
         trainable = self._construct_trainable_with_resources(
             trainable, cluster_resources
@@ -212,6 +243,8 @@ class Tuner:
         return tune_resources
 
     def _default_cluster_resource(self, avaliable_resources, is_debug=False):
+        if self.trials_per_device > 1:
+            return self._packed_cluster_resource(avaliable_resources, is_debug)
         logging.warning(
             f"Tuner() got arguments cluster_resources=None. "
             f"The Tuner will defaultly use as many as cluster resources in each experiment."
@@ -248,6 +281,36 @@ class Tuner:
                 cluster_resources.append(party_resources)
         return cluster_resources
 
+    def _packed_cluster_resource(self, avaliable_resources, is_debug=False):
+        """Resources of one trial when trials_per_device trials share each device."""
+        parties = global_state.parties()
+        node_nums = len(ray.nodes())
+        packs = self.trials_per_device
+        if is_debug:
+            return [
+                {
+                    res_name: avalia / packs
+                    for res_name, avalia in avaliable_resources.items()
+                    if self._is_consumable_resource(res_name)
+                }
+            ]
+        cluster_resources = []
+        for party in parties:
+            # every task or actor of a party takes 1 of the party resource.
+            party_share = avaliable_resources[party] // (node_nums * packs)
+            assert party_share >= 1, (
+                f"Party {party} has {avaliable_resources[party]} resources on "
+                f"{node_nums} nodes, which can not be shared by {packs} trials."
+            )
+            party_resources = {party: party_share}
+            for res_name, avalia in avaliable_resources.items():
+                if self._is_consumable_resource(res_name) and res_name not in parties:
+                    party_resources[res_name] = max(
+                        avalia / node_nums / len(parties) / packs, 0
+                    )
+            cluster_resources.append(party_resources)
+        return cluster_resources
+
     @staticmethod
     def _is_consumable_resource(resource_name: str) -> bool:
         """Check if the resource name is a consumable resource."""
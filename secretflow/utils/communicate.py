@@ -13,3 +13,18 @@ class ForwardData:
 
     hidden: Union[Any, List[Any]] = None
     losses: Any = None
+
+
+@dataclass
+class PackedTensor:
+    """
+    PackedTensor is a dataclass for a tensor sent between parties in reduced precision.
+
+    data: tensor in transport precision (float16, bfloat16 or int8)
+    scale: per channel scale of int8 data, None for float data
+    dtype: original dtype to restore on receipt
+    """
+
+    data: Any = None
+    scale: Any = None
+    dtype: Any = None
@@ -0,0 +1,222 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import logging
+import os
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+_current_tracer: ContextVar = ContextVar("secretflow_span_tracer", default=None)
+
+
+@dataclass
+class Span:
+    name: str
+    cat: str
+    start: float
+    end: float = None
+    device: str = None
+    depth: int = 0
+    thread: int = 0
+    args: Dict = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.time()) - self.start
+
+
+class SpanTracer:
+    """Records nested spans and per device counters of one evaluation.
+
+    Device apis report to the tracer activated in current context, see
+    `trace_span` and `watch_device`. Spans of async device calls cover the
+    driver side dispatch, blocking time shows up in `reveal`/`wait` spans.
+    """
+
+    def __init__(self, max_spans: int = 100000, device_stats: bool = True) -> None:
+        """
+        Args:
+            max_spans: spans kept for chrome trace, later ones are only
+                aggregated into summary.
+            device_stats: whether pull stats like link bytes of watched
+                devices, it costs a round of actor calls per device.
+        """
+        # device stats may be added by a finalizer, which runs in whatever
+        # code of this thread triggers garbage collection.
+        self.lock = threading.RLock()
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self.counters: Dict[str, Dict[str, float]] = {}
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.devices: Dict[str, Dict[str, float]] = {}
+        self.device_stats = device_stats
+        self._local = threading.local()
+        self._device_finalizers: List[weakref.finalize] = []
+
+    def _stack(self) -> List[Span]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str, device: str = None, **args):
+        stack = self._stack()
+        s = Span(
+            name=name,
+            cat=cat,
+            start=time.time(),
+            device=device,
+            depth=len(stack),
+            thread=threading.get_ident(),
+            args=args,
+        )
+        with self.lock:
+            if len(self.spans) < self.max_spans:
+                self.spans.append(s)
+            else:
+                self.dropped_spans += 1
+        stack.append(s)
+        try:
+            yield s
+        finally:
+            s.end = time.time()
+            stack.pop()
+            self._aggregate(s, nested=any(p.cat == s.cat for p in stack))
+
+    def _aggregate(self, s: Span, nested: bool) -> None:
+        with self.lock:
+            phase = self.phases.setdefault(s.cat, {"count": 0, "time": 0.0})
+            phase["count"] += 1
+            # time of spans nested in a span of the same category is already
+            # covered by the outer one.
+            if not nested:
+                phase["time"] += s.duration
+            if s.device is not None:
+                d = self.devices.setdefault(s.device, {})
+                d[f"{s.cat}_count"] = d.get(f"{s.cat}_count", 0) + 1
+                d[f"{s.cat}_time"] = d.get(f"{s.cat}_time", 0.0) + s.duration
+
+    def add(self, device: str, key: str, value: float) -> None:
+        with self.lock:
+            device_counters = self.counters.setdefault(device, {})
+            device_counters[key] = device_counters.get(key, 0) + value
+
+    def watch_device(self, device) -> None:
+        """Add stats of device to counters once, when it is garbage collected
+        or in `collect_device_stats`, whichever comes first.
+
+        device provides `trace_stats_collector`, a callable which does not
+        hold the device, so stats are pulled right before the device is gone.
+        """
+        if not self.device_stats:
+            return
+        finalizer = weakref.finalize(
+            device, self._collect_device_stats, device.trace_stats_collector()
+        )
+        # devices outliving the tracer are collected by collect_device_stats,
+        # not at interpreter exit.
+        finalizer.atexit = False
+        with self.lock:
+            self._device_finalizers.append(finalizer)
+
+    def _collect_device_stats(self, collector: Callable[[], Dict]) -> None:
+        try:
+            device_stats = collector()
+        except Exception as e:
+            logging.warning(f"failed to collect device stats: {e}")
+            return
+        for name, stats in device_stats.items():
+            for key, value in stats.items():
+                self.add(name, key, value)
+
+    def collect_device_stats(self) -> None:
+        """Pull stats of watched devices still alive, must be called before
+        they are shut down."""
+        with self.lock:
+            finalizers, self._device_finalizers = self._device_finalizers, []
+        for finalizer in finalizers:
+            # no-op if the device is already collected.
+            finalizer()
+
+    @contextlib.contextmanager
+    def activate(self):
+        token = _current_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _current_tracer.reset(token)
+
+    def summary(self) -> Dict:
+        """Count and time of spans per category and per device, with device
+        counters."""
+        with self.lock:
+            phases = {cat: dict(p) for cat, p in self.phases.items()}
+            devices = {d: dict(c) for d, c in self.devices.items()}
+            for device, c in self.counters.items():
+                devices.setdefault(device, {}).update(c)
+        return {"phases": phases, "devices": devices}
+
+    def chrome_trace(self) -> Dict:
+        """Spans in Chrome trace event format, load it in chrome://tracing or
+        https://ui.perfetto.dev."""
+        pid = os.getpid()
+        with self.lock:
+            spans = list(self.spans)
+            counters = {d: dict(c) for d, c in self.counters.items()}
+        events = []
+        for s in spans:
+            args = dict(s.args)
+            if s.device is not None:
+                args["device"] = s.device
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.cat,
+                    "ph": "X",
+                    "ts": s.start * 1e6,
+                    "dur": s.duration * 1e6,
+                    "pid": pid,
+                    "tid": s.thread,
+                    "args": args,
+                }
+            )
+        ts = max((s.start + s.duration for s in spans), default=time.time()) * 1e6
+        for device, c in counters.items():
+            events.append({"name": device, "ph": "C", "ts": ts, "pid": pid, "args": c})
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_spans": self.dropped_spans},
+        }
+
+
+def trace_span(name: str, cat: str, device=None, **args):
+    """Context manager recording a span to the tracer of current context, no-op
+    if there is none."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.span(name, cat, None if device is None else str(device), **args)
+
+
+def watch_device(device) -> None:
+    tracer = _current_tracer.get()
+    if tracer is not None:
+        tracer.watch_device(device)
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+from secretflow.component.entry import COMP_MAP, COMPONENT_INDEX, gen_key
+
+
+def test_lazy_import():
+    # importing the registry should not import any component module.
+    code = (
+        "import sys\n"
+        "import secretflow.component.entry as entry\n"
+        "mods = {m for _, _, _, m, _ in entry.COMPONENT_INDEX}\n"
+        "assert not mods & set(sys.modules), mods & set(sys.modules)\n"
+        "assert 'secretflow.ml' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_component_index():
+    assert len(COMP_MAP) == len(COMPONENT_INDEX)
+    for key, comp in COMP_MAP.items():
+        comp_def = comp.definition()
+        assert key == gen_key(comp_def.domain, comp_def.name, comp_def.version)
+
+    from secretflow.component.entry import COMP_LIST
+
+    assert len(COMP_LIST.comps) == len(COMPONENT_INDEX)
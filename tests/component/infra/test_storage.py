@@ -8,7 +8,10 @@ import tempfile
 import urllib
 import uuid
 
+import pytest
+
 from secretflow.component.storage import ComponentStorage
+from secretflow.component.storage.impl.storage_impl import S3StorageImpl
 from secretflow.spec.v1.data_pb2 import StorageConfig
 
 
@@ -110,3 +113,48 @@ def test_all():
             type="local_fs", local_fs=StorageConfig.LocalFSConfig(wd=f"{remote_wd}")
         )
         test_fn(local_config)
+
+
+def test_s3_multipart():
+    part_size = 5 * 1024 * 1024
+    data = os.urandom(part_size * 2 + 1024)
+
+    for config in build_s3_config():
+        impl = S3StorageImpl(config, part_size=part_size, max_concurrency=2)
+        remote_fn = str(uuid.uuid4())
+        with tempfile.TemporaryDirectory() as wd:
+            local_fn = os.path.join(wd, remote_fn)
+            with open(local_fn, "wb") as f:
+                f.write(data)
+            impl.upload_file(remote_fn, local_fn)
+            assert impl.get_file_meta(remote_fn)["size"] == len(data)
+            assert not os.path.exists(local_fn + ".s3upload.json")
+
+            # fail the last part, then resume without fetching finished parts.
+            download_fn = os.path.join(wd, "download")
+            cat_file = impl._s3_client.cat_file
+            fetched = []
+
+            def failing_cat_file(path, start=None, end=None):
+                if end == len(data):
+                    raise OSError("injected failure")
+                fetched.append(start)
+                return cat_file(path, start=start, end=end)
+
+            impl._s3_client.cat_file = failing_cat_file
+            with pytest.raises(OSError):
+                impl.download_file(remote_fn, download_fn)
+            assert sorted(fetched) == [0, part_size]
+            assert os.path.exists(download_fn + ".s3part.json")
+
+            def counting_cat_file(path, start=None, end=None):
+                fetched.append(start)
+                return cat_file(path, start=start, end=end)
+
+            fetched.clear()
+            impl._s3_client.cat_file = counting_cat_file
+            impl.download_file(remote_fn, download_fn)
+            assert fetched == [part_size * 2]
+            with open(download_fn, "rb") as f:
+                assert f.read() == data
+            assert not os.path.exists(download_fn + ".s3part.json")
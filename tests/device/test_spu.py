@@ -7,6 +7,8 @@ from jax.example_libraries.stax import Dense, Relu
 
 import secretflow as sf
 from secretflow.device.device.spu import SPUObject
+from secretflow.device.kernels.spu import spu_to_pyu_blocks, spu_to_pyu_file
+from secretflow.utils.tracing import SpanTracer
 
 
 def MLP():
@@ -147,3 +149,95 @@ def test_dump_load_prod(sf_production_setup_devices):
 
 def test_dump_load_sim(sf_simulation_setup_devices):
     _test_dump_load(sf_simulation_setup_devices)
+
+
+def _test_reveal_blocks(devices):
+    x = devices.alice(np.random.uniform)(-10, 10, (103, 4))
+    x_spu = x.to(devices.spu)
+    expected = sf.reveal(x)
+
+    blocks = list(spu_to_pyu_blocks(x_spu, devices.bob, 10))
+    assert len(blocks) == 11
+    assert all(block.device == devices.bob for block in blocks)
+    np.testing.assert_almost_equal(
+        np.concatenate(sf.reveal(blocks), axis=0), expected, decimal=5
+    )
+
+    _, npy_path = tempfile.mkstemp(suffix='.npy')
+    rows = spu_to_pyu_file(x_spu, devices.bob, npy_path, 16)
+    assert sf.reveal(rows) == 103
+    np.testing.assert_almost_equal(np.load(npy_path), expected, decimal=5)
+
+    _, csv_path = tempfile.mkstemp(suffix='.csv')
+    rows = spu_to_pyu_file(x_spu, devices.bob, csv_path, 16, file_format='csv')
+    assert sf.reveal(rows) == 103
+    np.testing.assert_almost_equal(
+        np.loadtxt(csv_path, delimiter=','), expected, decimal=5
+    )
+
+
+def test_reveal_blocks_prod(sf_production_setup_devices):
+    _test_reveal_blocks(sf_production_setup_devices)
+
+
+def test_reveal_blocks_sim(sf_simulation_setup_devices):
+    _test_reveal_blocks(sf_simulation_setup_devices)
+
+
+def _test_batched_del(devices):
+    spu = devices.spu
+    spu.flush_dels()
+    batch_size = spu.share_del_batch_size
+    xs = [
+        devices.alice(lambda i: np.ones(3) * i)(i).to(spu)
+        for i in range(batch_size + 2)
+    ]
+    # below batch size, deletions stay queued.
+    del xs[: batch_size - 1]
+    assert len(spu._pending_dels) == batch_size - 1
+    # reaching batch size flushes the queue.
+    del xs[0]
+    assert len(spu._pending_dels) == 0
+
+    del xs[0]
+    assert len(spu._pending_dels) == 1
+    spu.flush_dels()
+    assert len(spu._pending_dels) == 0
+
+    # reveal flushes pending deletions of the spu.
+    del xs[0]
+    assert len(spu._pending_dels) == 1
+    x = devices.alice(np.ones)(3).to(spu)
+    sf.reveal(x)
+    assert len(spu._pending_dels) == 0
+
+    # runtime is still usable after deleting a batch of vars.
+    x = devices.alice(np.ones)(3).to(spu)
+    y = spu(lambda a: a + 1)(x)
+    np.testing.assert_almost_equal(sf.reveal(y), np.ones(3) * 2, decimal=5)
+
+
+def test_batched_del_prod(sf_production_setup_devices):
+    _test_batched_del(sf_production_setup_devices)
+
+
+def test_batched_del_sim(sf_simulation_setup_devices):
+    _test_batched_del(sf_simulation_setup_devices)
+
+
+def test_spu_trace_stats(sf_production_setup_devices):
+    devices = sf_production_setup_devices
+    spu = devices.spu
+    tracer = SpanTracer()
+    tracer.watch_device(spu)
+    with tracer.activate():
+        x = devices.alice(np.ones)(3).to(spu)
+        y = devices.bob(np.ones)(3).to(spu)
+        sf.reveal(spu(lambda a, b: a * b)(x, y))
+    tracer.collect_device_stats()
+
+    stats = tracer.summary()["devices"]
+    for party in spu.actors:
+        link = stats[f"{spu.trace_name()}/{party}"]
+        assert link["sent_bytes"] > 0 and link["recv_bytes"] > 0
+    assert stats[spu.trace_name()]["spu_run_count"] == 1
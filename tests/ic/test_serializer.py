@@ -0,0 +1,56 @@
+import numpy as np
+
+from secretflow.ic.proxy.serializer import deserialize_frames, serialize_frames
+
+
+def _round_trip(data, chunk_bytes):
+    frames = list(serialize_frames(data, chunk_bytes))
+    it = iter(frames)
+    out = deserialize_frames(lambda: next(it))
+    # all frames are consumed
+    assert next(it, None) is None
+    return frames, out
+
+
+def test_ndarray_rows():
+    x = np.arange(100 * 3, dtype=np.float32).reshape(100, 3)
+    # 12 bytes per row, 3 rows per chunk
+    frames, out = _round_trip(x, 40)
+    assert len(frames) == 1 + 34
+    np.testing.assert_equal(out, x)
+    assert out.dtype == x.dtype
+
+
+def test_ndarray_exact_multiple_of_chunk_bytes():
+    x = np.arange(64, dtype=np.int64).reshape(16, 4)
+    # 32 bytes per row, 4 rows per chunk
+    frames, out = _round_trip(x, 128)
+    assert len(frames) == 1 + 4
+    np.testing.assert_equal(out, x)
+
+    # exactly chunk_bytes is not chunked
+    frames, out = _round_trip(x, x.nbytes)
+    assert len(frames) == 1
+    np.testing.assert_equal(out, x)
+
+
+def test_ndarray_list():
+    data = [np.full((10,), i, dtype=np.int32) for i in range(7)]
+    # 40 bytes per item, 2 items per group
+    frames, out = _round_trip(data, 80)
+    assert len(frames) == 1 + 4
+    assert len(out) == len(data)
+    for a, b in zip(out, data):
+        np.testing.assert_equal(a, b)
+
+
+def test_small_messages_inline():
+    for data in [-135, True, [1, 2, -3], np.array([[1, 2], [3, -4]])]:
+        frames, out = _round_trip(data, 1 << 20)
+        assert len(frames) == 1
+        np.testing.assert_equal(out, data)
+
+    # int lists look like headers but are not tagged as ones.
+    frames, out = _round_trip([1, 2, 3, 4], 1)
+    assert len(frames) == 1
+    assert out == [1, 2, 3, 4]
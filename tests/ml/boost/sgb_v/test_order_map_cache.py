@@ -0,0 +1,64 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+
+from secretflow.ml.boost.sgb_v.factory.components.order_map_manager.order_map_actor import (
+    OrderMapActor,
+)
+from secretflow.ml.boost.sgb_v.factory.components.order_map_manager.order_map_cache import (
+    load_order_map_cache,
+    order_map_cache_key,
+)
+
+
+def test_order_map_cache(tmp_path):
+    cache_dir = str(tmp_path)
+    x = np.random.random((1000, 5))
+    # a categorical column produces padded inf split points
+    x[:, 0] = np.random.randint(0, 3, 1000)
+    buckets = 10
+
+    expected_actor = OrderMapActor(0)
+    expected = expected_actor.build_order_map(x, buckets, 42)
+
+    key = order_map_cache_key(x, buckets)
+    assert load_order_map_cache(cache_dir, key) is None
+
+    first_actor = OrderMapActor(0)
+    first = first_actor.build_order_map(x, buckets, 42, cache_dir)
+    assert load_order_map_cache(cache_dir, key) is not None
+    assert len(os.listdir(cache_dir)) == 2
+
+    second_actor = OrderMapActor(0)
+    second = second_actor.build_order_map(x, buckets, 42, cache_dir)
+    assert isinstance(second, np.memmap)
+
+    np.testing.assert_equal(first, expected)
+    np.testing.assert_equal(second, expected)
+    assert (
+        second_actor.get_split_points() == expected_actor.get_split_points()
+    ), "cached split points should match rebuilt ones"
+    assert second_actor.get_feature_buckets() == expected_actor.get_feature_buckets()
+    np.testing.assert_equal(
+        second_actor.compute_left_child_selects(1, 3),
+        expected_actor.compute_left_child_selects(1, 3),
+    )
+
+    # different bucket number or data should miss
+    assert order_map_cache_key(x, buckets + 1) != key
+    x[0, 0] += 1
+    assert order_map_cache_key(x, buckets) != key
@@ -16,6 +16,8 @@ import logging
 import os
 import time
 
+import numpy as np
+
 from secretflow.data import FedNdarray, PartitionWay
 from secretflow.device.driver import reveal
 from secretflow.ml.boost.sgb_v import Sgb
@@ -43,6 +45,8 @@ def _run_sgb(
     enable_goss=False,
     num_boost_round=2,
     num_tree_cap=2,
+    leaf_wise_expand_num=1,
+    enable_batch_decrypt=False,
 ):
     test_name = test_name + "_with_method_" + tree_grow_method
     sgb = Sgb(env.heu)
@@ -53,6 +57,7 @@ def _run_sgb(
         'num_boost_round': num_boost_round + 1,
         'max_depth': 3,
         'max_leaf': 2**3,
+        'leaf_wise_expand_num': leaf_wise_expand_num,
         'sketch_eps': 0.25,
         'objective': 'logistic' if logistic else 'linear',
         'reg_lambda': 0.1,
@@ -73,6 +78,7 @@ def _run_sgb(
         'enable_goss': enable_goss,
         'enable_quantization': True,  # surprisingly, quantization may also improve auc on some datasets
         'enable_packbits': False,
+        'enable_batch_decrypt': enable_batch_decrypt,
         'eval_metric': 'roc_auc' if logistic else 'mse',
         'enable_monitor': True,
         'enable_early_stop': True,
@@ -133,7 +139,9 @@ def _run_sgb(
     )
 
 
-def _run_npc_linear(env, test_name, parts, label_device, auc=0.88):
+def _run_npc_linear(
+    env, test_name, parts, label_device, auc=0.88, enable_batch_decrypt=False
+):
     vdf = load_linear(parts=parts)
 
     label_data = vdf['y']
@@ -146,7 +154,18 @@ def _run_npc_linear(env, test_name, parts, label_device, auc=0.88):
     label_data = label_data[:500, :]
 
     logging.info("running XGB style test")
-    _run_sgb(env, test_name, v_data, label_data, y, True, 0.9, 1, auc_bar=auc)
+    _run_sgb(
+        env,
+        test_name,
+        v_data,
+        label_data,
+        y,
+        True,
+        0.9,
+        1,
+        auc_bar=auc,
+        enable_batch_decrypt=enable_batch_decrypt,
+    )
     logging.info("running lightGBM style test")
     # test with leaf wise growth and goss: lightGBM style
     _run_sgb(
@@ -163,6 +182,7 @@ def _run_npc_linear(env, test_name, parts, label_device, auc=0.88):
         2.3,
         'leaf',
         True,
+        enable_batch_decrypt=enable_batch_decrypt,
     )
 
 
@@ -191,6 +211,7 @@ def test_4pc_linear(sf_production_setup_devices_aby3):
         "4pc_linear",
         parts,
         sf_production_setup_devices_aby3.alice,
+        enable_batch_decrypt=True,
     )
 
 
@@ -276,6 +297,23 @@ def test_breast_cancer(sf_production_setup_devices_aby3):
         num_tree_cap=3,
     )
 
+    # test with leaf wise growth, expanding top gain nodes together
+    _run_sgb(
+        sf_production_setup_devices_aby3,
+        "breast_cancer_concurrent_expand",
+        v_data,
+        label_data,
+        y,
+        True,
+        0.9,
+        1,
+        {},
+        0.9,
+        2.3,
+        'leaf',
+        leaf_wise_expand_num=4,
+    )
+
 
 def test_dermatology(sf_production_setup_devices_aby3):
     vdf = (
@@ -327,3 +365,51 @@ def test_dermatology(sf_production_setup_devices_aby3):
         'leaf',
         True,
     )
+
+
+def test_iris_multi_class(sf_production_setup_devices_aby3):
+    from sklearn.datasets import load_iris
+
+    ds = load_iris()
+    x, y = ds['data'], ds['target'].reshape(-1, 1)
+    alice = sf_production_setup_devices_aby3.alice
+    bob = sf_production_setup_devices_aby3.bob
+
+    v_data = FedNdarray(
+        {
+            alice: alice(lambda: x[:, :2])(),
+            bob: bob(lambda: x[:, 2:])(),
+        },
+        partition_way=PartitionWay.VERTICAL,
+    )
+    label_data = FedNdarray(
+        {alice: alice(lambda: y)()},
+        partition_way=PartitionWay.VERTICAL,
+    )
+
+    for tree_grow_method in ['level', 'leaf']:
+        sgb = Sgb(sf_production_setup_devices_aby3.heu)
+        params = {
+            'tree_growing_method': tree_grow_method,
+            'num_boost_round': 3,
+            'max_depth': 3,
+            'max_leaf': 2**3,
+            'objective': 'softmax',
+            'num_class': 3,
+            'base_score': 0.0,
+            'seed': 42,
+            'first_tree_with_label_holder_feature': False,
+            'eval_metric': 'mlogloss',
+            'enable_monitor': True,
+        }
+        model = sgb.train(params, v_data, label_data)
+        # every tree holds one leaf weight per class
+        leaf_weight = reveal(model.trees[0].get_leaf_weight())
+        assert leaf_weight.shape[1] == 3
+
+        yhat = reveal(model.predict(v_data))
+        assert yhat.shape == (y.shape[0], 3)
+        np.testing.assert_allclose(np.sum(yhat, axis=1), 1, rtol=1e-4)
+        accuracy = np.mean(np.argmax(yhat, axis=1) == y.reshape(-1))
+        logging.info(f"iris {tree_grow_method} accuracy: {accuracy}")
+        assert accuracy > 0.9
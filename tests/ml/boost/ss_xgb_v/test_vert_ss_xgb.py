@@ -15,6 +15,7 @@
 import os
 import time
 
+import numpy as np
 from sklearn.metrics import mean_squared_error, roc_auc_score
 
 from secretflow.data import FedNdarray, PartitionWay
@@ -49,6 +50,9 @@ def _run_xgb(env, test_name, v_data, label_data, y, logistic, subsample, colsamp
     spu_yhat_02 = model02.predict(v_data)
     yhat02 = reveal(spu_yhat_02)
     print(f"{test_name} predict time: {time.time() - start}")
+    # predict tree by tree should match predict all trees in one spu program
+    yhat_per_tree = reveal(model.predict(v_data, tree_batch_size=1))
+    np.testing.assert_allclose(yhat, yhat_per_tree, rtol=1e-4, atol=1e-4)
     if logistic:
         print(f"{test_name} auc: {roc_auc_score(y, yhat)}")
         print(f"{test_name} auc02: {roc_auc_score(y, yhat02)}")
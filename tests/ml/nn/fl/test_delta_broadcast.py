@@ -0,0 +1,78 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from secretflow.ml.nn.fl.compress import (
+    DeltaBase,
+    delta_decode,
+    delta_encode,
+    sparsify_delta,
+)
+
+
+def test_sparsify_delta():
+    delta = np.zeros((10, 10), dtype=np.float32)
+    delta[1, 2] = 3.0
+    delta[4, 5] = -5.0
+    delta[7, 7] = 0.5
+
+    sparse = sparsify_delta(delta, topk_ratio=0.02)
+    assert sparse.bitmap is None
+    np.testing.assert_equal(sparse.indices, [12, 45])
+    expected = np.zeros_like(delta)
+    expected[1, 2], expected[4, 5] = 3.0, -5.0
+    np.testing.assert_equal(sparse.to_dense(), expected)
+
+    sparse = sparsify_delta(delta, threshold=0.1)
+    np.testing.assert_equal(sparse.to_dense(), delta)
+
+    # dense enough deltas are encoded as bitmap
+    delta = np.arange(64, dtype=np.float32).reshape(8, 8)
+    sparse = sparsify_delta(delta, topk_ratio=0.5)
+    assert sparse.indices is None and sparse.bitmap.nbytes == 8
+    expected = np.where(delta >= 32, delta, 0)
+    np.testing.assert_equal(sparse.to_dense(), expected)
+
+
+def test_delta_encode_decode():
+    rng = np.random.default_rng(0)
+    weights = [rng.random((4, 8), dtype=np.float32), rng.random(8, dtype=np.float32)]
+
+    payload, server_base = delta_encode(weights, None, 1, topk_ratio=0.25)
+    decoded, client_base = delta_decode(payload, None)
+    for w, d in zip(weights, decoded):
+        np.testing.assert_equal(w, d)
+
+    # only the largest quarter is sent, the rest is carried to next round
+    new_weights = [w + rng.normal(size=w.shape).astype(np.float32) for w in weights]
+    payload, server_base = delta_encode(new_weights, server_base, 2, topk_ratio=0.25)
+    decoded, client_base = delta_decode(payload, client_base)
+    for s, c in zip(server_base.weights, decoded):
+        np.testing.assert_equal(s, c)
+    assert not np.allclose(decoded[0], new_weights[0])
+
+    for version in range(3, 7):
+        payload, server_base = delta_encode(
+            new_weights, server_base, version, topk_ratio=0.25
+        )
+        decoded, client_base = delta_decode(payload, client_base)
+    for w, d in zip(new_weights, decoded):
+        np.testing.assert_allclose(w, d, rtol=1e-6)
+
+    # a payload based on another version cannot be applied
+    payload, _ = delta_encode(new_weights, server_base, 8)
+    with pytest.raises(RuntimeError):
+        delta_decode(payload, DeltaBase(5, client_base.weights))
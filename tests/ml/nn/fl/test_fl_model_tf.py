@@ -13,6 +13,7 @@ import os
 import tempfile
 
 import numpy as np
+import pytest
 import tensorflow as tf
 
 from secretflow.data.ndarray import load
@@ -23,6 +24,7 @@ from secretflow.preprocessing.encoder import OneHotEncoder
 from secretflow.security.aggregation import PlainAggregator, SparsePlainAggregator
 from secretflow.security.compare import PlainComparator
 from secretflow.security.privacy import DPStrategyFL, GaussianModelDP
+from secretflow.security.privacy.mechanism.torch import GaussianGradientDP
 from secretflow.utils.simulation.datasets import load_iris, load_mnist
 
 _temp_dir = tempfile.mkdtemp()
@@ -192,6 +194,17 @@ class TestFedModelDF:
         # assert global_metric[1].result().numpy() > 0.7
 
 
+def test_gradient_dp_unsupported():
+    gradient_dp = GaussianGradientDP(
+        noise_multiplier=0.1, batch_size=32, num_samples=1000
+    )
+    with pytest.raises(Exception, match='gradient_dp only supports torch'):
+        FLModel(
+            model=create_nn_model(4, 3, 8),
+            dp_strategy=DPStrategyFL(gradient_dp=gradient_dp),
+        )
+
+
 class TestFedModelCSV:
     def test_keras_model(self, sf_simulation_setup_devices):
         aggregator = PlainAggregator(sf_simulation_setup_devices.carol)
@@ -22,8 +22,13 @@ from secretflow.ml.nn.fl.compress import COMPRESS_STRATEGY
 from secretflow.ml.nn.fl.utils import metric_wrapper, optim_wrapper
 from secretflow.ml.nn.utils import TorchModel
 from secretflow.preprocessing.encoder import OneHotEncoder
-from secretflow.security.aggregation import PlainAggregator, SparsePlainAggregator
+from secretflow.security.aggregation import (
+    PlainAggregator,
+    SparsePlainAggregator,
+    SPUAggregator,
+)
 from secretflow.security.privacy import DPStrategyFL, GaussianModelDP
+from secretflow.security.privacy.mechanism.torch import GaussianGradientDP
 from secretflow.utils.simulation.datasets import load_iris, load_mnist
 from tests.ml.nn.fl.model_def import ConvNet, ConvRGBNet, MlpNet, ConvNetBN
 
@@ -50,11 +55,15 @@ def _torch_model_with_mnist(
         aggregator = SparsePlainAggregator(server)
     else:
         aggregator = PlainAggregator(server)
+    aggregator = kwargs.get("aggregator", aggregator)
 
     # spcify params
     dp_spent_step_freq = kwargs.get('dp_spent_step_freq', None)
     num_gpus = kwargs.get("num_gpus", 0)
     skip_bn = kwargs.get("skip_bn", False)
+    flat_weights = kwargs.get("flat_weights", False)
+    delta_topk_ratio = kwargs.get("delta_topk_ratio", None)
+    dp_strategy = kwargs.get("dp_strategy", None)
     fl_model = FLModel(
         server=server,
         device_list=device_list,
@@ -65,6 +74,10 @@ def _torch_model_with_mnist(
         random_seed=1234,
         num_gpus=num_gpus,
         skip_bn=skip_bn,
+        flat_weights=flat_weights,
+        delta_broadcast=delta_topk_ratio is not None,
+        delta_topk_ratio=delta_topk_ratio,
+        dp_strategy=dp_strategy,
     )
     history = fl_model.fit(
         data,
@@ -175,6 +188,41 @@ class TestFLModelTorchMnist:
             backend="torch",
         )
 
+        # Test fed_avg_w and fed_avg_u with flat weight buffers
+        for strategy in ['fed_avg_w', 'fed_avg_u']:
+            _torch_model_with_mnist(
+                devices=sf_simulation_setup_devices,
+                model_def=model_def,
+                data=mnist_data,
+                label=mnist_label,
+                strategy=strategy,
+                backend="torch",
+                flat_weights=True,
+            )
+
+        # Test fed_avg_w with sparse delta broadcast
+        _torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            model_def=model_def,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='fed_avg_w',
+            backend="torch",
+            delta_topk_ratio=0.3,
+        )
+
+        # delta broadcast falls back to full weights when averaged on spu
+        _torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            model_def=model_def,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='fed_avg_w',
+            backend="torch",
+            delta_topk_ratio=0.3,
+            aggregator=SPUAggregator(sf_simulation_setup_devices.spu),
+        )
+
         # Test fed_prox with mnist
         _torch_model_with_mnist(
             devices=sf_simulation_setup_devices,
@@ -230,6 +278,24 @@ class TestFLModelTorchMnist:
             dp_spent_step_freq=dp_spent_step_freq,
         )
 
+        # Test per sample gradient clipping
+        gaussian_gradient_dp = GaussianGradientDP(
+            noise_multiplier=0.001,
+            batch_size=128,
+            num_samples=4000,
+            l2_norm_clip=1.0,
+        )
+        _torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            model_def=model_def,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='fed_avg_w',
+            backend="torch",
+            dp_strategy=DPStrategyFL(gradient_dp=gaussian_gradient_dp),
+            dp_spent_step_freq=dp_spent_step_freq,
+        )
+
         # Test FedBN
         model_def_bn = TorchModel(
             model_fn=ConvNetBN,
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from pyarrow import ipc
+
+from secretflow.ml.nn.sl.predict_sink import PredictionSink
+
+
+def _read(path, file_format):
+    if file_format == 'csv':
+        return pd.read_csv(path)
+    elif file_format == 'arrow':
+        return ipc.open_file(path).read_all().to_pandas()
+    else:
+        return pq.read_table(path).to_pandas()
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'arrow', 'parquet'])
+def test_prediction_sink(tmp_path, file_format):
+    path = str(tmp_path / f'pred.{file_format}')
+    sink = PredictionSink(path, file_format)
+    y = np.random.rand(10, 2).astype(np.float32)
+    assert sink.write(y[:6]) == 6
+    assert sink.write(y[6:]) == 4
+    meta = sink.close()
+    assert meta['columns'] == ['pred_0', 'pred_1']
+    assert meta['num_rows'] == 10 and meta['num_batches'] == 2
+    np.testing.assert_allclose(_read(path, file_format).to_numpy(), y, rtol=1e-5)
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'arrow', 'parquet'])
+def test_empty_prediction_sink(tmp_path, file_format):
+    path = str(tmp_path / f'pred.{file_format}')
+    meta = PredictionSink(path, file_format).close()
+    assert meta['num_rows'] == 0
+    df = _read(path, file_format)
+    assert list(df.columns) == ['pred'] and len(df) == 0
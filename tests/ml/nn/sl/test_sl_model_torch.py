@@ -11,6 +11,7 @@ import os
 import tempfile
 
 import numpy as np
+import pandas as pd
 from torch import nn, optim
 from torchmetrics import AUROC, Accuracy, Precision
 
@@ -81,6 +82,8 @@ def torch_model_with_mnist(
     agg_method = kwargs.get('agg_method', None)
     compressor = kwargs.get('compressor', None)
     pipeline_size = kwargs.get('pipeline_size', 1)
+    transport_precision = kwargs.get('transport_precision', None)
+    transport_error_feedback = kwargs.get('transport_error_feedback', False)
 
     atol = kwargs.get('atol', 0.02)
 
@@ -105,6 +108,8 @@ def torch_model_with_mnist(
         agg_method=agg_method,
         compressor=compressor,
         pipeline_size=pipeline_size,
+        transport_precision=transport_precision,
+        transport_error_feedback=transport_error_feedback,
     )
     history = sl_model.fit(
         data,
@@ -137,11 +142,31 @@ def torch_model_with_mnist(
     else:
         assert global_metric['MulticlassAccuracy'] > 0.5
 
+    block_metric = sl_model.evaluate(
+        data,
+        label,
+        batch_size=128,
+        random_seed=1234,
+        dataset_builder=dataset_builder,
+        inference_block_steps=3,
+    )
+    assert np.isclose(
+        global_metric['MulticlassAccuracy'],
+        block_metric['MulticlassAccuracy'],
+        atol=atol,
+    )
+
     result = sl_model.predict(data, batch_size=128, verbose=1)
     reveal_result = []
     for rt in result:
         reveal_result.extend(reveal(rt))
     assert len(reveal_result) == alice_length
+    block_result = sl_model.predict(data, batch_size=128, inference_block_steps=3)
+    assert sum(len(reveal(rt)) for rt in block_result) == alice_length
+    pred_path = os.path.join(_temp_dir, "pred.csv")
+    pred_meta = reveal(sl_model.predict(data, batch_size=128, output_path=pred_path))
+    assert pred_meta['num_rows'] == alice_length
+    assert pd.read_csv(pred_path).shape == (alice_length, num_classes)
     base_model_path = os.path.join(_temp_dir, "base_model")
     fuse_model_path = os.path.join(_temp_dir, "fuse_model")
     sl_model.save_model(
@@ -298,6 +323,20 @@ class TestSLModelTorch:
             compressor=top_k_compressor,
         )
 
+        # reduced precision transport
+        torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            base_model_dict=base_model_dict,
+            device_y=bob,
+            model_fuse=fuse_model,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='split_nn',
+            backend="torch",
+            transport_precision='int8',
+            transport_error_feedback=True,
+        )
+
         # pipeline
         torch_model_with_mnist(
             devices=sf_simulation_setup_devices,
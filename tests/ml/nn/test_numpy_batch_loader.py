@@ -0,0 +1,48 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import torch
+
+from secretflow.ml.nn.utils import NumpyBatchLoader
+
+
+def test_numpy_batch_loader():
+    x = np.arange(20, dtype=np.float32).reshape((10, 2))
+    y = np.arange(10, dtype=np.int64)
+
+    loader = NumpyBatchLoader(x, y, batch_size=4)
+    batches = list(loader)
+    assert len(loader) == len(batches) == 3
+    assert [b[0].shape[0] for b in batches] == [4, 4, 2]
+    np.testing.assert_equal(batches[1][0].numpy(), x[4:8])
+    assert batches[0][1].dtype == torch.int64
+    # no copy without shuffling
+    assert batches[0][0].data_ptr() == torch.from_numpy(x).data_ptr()
+
+    torch.manual_seed(7)
+    first = list(NumpyBatchLoader(x, y, batch_size=3, shuffle=True, prefetch=2))
+    torch.manual_seed(7)
+    second = list(NumpyBatchLoader(x, y, batch_size=3, shuffle=True))
+    seen = np.concatenate([b[1].numpy() for b in first])
+    np.testing.assert_equal(np.sort(seen), y)
+    for b1, b2 in zip(first, second):
+        np.testing.assert_equal(b1[0].numpy(), b2[0].numpy())
+        np.testing.assert_equal(b1[0].numpy(), x[b1[1].numpy()])
+
+    # consumers leaving early do not block
+    loader = NumpyBatchLoader(x, batch_size=1, prefetch=1, dtype=np.float64)
+    it = iter(loader)
+    assert next(it)[0].dtype == torch.float64
+    del it
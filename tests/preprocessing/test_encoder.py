@@ -538,3 +538,30 @@ class TestOneHotEncoder:
         env, data = prod_env_and_onehot_encoder_data
         with pytest.raises(AssertionError, match='Encoder has not been fit yet.'):
             OneHotEncoder().transform('test')
+
+    def test_partial_fit_should_equal_fit(self, prod_env_and_onehot_encoder_data):
+        env, data = prod_env_and_onehot_encoder_data
+        # GIVEN
+        encoder = OneHotEncoder()
+
+        # WHEN
+        for rows in [slice(0, 2), slice(2, 4)]:
+            chunk = VDataFrame(
+                {
+                    env.alice: partition(
+                        data=env.alice(lambda: data['vdf_alice'][['a2']].iloc[rows])()
+                    ),
+                    env.bob: partition(
+                        data=env.bob(lambda: data['vdf_bob'][['b5']].iloc[rows])()
+                    ),
+                }
+            )
+            encoder.partial_fit(chunk)
+        value = encoder.transform(data['vdf'][['a2', 'b5']])
+
+        # THEN
+        sk_encoder = SkOneHotEncoder()
+        expect_alice = sk_encoder.fit_transform(data['vdf_alice'][['a2']]).toarray()
+        np.testing.assert_equal(reveal(value.partitions[env.alice].data), expect_alice)
+        expect_bob = sk_encoder.fit_transform(data['vdf_bob'][['b5']]).toarray()
+        np.testing.assert_equal(reveal(value.partitions[env.bob].data), expect_bob)
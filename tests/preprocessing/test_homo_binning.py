@@ -7,6 +7,9 @@ import pytest
 from secretflow.data.horizontal import read_csv as h_read_csv
 from secretflow.device import reveal
 from secretflow.preprocessing.binning.homo_binning import HomoBinning
+from secretflow.preprocessing.binning.kernels.quantile_summaries import (
+    QuantileSummaries,
+)
 from secretflow.security.aggregation.plain_aggregator import PlainAggregator
 from secretflow.security.compare.plain_comparator import PlainComparator
 
@@ -90,3 +93,44 @@ def test_homo_binning(prod_env_and_data):
     }
     expect_df = pd.DataFrame.from_dict(expect_result)
     pd.testing.assert_frame_equal(bin_result_df, expect_df, rtol=1e-2)
+
+
+def test_homo_binning_sketch(prod_env_and_data):
+    env, data = prod_env_and_data
+    bin_obj = HomoBinning(
+        bin_num=5, bin_indexes=[1, 2, 3, 4], error=1e-9, use_sketch=True
+    )
+    bin_result = reveal(bin_obj.fit_split_points(data['hdf']))
+
+    all_data = pd.concat(data['dfs'])
+    quantiles = np.linspace(0, 1, 6)[1:]
+    assert list(bin_result.keys()) == ["x0", "x1", "x2", "x3"]
+    for col, split_points in bin_result.items():
+        expected = np.quantile(all_data[col], quantiles, method='inverted_cdf')
+        np.testing.assert_almost_equal(split_points, sorted(set(expected)))
+
+
+def test_quantile_summaries_merge():
+    rng = np.random.default_rng(0)
+    error = 1e-3
+    parts = [
+        rng.normal(size=20000),
+        rng.exponential(size=5000),
+        rng.uniform(-3, 3, size=12000),
+    ]
+    summaries = []
+    for part in parts:
+        summary = QuantileSummaries(head_size=1000, error=error)
+        for chunk in np.array_split(part, 7):
+            summary.insert(chunk)
+        summaries.append(summary)
+    merged = summaries[0].merge(summaries[1]).merge(summaries[2])
+
+    all_data = np.sort(np.concatenate(parts))
+    n = len(all_data)
+    assert merged.count == n
+    assert len(merged.sampled) < n / 10
+    quantiles = np.linspace(0, 1, 21)
+    for q, v in zip(quantiles, merged.batch_query_quantile(quantiles)):
+        rank = np.searchsorted(all_data, v, side='right')
+        assert abs(rank - max(np.ceil(q * n), 1)) <= np.floor(error * n)
@@ -253,3 +253,31 @@ def test_transform_should_error_when_not_fit(prod_env_and_data):
     env, data = prod_env_and_data
     with pytest.raises(AssertionError, match='Scaler has not been fit yet.'):
         MinMaxScaler().transform('test')
+
+
+def test_partial_fit_should_equal_fit(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    scaler = MinMaxScaler()
+
+    # WHEN
+    for rows in [slice(0, 2), slice(2, 4)]:
+        chunk = VDataFrame(
+            {
+                env.alice: partition(
+                    data=env.alice(lambda: data['vdf_alice'][['a3']].iloc[rows])()
+                ),
+                env.bob: partition(
+                    data=env.bob(lambda: data['vdf_bob'][['b4', 'b6']].iloc[rows])()
+                ),
+            }
+        )
+        scaler.partial_fit(chunk)
+    value = scaler.transform(data['vdf'][['a3', 'b4', 'b6']])
+
+    # THEN
+    sk_scaler = SkMinMaxScaler()
+    expect_alice = sk_scaler.fit_transform(data['vdf_alice'][['a3']])
+    np.testing.assert_equal(reveal(value.partitions[env.alice].data), expect_alice)
+    expect_bob = sk_scaler.fit_transform(data['vdf_bob'][['b4', 'b6']])
+    np.testing.assert_equal(reveal(value.partitions[env.bob].data), expect_bob)
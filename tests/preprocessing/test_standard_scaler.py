@@ -312,3 +312,69 @@ def test_should_error_when_transform_features_num_mismatch(prod_env_and_data):
         match='X has 6 features, but StandardScaler is expecting 1 features as input.',
     ):
         scaler.transform(data['vdf'])
+
+
+def test_partial_fit_should_equal_fit(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    selected_cols = ['sepal_length', 'sepal_width', 'petal_length', 'petal_width']
+    alice_chunks = np.array_split(data['hdf_alice'][selected_cols], 3)
+    bob_chunks = np.array_split(data['hdf_bob'][selected_cols], 3)
+    scaler = StandardScaler()
+
+    # WHEN
+    for alice_chunk, bob_chunk in zip(alice_chunks, bob_chunks):
+        chunk = HDataFrame(
+            {
+                env.alice: partition(data=env.alice(lambda: alice_chunk)()),
+                env.bob: partition(data=env.bob(lambda: bob_chunk)()),
+            },
+            aggregator=PlainAggregator(env.alice),
+            comparator=PlainComparator(env.carol),
+        )
+        scaler.partial_fit(chunk)
+    value = scaler.transform(data['hdf'][selected_cols])
+
+    # THEN
+    assert scaler.get_params()
+    sk_scaler = SkStandardScaler()
+    sk_scaler.fit(
+        pd.concat([data['hdf_alice'][selected_cols], data['hdf_bob'][selected_cols]])
+    )
+    np.testing.assert_almost_equal(scaler._scaler.var_, sk_scaler.var_)
+    expect_alice = sk_scaler.transform(data['hdf_alice'][selected_cols])
+    np.testing.assert_almost_equal(
+        reveal(value.partitions[env.alice].data), expect_alice, decimal=5
+    )
+
+
+def test_partial_fit_should_continue_from_fit(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    selected_cols = ['sepal_length', 'sepal_width', 'petal_length', 'petal_width']
+    alice_chunks = np.array_split(data['hdf_alice'][selected_cols], 2)
+    bob_chunks = np.array_split(data['hdf_bob'][selected_cols], 2)
+    chunks = [
+        HDataFrame(
+            {
+                env.alice: partition(data=env.alice(lambda c=alice_chunk: c)()),
+                env.bob: partition(data=env.bob(lambda c=bob_chunk: c)()),
+            },
+            aggregator=PlainAggregator(env.alice),
+            comparator=PlainComparator(env.carol),
+        )
+        for alice_chunk, bob_chunk in zip(alice_chunks, bob_chunks)
+    ]
+    scaler = StandardScaler()
+
+    # WHEN
+    scaler.fit(chunks[0])
+    scaler.partial_fit(chunks[1])
+
+    # THEN
+    sk_scaler = SkStandardScaler()
+    sk_scaler.fit(
+        pd.concat([data['hdf_alice'][selected_cols], data['hdf_bob'][selected_cols]])
+    )
+    np.testing.assert_almost_equal(scaler._scaler.mean_, sk_scaler.mean_)
+    np.testing.assert_almost_equal(scaler._scaler.var_, sk_scaler.var_)
@@ -0,0 +1,67 @@
+import torch
+from torch import nn
+
+from secretflow.security.privacy.mechanism.torch import GaussianGradientDP
+
+
+def _model():
+    torch.manual_seed(1234)
+    return nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 3))
+
+
+def _grads(model):
+    return [p.grad.clone() for p in model.parameters()]
+
+
+def _norm(grads):
+    return torch.sqrt(sum(g.pow(2).sum() for g in grads))
+
+
+def test_gradient_dp_clip():
+    l2_norm_clip = 0.1
+    batch_size = 16
+    x = torch.randn(batch_size, 4) * 10
+    y = torch.randint(0, 3, (batch_size,))
+    loss_fn = nn.CrossEntropyLoss()
+    dp = GaussianGradientDP(
+        noise_multiplier=0.0,
+        batch_size=batch_size,
+        num_samples=1000,
+        l2_norm_clip=l2_norm_clip,
+    )
+
+    # clip per sample gradients one by one.
+    model = _model()
+    clipped_sum = None
+    raw_norms = []
+    for i in range(batch_size):
+        model.zero_grad()
+        loss_fn(model(x[i : i + 1]), y[i : i + 1]).backward()
+        grads = _grads(model)
+        norm = _norm(grads)
+        raw_norms.append(norm)
+        factor = min(1.0, l2_norm_clip / (norm.item() + 1e-6))
+        clipped = [g * factor for g in grads]
+        assert _norm(clipped) <= l2_norm_clip + 1e-6
+        if clipped_sum is None:
+            clipped_sum = clipped
+        else:
+            clipped_sum = [a + b for a, b in zip(clipped_sum, clipped)]
+    expected = [g / batch_size for g in clipped_sum]
+    # make sure clipping is exercised.
+    assert max(raw_norms) > l2_norm_clip
+
+    model = _model()
+    loss, y_pred = dp.backward(model, loss_fn, x, y)
+    for g, e in zip(_grads(model), expected):
+        torch.testing.assert_close(g, e, rtol=1e-4, atol=1e-6)
+    assert y_pred.shape == (batch_size, 3)
+    torch.testing.assert_close(
+        loss, loss_fn(model(x), y).detach(), rtol=1e-5, atol=1e-6
+    )
+
+    # gradient of each sample through the vectorized path is clipped.
+    for i in range(batch_size):
+        model = _model()
+        dp.backward(model, loss_fn, x[i : i + 1], y[i : i + 1])
+        assert _norm(_grads(model)) <= l2_norm_clip + 1e-6
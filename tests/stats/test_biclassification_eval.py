@@ -6,7 +6,7 @@ from sklearn.metrics import roc_auc_score
 from secretflow import reveal
 from secretflow.data import FedNdarray, PartitionWay, partition
 from secretflow.data.vertical import VDataFrame
-from secretflow.stats import BiClassificationEval
+from secretflow.stats import BiClassificationEval, StreamingBiClassificationEval
 
 
 def test_auc(sf_production_setup_devices):
@@ -45,3 +45,53 @@ def test_auc(sf_production_setup_devices):
     true_score = roc_auc_score(y_true, y_pred)
     score = float(reports.summary_report.auc)
     np.testing.assert_almost_equal(true_score, score, decimal=2)
+
+
+def test_streaming_reports(sf_production_setup_devices, tmp_path):
+    np.random.seed(42)
+    n = 100000
+    y_true = np.round(np.random.random((n,)))
+    y_pred = np.clip(y_true * 0.3 + np.random.random((n,)) * 0.7, 0, 1)
+    path = str(tmp_path / "pred.csv")
+    pd.DataFrame({'label': y_true, 'pred': y_pred}).to_csv(path, index=False)
+    bucket_size = 10
+
+    alice = sf_production_setup_devices.alice
+    y_true_fed = FedNdarray(
+        partitions={alice: alice(lambda x: x)(y_true.reshape((-1, 1)))},
+        partition_way=PartitionWay.VERTICAL,
+    )
+    y_pred_fed = FedNdarray(
+        partitions={alice: alice(lambda x: x)(y_pred.reshape((-1, 1)))},
+        partition_way=PartitionWay.VERTICAL,
+    )
+    expected = reveal(
+        BiClassificationEval(y_true_fed, y_pred_fed, bucket_size).get_all_reports()
+    )
+    reports = reveal(
+        StreamingBiClassificationEval(
+            alice, path, 'label', 'pred', bucket_size, chunksize=7919
+        ).get_all_reports()
+    )
+
+    summary = reports.summary_report
+    assert summary.total_samples == n
+    assert summary.positive_samples == np.sum(y_true)
+    np.testing.assert_almost_equal(
+        float(summary.auc), roc_auc_score(y_true, y_pred), decimal=3
+    )
+    np.testing.assert_almost_equal(
+        float(summary.ks), float(expected.summary_report.ks), decimal=2
+    )
+    np.testing.assert_almost_equal(
+        float(summary.f1_score), float(expected.summary_report.f1_score), decimal=2
+    )
+    assert len(reports.eq_frequent_bin_report) == len(expected.eq_frequent_bin_report)
+    assert len(reports.eq_range_bin_report) == len(expected.eq_range_bin_report)
+    for bin, expected_bin in zip(
+        reports.eq_range_bin_report, expected.eq_range_bin_report
+    ):
+        np.testing.assert_allclose(bin.total, float(expected_bin.total), rtol=0.01)
+        np.testing.assert_allclose(
+            bin.avg_score, float(expected_bin.avg_score), atol=1e-3
+        )
@@ -7,6 +7,7 @@ from secretflow.data.vertical import VDataFrame
 from secretflow.stats.groupby_v import (
     ordinal_encoded_groupby_agg,
     ordinal_encoded_groupby_aggs,
+    ordinal_encoded_groupby_value_agg_pairs,
 )
 
 
@@ -146,3 +147,42 @@ def test_groupby_aggs(prod_env_and_data, by, values, aggs):
         if agg == "var":
             decimal = 3
         np.testing.assert_array_almost_equal(our_values, true_values, decimal=decimal)
+
+
+def test_groupby_value_agg_pairs(prod_env_and_data):
+    env, data = prod_env_and_data
+    by = ['a2', 'b5']
+    # GIVEN
+    df = data['df'][['a1', 'a2', 'a3', 'b4', 'b5', 'b6']]
+    df[["a1", "a2", "b5"]] = df[["a1", "a2", "b5"]].fillna(value="0", inplace=False)
+    df[["a3", "b4", "b6"]] = (
+        df[["a3", "b4", "b6"]].fillna(value=0, inplace=False).astype(float)
+    )
+    df_cleartext = data['df_cleartext']
+    df_cleartext[["a1", "a2", "b5"]] = df_cleartext[["a1", "a2", "b5"]].fillna(
+        value="0", inplace=False
+    )
+    df_cleartext[["a3", "b4", "b6"]] = (
+        df_cleartext[["a3", "b4", "b6"]].fillna(value=0, inplace=False).astype(float)
+    )
+    value_agg_pairs = [
+        ("a3", "sum"),
+        ("b4", "max"),
+        ("a3", "count"),
+        ("b6", "var"),
+        ("b4", "mean"),
+    ]
+
+    our_result = ordinal_encoded_groupby_value_agg_pairs(
+        df, by, value_agg_pairs, env.spu
+    )
+
+    assert list(our_result.keys()) == value_agg_pairs
+    for value, agg in value_agg_pairs:
+        true_values = getattr(df_cleartext.groupby(by)[[value]], agg)().fillna(
+            value=0, inplace=False
+        )
+        decimal = 3 if agg == "var" else 6
+        np.testing.assert_array_almost_equal(
+            our_result[(value, agg)], true_values, decimal=decimal
+        )
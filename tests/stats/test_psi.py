@@ -6,7 +6,9 @@ import pytest
 from secretflow import reveal
 from secretflow.data import FedNdarray, PartitionWay, partition
 from secretflow.data.vertical import VDataFrame
-from secretflow.stats import psi_eval
+from secretflow.stats import psi_eval, psi_table_eval
+from secretflow.stats.core import psi, psi_table
+from secretflow.stats.core.psi_core import batch_bin_counts
 from secretflow.stats.core.utils import equal_range
 
 
@@ -66,3 +68,51 @@ def test_psi(prod_env_and_data):
     true_score_2 = (0.5 - 0.8) * np.log(0.5 / 0.8) + (0.5 - 0.2) * np.log(0.5 / 0.2)
     np.testing.assert_almost_equal(score_1, 0.0, decimal=2)
     np.testing.assert_almost_equal(score_2, true_score_2, decimal=2)
+
+
+def test_psi_table():
+    rng = np.random.default_rng(0)
+    x = pd.DataFrame(rng.normal(size=(1000, 3)), columns=['a', 'b', 'c'])
+    y = pd.DataFrame(rng.normal(0.3, 1.2, size=(800, 3)), columns=['a', 'b', 'c'])
+    split_points = {
+        'a': np.linspace(-3, 3, 6),
+        'b': np.array([-1.0, 0.0, 1.0]),
+        'c': np.linspace(-2, 4, 11),
+    }
+    expected = [psi(x[[c]], y[[c]], jnp.array(sp)) for c, sp in split_points.items()]
+
+    table = psi_table(x, y, split_points)
+    np.testing.assert_almost_equal(table['psi'].to_numpy(), expected, decimal=4)
+
+    # chunked input in reversed row order, with small blocks.
+    def chunks(df):
+        df = df[::-1]
+        return (df.iloc[i : i + 128] for i in range(0, len(df), 128))
+
+    chunked = psi_table(chunks(x), chunks(y), split_points, block_elements=100)
+    pd.testing.assert_frame_equal(chunked, table)
+
+    # empty chunks are skipped.
+    counts, n_samples = batch_bin_counts(x.iloc[:0], list(split_points.values()))
+    assert n_samples == 0 and not counts.any()
+    with_empty = psi_table([x.iloc[:0], x, x.iloc[:0]], [y, y.iloc[:0]], split_points)
+    pd.testing.assert_frame_equal(with_empty, table)
+
+
+def test_psi_table_eval(sf_production_setup_devices):
+    env = sf_production_setup_devices
+    rng = np.random.default_rng(0)
+    x = pd.DataFrame(rng.normal(size=(100, 2)), columns=['a', 'b'])
+    y = pd.DataFrame(rng.normal(size=(100, 2)), columns=['a', 'b'])
+
+    def to_vdf(df):
+        return VDataFrame(
+            partitions={
+                env.alice: partition(env.alice(lambda: df[['a']])()),
+                env.bob: partition(env.bob(lambda: df[['b']])()),
+            }
+        )
+
+    split_points = {'a': np.linspace(-3, 3, 5), 'b': np.linspace(-3, 3, 5)}
+    tables = reveal(psi_table_eval(to_vdf(x), to_vdf(y), split_points))
+    pd.testing.assert_frame_equal(pd.concat(tables), psi_table(x, y, split_points))
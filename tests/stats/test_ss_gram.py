@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from secretflow import reveal
+from secretflow.stats import GramCache, SSVertPearsonR, SSVertVIF
+from secretflow.utils.simulation.datasets import load_linear
+
+
+def test_gram_moments(sf_production_setup_devices):
+    env = sf_production_setup_devices
+    vdata = load_linear(parts={env.alice: (1, 11), env.bob: (11, 21)}).astype(
+        np.float32
+    )
+    data = pd.concat(
+        [reveal(p.data) for p in vdata.partitions.values()], axis=1
+    ).to_numpy()
+
+    cache = GramCache(env.spu)
+    gram = cache.get(vdata, infeed_elements_limit=1000)
+    assert cache.get(vdata) is gram
+    assert cache.get(vdata, standardize=True) is not gram
+    assert gram.rows == data.shape[0] and gram.cols == data.shape[1]
+    np.testing.assert_allclose(
+        reveal(gram.col_sums()), data.sum(axis=0), rtol=1e-2, atol=1e-1
+    )
+    np.testing.assert_allclose(
+        reveal(gram.col_square_sums()),
+        np.square(data).sum(axis=0),
+        rtol=1e-2,
+        atol=1e-1,
+    )
+
+    cached_pearsonr = SSVertPearsonR(env.spu, cache).pearsonr(vdata)
+    pearsonr = SSVertPearsonR(env.spu).pearsonr(vdata)
+    np.testing.assert_almost_equal(cached_pearsonr, pearsonr, decimal=2)
+
+    cached_vif = SSVertVIF(env.spu, cache).vif(vdata)
+    vif = SSVertVIF(env.spu).vif(vdata)
+    np.testing.assert_allclose(cached_vif, vif, rtol=1e-2)
+    # PearsonR and VIF share the standardized entry.
+    assert len(cache._entries) == 2
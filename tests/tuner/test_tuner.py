@@ -1,8 +1,11 @@
 import os
 import shutil
 import tempfile
+import time
 import uuid
 
+import pytest
+
 from secretflow import reveal, tune
 from secretflow.tune.tune_config import RunConfig
 
@@ -70,6 +73,30 @@ class TestMemTune:
             cluster_resources={'CPU': 2},
         )
 
+    def test_mem_tune_with_packed_trials(self, sf_tune_memory_setup_devices):
+        def my_func(config):
+            start = time.time()
+            loaded = tune.trial_cache('data', lambda: {'base': 5})
+            score = config['a'] + loaded['base']
+            # hold the trial, so packed trials overlap.
+            time.sleep(2)
+            tune.train.report({'score': score, 'start': start, 'end': time.time()})
+
+        tuner = tune.Tuner(
+            my_func,
+            param_space={'a': tune.grid_search([0, 1, 2, 3])},
+            tune_config=tune.TuneConfig(reuse_actors=True),
+            trials_per_device=2,
+        )
+        results = tuner.fit()
+        result_config = results.get_best_result(metric="score", mode="max").config
+        assert result_config['a'] == 3
+        spans = sorted((r.metrics['start'], r.metrics['end']) for r in results)
+        assert len(spans) == 4
+        assert any(
+            later[0] < earlier[1] for earlier, later in zip(spans, spans[1:])
+        ), f"trials are not run concurrently: {spans}"
+
     def test_mem_tume_store_results(self, sf_tune_memory_setup_devices):
         name = uuid.uuid4().hex
         _do_tunning(
@@ -100,6 +127,32 @@ class TestSimTune:
         shutil.rmtree(_temp_dir + f"/{name}")
 
 
+def test_packed_cluster_resource_in_sim_mode(monkeypatch):
+    from secretflow.tune import tuner as tuner_module
+
+    monkeypatch.setattr(tuner_module.global_state, 'parties', lambda: ['alice', 'bob'])
+    monkeypatch.setattr(tuner_module.ray, 'nodes', lambda: [{}])
+    avaliable_resources = {
+        'alice': 4,
+        'bob': 5,
+        'CPU': 16,
+        'memory': 1024,
+        'node:127.0.0.1': 1,
+    }
+    tuner = tune.Tuner.__new__(tune.Tuner)
+
+    tuner.trials_per_device = 2
+    assert tuner._packed_cluster_resource(avaliable_resources) == [
+        {'alice': 2, 'CPU': 4.0},
+        {'bob': 2, 'CPU': 4.0},
+    ]
+
+    # every trial needs at least one unit of each party resource.
+    tuner.trials_per_device = 5
+    with pytest.raises(AssertionError, match='can not be shared by 5 trials'):
+        tuner._packed_cluster_resource(avaliable_resources)
+
+
 class TestProdTune:
     # TODO: @xiaonan, when support prod mode, add a prod pytest fixture with 'sf_party_for_4pc'
     pass
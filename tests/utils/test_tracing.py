@@ -0,0 +1,74 @@
+import gc
+
+from secretflow.utils.tracing import SpanTracer, trace_span, watch_device
+
+
+def test_span_tracer():
+    # no-op without an active tracer.
+    with trace_span("noop", "run"):
+        pass
+
+    tracer = SpanTracer(max_spans=3)
+    with tracer.activate():
+        with trace_span("outer", "run"):
+            with trace_span("inner", "run"):
+                pass
+            with trace_span("task", "pyu", device="alice"):
+                pass
+            with trace_span("task", "pyu", device="alice"):
+                pass
+        tracer.add("spu/alice", "sent_bytes", 10)
+        tracer.add("spu/alice", "sent_bytes", 5)
+
+    summary = tracer.summary()
+    assert summary["phases"]["run"]["count"] == 2
+    assert summary["phases"]["pyu"]["count"] == 2
+    assert summary["devices"]["alice"]["pyu_count"] == 2
+    assert summary["devices"]["spu/alice"]["sent_bytes"] == 15
+
+    trace = tracer.chrome_trace()
+    spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert [e["name"] for e in spans] == ["outer", "inner", "task"]
+    assert trace["otherData"]["dropped_spans"] == 1
+    assert spans[0]["ts"] <= spans[1]["ts"]
+    assert spans[0]["dur"] >= spans[1]["dur"]
+
+
+class _Device:
+    def __init__(self, name, stats):
+        self.name = name
+        self.stats = stats
+
+    def trace_stats_collector(self):
+        name, stats = self.name, self.stats
+        return lambda: {name: dict(stats)}
+
+
+def test_watch_device():
+    tracer = SpanTracer()
+    with tracer.activate():
+        dead = _Device("dead", {"sent_bytes": 3})
+        alive = _Device("alive", {"sent_bytes": 4})
+        watch_device(dead)
+        watch_device(alive)
+
+    # stats are pulled when a device is garbage collected.
+    del dead
+    gc.collect()
+    assert tracer.summary()["devices"] == {"dead": {"sent_bytes": 3}}
+
+    # and for devices still alive, only once.
+    tracer.collect_device_stats()
+    tracer.collect_device_stats()
+    assert tracer.summary()["devices"] == {
+        "dead": {"sent_bytes": 3},
+        "alive": {"sent_bytes": 4},
+    }
+
+    disabled = SpanTracer(device_stats=False)
+    with disabled.activate():
+        device = _Device("device", {"sent_bytes": 1})
+        watch_device(device)
+    del device
+    disabled.collect_device_stats()
+    assert disabled.summary()["devices"] == {}